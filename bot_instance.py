@@ -1264,7 +1264,7 @@ Return exactly one JSON object with this shape:
         if memories:
             memories = remove_thinking_tags(memories)
 
-        active_users = get_active_users(source_channel_id) if not is_dm else []
+        active_users = get_active_users(source_channel_id) if not is_dm else frozenset()
         other_bot_names = get_other_bot_names(source_channel_id, self.character.name if self.character else "")
         time_passage_context = ""
         if runtime_config.get("time_passage_context_enabled", True):
@@ -1700,7 +1700,9 @@ Return exactly one JSON object with this shape:
             
             # Update history with the edited content (for context), but don't trigger a response
             user_name = get_user_display_name(after.author)
-            update_history_on_edit(after.channel.id, before.content, after.content, user_name)
+            update_history_on_edit(
+                after.channel.id, before.content, after.content, user_name, message_id=after.id
+            )
             # Note: Removed _maybe_respond_to_edit - edits no longer trigger bot responses
         
         @self.client.event
@@ -2044,7 +2046,7 @@ Return exactly one JSON object with this shape:
             memories = remove_thinking_tags(memories)
 
         # Get active users (mentioned_context already gathered above in parallel)
-        active_users = get_active_users(channel_id) if not is_dm else []
+        active_users = get_active_users(channel_id) if not is_dm else frozenset()
 
         # Get mentionable users and bots for @mention feature
         mentionable_users = []
@@ -98,7 +98,7 @@ def load_providers() -> tuple[dict, int, dict]:
     
     if os.path.exists(config_path):
         try:
-            with open(config_path, 'r') as f:
+            with open(config_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
         except json.JSONDecodeError as e:
             log.warn(f"Invalid providers.json: {e}")
@@ -213,7 +213,7 @@ def load_image_providers() -> dict:
 
     if os.path.exists(config_path):
         try:
-            with open(config_path, 'r') as f:
+            with open(config_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
         except json.JSONDecodeError as e:
             log.warn(f"Invalid providers.json image provider section: {e}")
@@ -319,7 +319,7 @@ def reload_character_providers() -> dict:
 
     if os.path.exists(config_path):
         try:
-            with open(config_path, 'r') as f:
+            with open(config_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             char_providers = data.get("character_providers", {})
             # Validate against current provider tiers
@@ -3,23 +3,39 @@ Discord Pals - Web Dashboard
 Local web interface for managing bot, memories, and characters.
 """
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, send_file, session
+from flask import Flask, render_template, request, jsonify, redirect, url_for, send_file, session, g, has_app_context
 import asyncio
 import concurrent.futures
 import threading
 import base64
-import json
 import os
-import io
 import hashlib
 import re
+import signal
+import subprocess
+import sys
 import time
 import shutil
+import tempfile
 import zipfile
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from datetime import timedelta, datetime
 import logger as log
 import env_config
+import json_codec
+import memory as memory_module
+import character as character_module
+import dashboard_provider_health
+import discord_utils as discord_utils_module
+import reminders as reminders_module
+import runtime_config
+import stats as stats_module
+from character import DEFAULT_OTHER_PROMPTS
+from memory import _is_duplicate_memory, _memory_fingerprint
+from time_utils import get_timezone_options, normalize_timezone_name
 from security import (
     safe_path, safe_filename, validate_zip_entry,
     get_or_create_secret_key, requires_auth, requires_csrf,
@@ -30,27 +46,53 @@ from constants import ALLOWED_IMPORT_FILES
 import config as app_config
 from config import AUTO_MEMORIES_FILE, MANUAL_LORE_FILE
 from dashboard_provider_validation import (
+    dashboard_bool,
     provider_config_schema,
     summarize_image_provider_configs,
     summarize_image_providers,
     summarize_provider_configs,
     validate_providers_json_payload,
 )
+from dashboard_compression import gzip_response
+from dashboard_payloads import normalize_schedule_windows, parse_int_list_values
+from dashboard_json import OrjsonProvider
+from dashboard_static import StaticAssetRegistry
 from version import VERSION
 
 app = Flask(__name__, template_folder='templates', static_folder='images', static_url_path='/static')
+app.json = OrjsonProvider(app)
+# API payloads are read by the dashboard JS, not people: keep them compact
+# and in insertion order, even when the app runs with debug enabled.
+app.json.compact = True
+app.json.sort_keys = False
 
 # Shared state (set by main.py)
 bot_instances = []
 DATA_DIR = Path("bot_data")
 CHARACTERS_DIR = Path("characters")
 PROMPTS_DIR = Path("prompts")
+PROVIDERS_FILE = Path("providers.json")
+AUTONOMOUS_FILE_NAME = "autonomous.json"
 _TOPOLOGY_CACHE_TTL = 10.0
 _topology_cache_lock = threading.Lock()
 _topology_cache = {"built_at": 0.0, "value": None}
 _VERSION_CACHE_TTL = 30 * 60.0
 _github_version_cache_lock = threading.Lock()
 _github_version_cache = {"fetched_at": 0.0, "github_version": None, "has_value": False}
+_text_file_cache: dict[str, tuple[int, int, str]] = {}
+_preview_character_cache: dict[str, tuple[int, int, object]] = {}
+_character_files_cache: dict[str, tuple[int, list[str]]] = {}
+_providers_json_cache = {"entry": (None, None)}
+_STATUS_CACHE_TTL = 1.0
+_status_body_cache = {"entry": (0.0, None, b"", "")}
+_guilds_payload_cache = {"entry": (None, b"", "")}
+_MANAGED_CHANNELS_CACHE_TTL = 5.0
+_managed_channels_cache_lock = threading.Lock()
+_managed_channels_cache = {"entry": (0.0, None, [], [])}
+_EMPTY_GUILDS_PAYLOAD = json_codec.dumps({"guilds": []})
+_guild_icon_urls: dict[int, tuple[str, str]] = {}
+_logs_payload_cache_lock = threading.Lock()
+_logs_payload_cache = {"key": None, "payload": b"[]", "etag": ""}
 _update_lock = threading.Lock()
 _UPDATE_GIT_TIMEOUT = 180
 _UPDATE_PIP_TIMEOUT = 300
@@ -65,6 +107,10 @@ _UPDATE_BACKUP_DIRS = ("bot_data", "characters", "prompts")
 _UPDATE_BACKUP_DIR_IGNORES = {"bot_data": ("logs",)}
 _UPDATE_BRANCH_CHOICES = ("main", "staging")
 UNIFIED_MEMORY_FILES = {"auto_memories", "manual_lore"}
+_CHARACTER_PREVIEW_CHARS = 500
+# Small shared pool so page views overlap per-file disk reads instead of
+# reading them one after another on the request thread.
+_dashboard_io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="dashboard-io")
 
 # Initialize secret key securely
 DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -79,44 +125,80 @@ app.config.update(
     # Restrict cookie to same-site requests
     SESSION_COOKIE_SAMESITE='Lax',
     # Set cookie expiration (24 hours)
-    PERMANENT_SESSION_LIFETIME=timedelta(hours=24)
+    PERMANENT_SESSION_LIFETIME=timedelta(hours=24),
+    # Only re-sign and resend the session cookie when the session changes;
+    # polled API calls would otherwise emit a fresh Set-Cookie every time.
+    SESSION_REFRESH_EACH_REQUEST=False,
+    # Templates ship with the app, so only stat them per render when
+    # FLASK_DEBUG puts the app in debug mode and edits should reload.
+    TEMPLATES_AUTO_RELOAD=app.debug,
 )
 
+# Small read-only assets are served from memory; large ones still stream from disk
+_static_assets = StaticAssetRegistry(app.static_folder)
+app.view_functions['static'] = _static_assets.serve
+
+# Rendered pages and JSON payloads go out gzipped when the client accepts it
+app.after_request(gzip_response)
+
+def _request_csrf_token() -> str:
+    """Return the session CSRF token, looked up once per request."""
+    token = g.get('_csrf_token')
+    if token is None:
+        token = g._csrf_token = generate_csrf_token()
+    return token
+
+
 # Make CSRF token available in all templates
-app.jinja_env.globals['csrf_token'] = generate_csrf_token
+app.jinja_env.globals['csrf_token'] = _request_csrf_token
 
 
 # Make auth status available in all templates
 @app.context_processor
 def inject_globals():
     """Inject global variables into all templates."""
+    auth_enabled = is_auth_enabled()
     return {
-        'auth_enabled': is_auth_enabled(),
-        'is_logged_in': is_auth_enabled() and session.get('logged_in', False),
+        'auth_enabled': auth_enabled,
+        'is_logged_in': auth_enabled and session.get('logged_in', False),
         'version': VERSION
     }
 
 
-def _format_activity_time(timestamp: float | None) -> str:
-    """Format a timestamp as a human-readable 'X ago' string."""
-    if not timestamp:
+# (upper bound in seconds, unit suffix, divisor); anything past the last bound is hours.
+_ELAPSED_UNITS = ((60, "s", 1), (3600, "m", 60))
+
+
+def _format_elapsed(elapsed: float | None) -> str:
+    """Format elapsed seconds as a compact 'X ago' string using the unit table."""
+    if elapsed is None:
         return "Never"
-    elapsed = time.time() - timestamp
-    if elapsed < 60:
-        return f"{int(elapsed)}s ago"
-    elif elapsed < 3600:
-        return f"{int(elapsed // 60)}m ago"
+    for limit, suffix, divisor in _ELAPSED_UNITS:
+        if elapsed < limit:
+            return f"{int(elapsed // divisor)}{suffix} ago"
     return f"{int(elapsed // 3600)}h ago"
 
 
+def _format_activity_time(timestamp: float | None, now: float | None = None) -> str:
+    """Format a timestamp as a human-readable 'X ago' string.
+
+    Callers formatting several timestamps pass one ``now`` so the clock is read once.
+    """
+    if not timestamp:
+        return "Never"
+    return _format_elapsed((now or time.time()) - timestamp)
+
+
+_AUTH_EXEMPT_ENDPOINTS = frozenset({'login', 'logout', 'healthz', 'static'})
+
+
 # Global authentication check - protects all routes except login/logout/static
 @app.before_request
 def check_login():
     """Check authentication for all routes (if enabled)."""
-    # Skip auth check for login/logout, the liveness probe, and static files
-    if request.endpoint in ('login', 'logout', 'healthz', 'static'):
-        return None
-    if request.path.startswith('/static/'):
+    # Skip auth check for login/logout, the liveness probe, and static files.
+    # Every /static/ path matches the static rule, so the endpoint check covers it.
+    if request.endpoint in _AUTH_EXEMPT_ENDPOINTS:
         return None
 
     # Validate content-type for JSON POST requests
@@ -126,10 +208,8 @@ def check_login():
             return jsonify({'status': 'error', 'message': 'Invalid content-type'}), 400
 
     # If auth is enabled and not logged in, redirect to login
-    if is_auth_enabled():
-        from security import is_logged_in
-        if not is_logged_in():
-            return redirect(url_for('login', next=request.path))
+    if is_auth_enabled() and not session.get('logged_in', False):
+        return redirect(url_for('login', next=request.path))
 
 
 def get_memory_files():
@@ -159,7 +239,7 @@ def _unsupported_legacy_memory_endpoint(file_name: str):
 
 def get_unified_memory_stats() -> dict:
     """Get totals from the in-memory unified stores."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
 
     auto_total = sum(
         1 for entries in memory_manager.auto_memories.values()
@@ -183,12 +263,17 @@ def get_unified_memory_stats() -> dict:
 
 def get_character_files():
     """Get all character markdown files."""
-    files = []
-    if CHARACTERS_DIR.exists():
-        for f in CHARACTERS_DIR.glob("*.md"):
-            if f.name != "template.md":
-                files.append(f.name.replace(".md", ""))
-    return files
+    try:
+        mtime_ns = CHARACTERS_DIR.stat().st_mtime_ns
+    except OSError:
+        return []
+    # Adding, removing or renaming a file bumps the directory mtime
+    key = str(CHARACTERS_DIR)
+    cached = _character_files_cache.get(key)
+    if cached is None or cached[0] != mtime_ns:
+        files = [f.name.replace(".md", "") for f in CHARACTERS_DIR.glob("*.md") if f.name != "template.md"]
+        cached = _character_files_cache[key] = (mtime_ns, files)
+    return list(cached[1])
 
 
 def _serialize_command_sync_status(bot) -> dict:
@@ -254,140 +339,136 @@ def _normalize_textarea_content(content: str | None) -> str:
     return str(content or "").replace("\r\n", "\n").replace("\r", "\n")
 
 
-def _write_dashboard_text_file(path: Path, content: str | None) -> None:
-    """Write dashboard-edited text exactly once, using stable LF line endings."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8", newline="\n") as f:
-        f.write(_normalize_textarea_content(content))
+def _json_response(payload, status: int = 200):
+    """Build a JSON response directly from encoded bytes, skipping jsonify."""
+    if not isinstance(payload, bytes):
+        payload = json_codec.dumps(payload)
+    return app.response_class(payload, status=status, mimetype='application/json')
 
 
-def _read_prompt_file(filename: str, default: str = "") -> str:
-    """Read a prompt file for dashboard display."""
-    path = PROMPTS_DIR / filename
-    if not path.exists():
-        return default
-    try:
-        return path.read_text(encoding="utf-8")
-    except Exception as e:
-        log.warn(f"Failed to read {filename}: {e}")
-        return default
+def _json_etag(payload: bytes) -> str:
+    """Fast content hash of an encoded JSON body for use as an ETag."""
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
 
 
-_SCHEDULE_DAY_ORDER = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+def _conditional_json_response(payload: bytes, etag: str | None = None):
+    """JSON response tagged with an ETag; a matching If-None-Match gets a 304."""
+    response = _json_response(payload)
+    response.set_etag(etag or _json_etag(payload))
+    return response.make_conditional(request)
 
 
-def _normalize_schedule_days(days) -> list[str]:
-    """Normalize dashboard schedule day values while preserving display order."""
-    if isinstance(days, str):
-        days = [part.strip() for part in days.split(",")]
-    if not isinstance(days, list):
-        days = []
+def _conditional_page(html: str):
+    """Rendered page tagged with a body-hash ETag so unchanged reloads get a 304."""
+    response = app.make_response(html)
+    response.set_etag(_json_etag(response.get_data()))
+    return response.make_conditional(request)
 
-    selected = []
-    for day in days:
-        token = str(day).strip().lower()[:3]
-        if token in _SCHEDULE_DAY_ORDER and token not in selected:
-            selected.append(token)
 
-    if not selected:
-        return list(_SCHEDULE_DAY_ORDER)
+def _encode_json_textarea(content: str | None) -> bytes:
+    """Return LF-normalized UTF-8 bytes for a JSON textarea, raising if invalid."""
+    payload = _normalize_textarea_content(content).encode("utf-8")
+    json_codec.validate(payload)  # parses the exact bytes that will be written
+    return payload
 
-    selected_set = set(selected)
-    return [day for day in _SCHEDULE_DAY_ORDER if day in selected_set]
 
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write a file through a temp file and os.replace so readers never see half a write.
 
-def _normalize_schedule_time(value) -> str | None:
-    """Return browser-time input as HH:MM, or None when invalid."""
-    parts = str(value or "").strip().split(":")
-    if len(parts) < 2:
-        return None
+    The temp name is unique per call, so concurrent saves of one file never share it.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
     try:
-        hour = int(parts[0])
-        minute = int(parts[1])
-    except (TypeError, ValueError):
-        return None
-    if not (0 <= hour <= 23 and 0 <= minute <= 59):
-        return None
-    return f"{hour:02d}:{minute:02d}"
-
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600 files; keep the permissions of the file being replaced
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
-def _normalize_schedule_windows(payload: dict) -> tuple[list[dict], list[str]]:
-    """Normalize one or more dashboard unavailable windows."""
-    raw_windows = payload.get("windows")
-    if not isinstance(raw_windows, list):
-        raw_windows = payload.get("unavailable")
-    if not isinstance(raw_windows, list):
-        raw_window = payload.get("window")
-        raw_windows = [raw_window] if isinstance(raw_window, dict) else []
 
-    windows = []
-    errors = []
-    for index, raw_window in enumerate(raw_windows, start=1):
-        if not isinstance(raw_window, dict):
-            errors.append(f"Window {index} is invalid")
-            continue
+def _write_dashboard_text_file(path: Path, content: str | None) -> None:
+    """Write dashboard-edited text exactly once, using stable LF line endings."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write_bytes(path, _normalize_textarea_content(content).encode("utf-8"))
 
-        start = _normalize_schedule_time(raw_window.get("start"))
-        end = _normalize_schedule_time(raw_window.get("end"))
-        if not start or not end:
-            errors.append(f"Window {index} needs a valid start and end time")
-            continue
 
-        windows.append({
-            "days": _normalize_schedule_days(raw_window.get("days")),
-            "start": start,
-            "end": end,
-        })
+def _read_prompt_file(filename: str, default: str = "") -> str:
+    """Read a prompt file for dashboard display."""
+    path = PROMPTS_DIR / filename
+    if not path.exists():
+        return default
+    try:
+        return path.read_text(encoding="utf-8")
+    except Exception as e:
+        log.warn(f"Failed to read {filename}: {e}")
+        return default
 
-    return windows, errors
 
+def _autonomous_file() -> Path:
+    """Return the autonomous channel config path under the current data dir."""
+    return DATA_DIR / AUTONOMOUS_FILE_NAME
 
-def _parse_int_list_values(*values):
-    """Parse one or more comma-separated / repeated inputs into unique positive ints."""
-    parsed = []
-    seen = set()
 
-    def add_candidate(candidate):
-        try:
-            number = int(str(candidate).strip())
-        except (TypeError, ValueError):
-            return
-        if number <= 0 or number in seen:
-            return
-        seen.add(number)
-        parsed.append(number)
+def _read_text_cached(path: Path, default: str | None = None) -> str | None:
+    """Read a small config file, reusing the text until its mtime or size changes."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return default
+    key = str(path)
+    cached = _text_file_cache.get(key)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    text = path.read_text(encoding="utf-8")
+    _text_file_cache[key] = (stat.st_mtime_ns, stat.st_size, text)
+    return text
 
-    for value in values:
-        if value is None:
-            continue
-        if isinstance(value, (list, tuple, set)):
-            for item in value:
-                add_candidate(item)
-            continue
-        for item in str(value).split(","):
-            add_candidate(item)
 
-    return parsed
+def _forget_cached_text(path: Path) -> None:
+    """Drop a cached file body after the dashboard rewrites that file."""
+    _text_file_cache.pop(str(path), None)
 
 
 def _load_providers_json() -> dict:
     """Load providers.json as an object, or return a safe empty shape."""
-    providers_file = Path("providers.json")
-    if not providers_file.exists():
-        return {"providers": [], "timeout": 60, "image_providers": []}
     try:
-        with open(providers_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except (OSError, json.JSONDecodeError):
-        return {"providers": [], "timeout": 60, "image_providers": []}
+        text = _read_text_cached(PROVIDERS_FILE)
+        data = json_codec.loads(text) if text is not None else None
+    except (OSError, ValueError):
+        data = None
     return data if isinstance(data, dict) else {"providers": [], "timeout": 60, "image_providers": []}
 
 
+def _providers_json_snapshot() -> dict:
+    """Parsed providers.json shared by read-only views; callers must not mutate it.
+
+    The parse is reused for as long as _read_text_cached hands back the same text.
+    """
+    try:
+        text = _read_text_cached(PROVIDERS_FILE)
+    except OSError:
+        text = None
+    cached_text, data = _providers_json_cache["entry"]
+    if text is None or text is not cached_text:
+        data = _load_providers_json()
+        _providers_json_cache["entry"] = (text, data)
+    return data
+
+
 def _save_providers_json(data: dict) -> None:
     """Persist providers.json and refresh in-memory provider clients."""
-    with open("providers.json", "w", encoding="utf-8", newline="\n") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    _atomic_write_bytes(PROVIDERS_FILE, json_codec.dumps(data, indent=2) + b"\n")
+    _forget_cached_text(PROVIDERS_FILE)
     app_config.reload_providers()
     try:
         import providers as providers_module
@@ -400,7 +481,8 @@ def _save_providers_json(data: dict) -> None:
 
 def _build_known_access_targets(topology: dict) -> dict:
     """Return known channels and human users for response access pickers."""
-    from discord_utils import conversation_history, channel_names
+    conversation_history = discord_utils_module.conversation_history
+    channel_names = discord_utils_module.channel_names
 
     channels_by_id = {int(item["id"]): dict(item) for item in topology.get("channels", [])}
     for channel_id, name in channel_names.items():
@@ -492,45 +574,68 @@ def _is_bot_ready(bot) -> bool:
     return bool(client and client.is_ready())
 
 
-def _build_visible_topology() -> dict:
-    """Build a deduplicated snapshot of the visible Discord topology."""
-    guilds = []
-    guilds_by_id = {}
-    channels = []
-    channels_by_id = {}
-    accessible_channel_ids = set()
+def _autonomous_channels_snapshot() -> dict:
+    """Return one copy of the autonomous channel map for the current request.
 
-    for bot in bot_instances:
-        if not _is_bot_ready(bot):
-            continue
+    Bot event loops mutate the live dict from other threads, so dashboard pages
+    read a single snapshot instead of iterating the shared map repeatedly.
+    """
+    autonomous_manager = discord_utils_module.autonomous_manager
 
-        for guild in bot.client.guilds:
-            if guild.id not in guilds_by_id:
-                guild_data = {
-                    "id": guild.id,
-                    "name": guild.name,
-                    "icon": str(guild.icon.url) if guild.icon else None,
-                }
-                guilds_by_id[guild.id] = guild_data
-                guilds.append(guild_data)
+    if not has_app_context():
+        return dict(autonomous_manager.enabled_channels)
+    snapshot = g.get("autonomous_channels")
+    if snapshot is None:
+        snapshot = g.autonomous_channels = dict(autonomous_manager.enabled_channels)
+    return snapshot
+
+
+def _guild_icon_url(guild) -> str | None:
+    """Return the guild icon CDN URL, rebuilding it only when the icon hash changes."""
+    icon = guild.icon
+    if icon is None:
+        return None
+    cached = _guild_icon_urls.get(guild.id)
+    if cached is None or cached[0] != icon.key:
+        cached = _guild_icon_urls[guild.id] = (icon.key, icon.url)
+    return cached[1]
 
-            for channel in guild.text_channels:
-                accessible_channel_ids.add(channel.id)
-                if channel.id in channels_by_id:
-                    continue
 
-                channel_data = {
+def _build_visible_topology() -> dict:
+    """Build a deduplicated snapshot of the visible Discord topology."""
+    visible_guilds = list(chain.from_iterable(
+        bot.client.guilds for bot in bot_instances if _is_bot_ready(bot)
+    ))
+    # Dict keys keep first-seen order; shared guilds collapse to one entry
+    unique_guilds = {guild.id: guild for guild in visible_guilds}
+    guilds = [
+        {
+            "id": guild.id,
+            "name": guild.name,
+            "icon": _guild_icon_url(guild),
+            "member_count": guild.member_count,
+        }
+        for guild in unique_guilds.values()
+    ]
+
+    # Each bot's copy of a shared guild is still walked so channel lists union
+    channels_by_id = {}
+    accessible_channel_ids = set()
+    for guild in visible_guilds:
+        for channel in guild.text_channels:
+            accessible_channel_ids.add(channel.id)
+            if channel.id not in channels_by_id:
+                channels_by_id[channel.id] = {
                     "id": channel.id,
                     "name": channel.name,
                     "guild_id": guild.id,
                     "guild_name": guild.name,
                 }
-                channels_by_id[channel.id] = channel_data
-                channels.append(channel_data)
 
     return {
         "guilds": guilds,
-        "channels": channels,
+        "guild_names": {guild.id: guild.name for guild in unique_guilds.values() if guild.name},
+        "channels": list(channels_by_id.values()),
         "channels_by_id": channels_by_id,
         "accessible_channel_ids": accessible_channel_ids,
     }
@@ -554,51 +659,63 @@ def _get_visible_topology(force_refresh: bool = False) -> dict:
         return topology
 
 
+def _bot_summary(bot) -> dict:
+    """Return the name/character/online fields shared by dashboard bot lists."""
+    return {
+        "name": bot.name,
+        "character": bot.character.name if bot.character else None,
+        "online": _is_bot_ready(bot),
+    }
+
+
 def _build_status_payload() -> dict:
     """Build the current bot-status payload used by the dashboard APIs."""
-    import runtime_config
 
     last_activity = runtime_config.get_last_activity()
-    bots_info = []
-    for bot in bot_instances:
-        bot_activity = last_activity.get(bot.name)
-        activity_str = _format_activity_time(bot_activity)
-        bots_info.append({
-            "name": bot.name,
-            "character": bot.character.name if bot.character else None,
-            "online": _is_bot_ready(bot),
-            "last_activity": activity_str,
-        })
+    now = time.time()
+    bots_info = [
+        {**_bot_summary(bot), "last_activity": _format_activity_time(last_activity.get(bot.name), now)}
+        for bot in bot_instances
+    ]
 
+    # One read of the cached config instead of a lookup per flag
+    config = runtime_config.load_config()
     return {
         "bots": bots_info,
-        "global_paused": runtime_config.get("global_paused", False),
-        "bot_interactions_paused": runtime_config.get("bot_interactions_paused", False),
-        "use_single_user": runtime_config.get("use_single_user", True),
-        "update_branch": runtime_config.get("update_branch", ""),
+        "global_paused": config.get("global_paused", False),
+        "bot_interactions_paused": config.get("bot_interactions_paused", False),
+        "use_single_user": config.get("use_single_user", True),
+        "update_branch": config.get("update_branch", ""),
     }
 
 
 def _build_status_etag(payload: dict) -> str:
-    """Compute a stable hash for the current status payload."""
-    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+    """Compute a stable hash for the current status payload.
+
+    _build_status_payload() always inserts keys in the same order, so the
+    compact encoding is already canonical without sort_keys.
+    """
+    return hashlib.sha256(json_codec.dumps(payload)).hexdigest()[:16]
 
 
 def _build_managed_channels(topology: dict | None = None) -> list:
     """Build channel-management data using cached topology metadata plus live state."""
-    from discord_utils import autonomous_manager, conversation_history
+    autonomous_manager = discord_utils_module.autonomous_manager
+    conversation_history = discord_utils_module.conversation_history
 
     topology = topology or _get_visible_topology()
+    # Bind each per-channel lookup once; the loop then does one probe per map
+    chance_for = _autonomous_channels_snapshot().get
+    cooldown_for = autonomous_manager.cooldown_minutes.get
+    bot_triggers_for = autonomous_manager.allow_bot_triggers.get
+    nickname_trigger_for = autonomous_manager.is_nickname_trigger_enabled
+    history_for = conversation_history.get
     channels = []
     for channel in topology["channels"]:
         channel_id = channel["id"]
-        auto_enabled = channel_id in autonomous_manager.enabled_channels
-        auto_chance = autonomous_manager.enabled_channels.get(channel_id, 0)
-        auto_cooldown = autonomous_manager.channel_cooldowns.get(channel_id)
-        cooldown_mins = int(auto_cooldown.total_seconds() // 60) if auto_cooldown else 2
-        allow_bot_triggers = autonomous_manager.allow_bot_triggers.get(channel_id, False)
-        history_count = len(conversation_history.get(channel_id, []))
+        auto_chance = chance_for(channel_id)
+        auto_enabled = auto_chance is not None
+        history = history_for(channel_id)
 
         channels.append({
             "id": channel_id,
@@ -607,15 +724,39 @@ def _build_managed_channels(topology: dict | None = None) -> list:
             "guild_name": channel["guild_name"],
             "autonomous": auto_enabled,
             "auto_chance": int(auto_chance * 100) if auto_enabled else 5,
-            "auto_cooldown": cooldown_mins,
-            "allow_bot_triggers": allow_bot_triggers,
-            "nickname_trigger": autonomous_manager.is_nickname_trigger_enabled(channel_id),
-            "history_count": history_count,
+            "auto_cooldown": cooldown_for(channel_id, 2),
+            "allow_bot_triggers": bot_triggers_for(channel_id, False),
+            "nickname_trigger": nickname_trigger_for(channel_id),
+            "history_count": len(history) if history else 0,
         })
 
     return channels
 
 
+def _managed_channels_snapshot() -> tuple[dict, list, list]:
+    """Return topology, API-order channels, and page-order channels from one build.
+
+    The lists are shared for a few seconds, so callers must not mutate them;
+    dashboard writes invalidate the snapshot.
+    """
+    topology = _get_visible_topology()
+    now = time.monotonic()
+    with _managed_channels_cache_lock:
+        built_at, cached_topology, channels, page_order = _managed_channels_cache["entry"]
+        if cached_topology is not topology or now - built_at >= _MANAGED_CHANNELS_CACHE_TTL:
+            channels = _build_managed_channels(topology)
+            # Topology channels are already unique by id. Sort by guild and channel
+            # name, then stably move autonomous channels first, both with C-level keys.
+            page_order = sorted(channels, key=itemgetter('guild_name', 'name'))
+            page_order.sort(key=itemgetter('autonomous'), reverse=True)
+            _managed_channels_cache["entry"] = (now, topology, channels, page_order)
+    return topology, channels, page_order
+
+
+def _invalidate_managed_channels_cache() -> None:
+    _managed_channels_cache["entry"] = (0.0, None, [], [])
+
+
 # --- Login/Logout Routes ---
 
 @app.route('/login', methods=['GET', 'POST'])
@@ -671,9 +812,8 @@ def dashboard():
     character_count = len(get_character_files())
     
     # Get autonomous channels count (only count channels bots can still access)
-    from discord_utils import autonomous_manager
     autonomous_count = sum(
-        1 for ch_id in autonomous_manager.enabled_channels
+        1 for ch_id in _autonomous_channels_snapshot()
         if ch_id in topology["accessible_channel_ids"]
     )
     
@@ -693,18 +833,9 @@ def dashboard():
 @app.route('/memories')
 def memories():
     """Memories management page."""
-    from memory import memory_manager
-    
-    # Get guilds for the dropdown
-    guilds = []
-    for guild in _get_visible_topology()["guilds"]:
-        lore = memory_manager.get_lore(guild["id"])
-        guilds.append({
-            'id': guild["id"],
-            'name': guild["name"],
-            'lore': lore
-        })
-    
+    # The dropdowns only need id and name; lore is fetched by the page's API calls
+    guilds = _get_visible_topology()["guilds"]
+
     # Get available characters for memory assignment
     characters = get_character_files()
     
@@ -723,7 +854,7 @@ def delete_memory(name):
     memory_key = request.form.get('key')
 
     if _is_unified_memory_file(name):
-        from memory import memory_manager
+        memory_manager = memory_module.memory_manager
 
         if memory_key:
             if name == 'auto_memories':
@@ -748,11 +879,19 @@ def edit_memory(name):
         return redirect(url_for('memories'))
 
     content = "{}"
+    raw_url = None
 
-    if file_path.exists():
+    if read_only:
+        # Unified stores can run to megabytes; the page fetches them after load
+        content = ""
+        raw_url = url_for('api_memory_raw', name=name)
+    else:
+        # Shown as raw text only, so the file is never parsed here
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
+        except FileNotFoundError:
+            pass
         except Exception as e:
             log.warn(f"Failed to read memory file: {e}")
 
@@ -760,11 +899,23 @@ def edit_memory(name):
         'memory_edit.html',
         name=name,
         content=content,
+        raw_url=raw_url,
         read_only=read_only,
         error=None,
     )
 
 
+@app.route('/api/memories/<name>/raw')
+def api_memory_raw(name):
+    """Stream a unified memory store's raw JSON for the read-only editor."""
+    if not _is_unified_memory_file(name):
+        return _unsupported_legacy_memory_endpoint(name)
+    file_path = safe_path(DATA_DIR, name, '.json')
+    if not file_path.is_file():
+        return _json_response(b'{}')
+    return send_file(file_path, mimetype='application/json', conditional=True, max_age=0)
+
+
 @app.route('/memories/<name>/save', methods=['POST'])
 @requires_csrf
 def save_memory(name):
@@ -785,27 +936,31 @@ def save_memory(name):
 
 # --- Characters ---
 
+def _read_character_preview(name: str) -> dict:
+    """Return the characters page card data for one character file."""
+    path = CHARACTERS_DIR / f"{name}.md"
+    try:
+        # Only the preview is shown, so read one character past it to know
+        # whether to add an ellipsis instead of loading the whole file.
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            size = os.fstat(f.fileno()).st_size  # same file the preview comes from
+            head = f.read(_CHARACTER_PREVIEW_CHARS + 1)
+        return {
+            'preview': head[:_CHARACTER_PREVIEW_CHARS] + ('...' if len(head) > _CHARACTER_PREVIEW_CHARS else ''),
+            'full_path': str(path.absolute()),
+            'size': size
+        }
+    except Exception as e:
+        return {'error': str(e)}
+
+
 @app.route('/characters')
 def characters():
     """Characters viewer page (merged with Preview and Prompts)."""
-    from character import DEFAULT_OTHER_PROMPTS
 
     char_files = get_character_files()
-    chars_data = {}
-    
-    for name in char_files:
-        path = CHARACTERS_DIR / f"{name}.md"
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                chars_data[name] = {
-                    'preview': content[:500] + ('...' if len(content) > 500 else ''),
-                    'full_path': str(path.absolute()),
-                    'size': len(content)
-                }
-        except Exception as e:
-            chars_data[name] = {'error': str(e)}
-    
+    chars_data = dict(zip(char_files, _dashboard_io_pool.map(_read_character_preview, char_files)))
+
     # Load system prompt for Prompts tab
     system_content = _read_prompt_file("system.md")
     other_prompts_content = _read_prompt_file("other_prompts.md", DEFAULT_OTHER_PROMPTS)
@@ -921,7 +1076,7 @@ def save_providers():
     """Save providers.json."""
     content = request.form.get('content', '')
     try:
-        data = json.loads(content)  # Validate JSON
+        data = json_codec.loads(content)
         if not isinstance(data, dict):
             raise ValueError("providers.json must be a JSON object")
         validation_error = validate_providers_json_payload(data)
@@ -929,7 +1084,7 @@ def save_providers():
             raise ValueError(validation_error)
         _save_providers_json(data)
         return redirect(url_for('config_page', message='Providers saved successfully'))
-    except json.JSONDecodeError as e:
+    except json_codec.JSONDecodeError as e:
         log.error(f"Failed to save providers.json: Invalid JSON - {e}")
         return redirect(url_for('config_page', error=f'Invalid JSON: {e}'))
     except ValueError as e:
@@ -946,7 +1101,7 @@ def api_save_providers():
     data = request.json or {}
     content = data.get('content', '')
     try:
-        providers_data = json.loads(content)  # Validate JSON
+        providers_data = json_codec.loads(content)
         if not isinstance(providers_data, dict):
             return jsonify({'status': 'error', 'message': 'providers.json must be a JSON object'}), 400
         validation_error = validate_providers_json_payload(providers_data)
@@ -954,7 +1109,7 @@ def api_save_providers():
             return jsonify({'status': 'error', 'message': validation_error}), 400
         _save_providers_json(providers_data)
         return jsonify({'status': 'ok'})
-    except json.JSONDecodeError as e:
+    except json_codec.JSONDecodeError as e:
         return jsonify({'status': 'error', 'message': f'Invalid JSON: {e}'}), 400
     except Exception as e:
         log.error(f"Failed to save providers.json: {e}")
@@ -1068,11 +1223,11 @@ def save_bots():
     """Save bots.json."""
     content = request.form.get('content', '')
     try:
-        json.loads(content)  # Validate JSON
-        with open(env_config.BOTS_FILE, 'w') as f:
-            f.write(content)
+        payload = _encode_json_textarea(content)
+        _atomic_write_bytes(env_config.BOTS_FILE, payload)
+        _forget_cached_text(env_config.BOTS_FILE)
         return redirect(url_for('config_page', message='Bots config saved successfully'))
-    except json.JSONDecodeError as e:
+    except json_codec.JSONDecodeError as e:
         log.error(f"Failed to save bots.json: Invalid JSON - {e}")
         return redirect(url_for('config_page', error=f'Invalid JSON: {e}'))
     except Exception as e:
@@ -1100,12 +1255,12 @@ def save_autonomous():
     """Save autonomous.json."""
     content = request.form.get('content', '')
     try:
-        json.loads(content)  # Validate JSON
+        payload = _encode_json_textarea(content)
         DATA_DIR.mkdir(exist_ok=True)
-        with open(DATA_DIR / 'autonomous.json', 'w') as f:
-            f.write(content)
+        _atomic_write_bytes(_autonomous_file(), payload)
+        _forget_cached_text(_autonomous_file())
         return redirect(url_for('config_page', message='Autonomous config saved successfully'))
-    except json.JSONDecodeError as e:
+    except json_codec.JSONDecodeError as e:
         log.error(f"Failed to save autonomous.json: Invalid JSON - {e}")
         return redirect(url_for('config_page', error=f'Invalid JSON: {e}'))
     except Exception as e:
@@ -1115,8 +1270,6 @@ def save_autonomous():
 
 # --- Prompts ---
 
-PROMPTS_DIR = Path("prompts")
-
 @app.route('/prompts')
 def prompts():
     """Redirect to characters page (prompts merged into characters)."""
@@ -1142,7 +1295,7 @@ def save_other_prompts():
     try:
         _write_dashboard_text_file(PROMPTS_DIR / 'other_prompts.md', content)
         # Reload prompts in character manager
-        from character import character_manager
+        character_manager = character_module.character_manager
         character_manager.reload_prompts()
     except Exception as e:
         log.warn(f"Failed to save other_prompts.md: {e}")
@@ -1153,7 +1306,17 @@ def save_other_prompts():
 @app.route('/api/status')
 def api_status():
     """API endpoint for bot status with extended info."""
-    return jsonify(_build_status_payload())
+    config = runtime_config.load_config()
+    now = time.monotonic()
+    built_at, cached_config, payload, etag = _status_body_cache["entry"]
+    # Polling tabs share one encoded body per second; a config change rebuilds it
+    if cached_config is not config or now - built_at >= _STATUS_CACHE_TTL:
+        payload = json_codec.dumps(_build_status_payload())
+        etag = _json_etag(payload)
+        _status_body_cache["entry"] = (now, config, payload, etag)
+    response = _conditional_json_response(payload, etag)
+    response.headers['Cache-Control'] = f'private, max-age={int(_STATUS_CACHE_TTL)}'
+    return response
 
 
 @app.route('/api/status/delta')
@@ -1174,7 +1337,6 @@ def api_status_delta():
 @requires_csrf
 def api_killswitch():
     """API endpoint for global killswitch control."""
-    import runtime_config
     
     if request.method == 'POST':
         data = request.json or {}
@@ -1206,7 +1368,6 @@ def api_killswitch():
 @requires_csrf
 def api_bot_interactions():
     """API endpoint for bot-to-bot interaction control."""
-    import runtime_config
     
     if request.method == 'POST':
         data = request.json or {}
@@ -1238,7 +1399,6 @@ def api_bot_interactions():
 @requires_csrf
 def api_message_format():
     """API endpoint for message format control (single-user vs multi-role)."""
-    import runtime_config
     
     if request.method == 'POST':
         data = request.json or {}
@@ -1271,8 +1431,6 @@ def api_message_format():
 @app.route('/config')
 def config_page():
     """Runtime configuration page (merged with Settings)."""
-    import runtime_config
-    from character import DEFAULT_OTHER_PROMPTS
     
     config = runtime_config.get_all()
     characters = get_character_files()
@@ -1282,57 +1440,49 @@ def config_page():
     other_prompts_content = _read_prompt_file("other_prompts.md", DEFAULT_OTHER_PROMPTS)
     
     # Get providers
-    providers_file = Path("providers.json")
     providers_raw = "{}"
-    providers_data = _load_providers_json()
+    providers_data = _providers_json_snapshot()
     providers = [
         p.get('name', f"Provider {i}")
         for i, p in enumerate(providers_data.get('providers', []))
         if isinstance(p, dict)
     ]
-    if providers_file.exists():
-        try:
-            providers_raw = providers_file.read_text(encoding="utf-8")
-        except Exception as e:
-            log.warn(f"Failed to read providers.json for config page: {e}")
+    try:
+        providers_raw = _read_text_cached(PROVIDERS_FILE, providers_raw)
+    except Exception as e:
+        log.warn(f"Failed to read providers.json for config page: {e}")
     
     # Load bots.json
     bots_raw = "{}"
-    if env_config.BOTS_FILE.exists():
-        try:
-            with open(env_config.BOTS_FILE, 'r') as f:
-                bots_raw = f.read()
-        except Exception:
-            pass
+    try:
+        bots_raw = _read_text_cached(env_config.BOTS_FILE, bots_raw)
+    except Exception:
+        pass
     
     # Load autonomous.json
     autonomous_raw = "{}"
-    autonomous_file = DATA_DIR / 'autonomous.json'
-    if autonomous_file.exists():
-        try:
-            with open(autonomous_file, 'r') as f:
-                autonomous_raw = f.read()
-        except Exception:
-            pass
+    try:
+        autonomous_raw = _read_text_cached(_autonomous_file(), autonomous_raw)
+    except Exception:
+        pass
     
     # Get bots and their current characters + autonomous channels
-    from discord_utils import autonomous_manager
+    # Resolve each autonomous channel's display entry once, not once per bot
+    resolved_auto_channels = [
+        (channel_id, {'id': channel_id, 'name': channel_meta['name'], 'guild': channel_meta['guild_name']})
+        for channel_id in _autonomous_channels_snapshot()
+        if (channel_meta := channel_map.get(channel_id))
+    ]
     bots_info = []
     for bot in bot_instances:
+        summary = _bot_summary(bot)
         # Get channel names for autonomous channels this bot can see
         auto_channels = []
-        if _is_bot_ready(bot):
-            for channel_id in autonomous_manager.enabled_channels:
-                channel = bot.client.get_channel(channel_id)
-                channel_meta = channel_map.get(channel_id)
-                if channel and channel_meta:
-                    auto_channels.append({
-                        'id': channel_id,
-                        'name': channel_meta['name'],
-                        'guild': channel_meta['guild_name']
-                    })
-
-        current_character = bot.character.name if bot.character else 'None'
+        if summary['online']:
+            get_channel = bot.client.get_channel
+            auto_channels = [entry for channel_id, entry in resolved_auto_channels if get_channel(channel_id)]
+
+        current_character = summary['character'] or 'None'
         current_character_key = _resolve_character_option(
             characters,
             getattr(bot, 'character_name', None),
@@ -1340,10 +1490,9 @@ def config_page():
         )
         
         bots_info.append({
-            'name': bot.name,
+            **summary,
             'character': current_character,
             'character_key': current_character_key,
-            'online': _is_bot_ready(bot),
             'auto_channels': auto_channels,
             'nicknames': getattr(bot, 'nicknames', ''),  # Per-bot custom nicknames
             'timezone': runtime_config.get_bot_timezone(bot.name) or '',
@@ -1391,7 +1540,6 @@ def reminders_page():
 @requires_csrf
 def api_config():
     """API for runtime config."""
-    import runtime_config
 
     if request.method == 'POST':
         data = request.json
@@ -1489,8 +1637,6 @@ def api_discord_token():
 @requires_csrf
 def api_bot_timezones():
     """Get or update per-bot timezone overrides."""
-    import runtime_config
-    from time_utils import normalize_timezone_name
 
     if request.method == 'GET':
         return jsonify({
@@ -1524,7 +1670,6 @@ def api_bot_timezones():
 @app.route('/api/timezones')
 def api_timezones():
     """Return timezone picker options on demand instead of embedding them in page HTML."""
-    from time_utils import get_timezone_options
 
     return jsonify({'timezones': get_timezone_options()})
 
@@ -1533,8 +1678,6 @@ def api_timezones():
 @requires_csrf
 def api_bot_schedules():
     """Update per-bot unavailable schedules."""
-    import runtime_config
-    from time_utils import normalize_timezone_name
 
     data = request.json or {}
     bot_name = data.get('bot_name')
@@ -1549,7 +1692,7 @@ def api_bot_schedules():
         return jsonify({'status': 'error', 'message': 'Invalid IANA timezone'}), 400
 
     enabled = bool(data.get('enabled'))
-    windows, window_errors = _normalize_schedule_windows(data)
+    windows, window_errors = normalize_schedule_windows(data)
     if enabled and window_errors:
         return jsonify({'status': 'error', 'message': '; '.join(window_errors)}), 400
     if enabled and not windows:
@@ -1575,13 +1718,11 @@ def api_command_sync_status():
 
 
 def _resolved_guild_name_map() -> dict[int, str]:
-    """Build a guild-id to human-readable guild-name map from the visible topology."""
-    topology = _get_visible_topology()
-    return {
-        int(guild["id"]): guild["name"]
-        for guild in topology.get("guilds", [])
-        if isinstance(guild, dict) and guild.get("id") is not None and guild.get("name")
-    }
+    """Return the guild-id to guild-name map indexed with the visible topology.
+
+    The map is shared with the cached snapshot, so callers must not mutate it.
+    """
+    return _get_visible_topology()["guild_names"]
 
 
 def _is_dm_auto_scope_value(value) -> bool:
@@ -1633,7 +1774,7 @@ def api_switch_character():
     for bot in bot_instances:
         if bot.name == bot_name:
             try:
-                from character import character_manager
+                character_manager = character_module.character_manager
                 bot.character = character_manager.load(character_name)
                 bot.character_name = character_name
                 return jsonify({'status': 'ok', 'character': bot.character.name})
@@ -1670,17 +1811,19 @@ def api_character_provider():
         if 'character_providers' not in providers_data:
             providers_data['character_providers'] = {}
 
-        # Update or remove the character's provider preference
-        if tier:
-            providers_data['character_providers'][character] = tier
-        else:
-            # Empty tier means remove preference (use default)
-            providers_data['character_providers'].pop(character, None)
+        # An unchanged preference skips the file write and provider reload
+        if providers_data['character_providers'].get(character) != (tier or None):
+            # Update or remove the character's provider preference
+            if tier:
+                providers_data['character_providers'][character] = tier
+            else:
+                # Empty tier means remove preference (use default)
+                providers_data['character_providers'].pop(character, None)
 
-        # Save back to file
-        _save_providers_json(providers_data)
+            # Save back to file
+            _save_providers_json(providers_data)
 
-        log.info(f"Character provider preference updated: {character} -> {tier or 'default'}")
+            log.info(f"Character provider preference updated: {character} -> {tier or 'default'}")
 
         return jsonify({
             'status': 'ok',
@@ -1697,7 +1840,6 @@ def api_character_provider():
 @requires_csrf
 def api_nicknames():
     """Get or update nicknames for bots. Persists to bots.json or runtime_config.json."""
-    import runtime_config
     
     if request.method == 'GET':
         # Return all bot nicknames
@@ -1719,32 +1861,36 @@ def api_nicknames():
             bots_file = env_config.BOTS_FILE
             persisted = False
             
-            if bots_file.exists():
-                try:
-                    with open(bots_file, 'r') as f:
-                        bots_config = json.load(f)
-                    
+            try:
+                bots_text = _read_text_cached(bots_file)
+                if bots_text is not None:
+                    bots_config = json_codec.loads(bots_text)
+
                     # Find and update the bot's nicknames in config
+                    changed = False
                     for bot_cfg in bots_config.get('bots', []):
                         if bot_cfg.get('name') == bot_name:
+                            changed = bot_cfg.get('nicknames', '') != nicknames
                             bot_cfg['nicknames'] = nicknames
                             persisted = True
                             break
-                    
-                    if persisted:
-                        with open(bots_file, 'w') as f:
-                            json.dump(bots_config, f, indent=2)
+
+                    # Repeated saves of the same value leave the file untouched
+                    if changed:
+                        _atomic_write_bytes(bots_file, json_codec.dumps(bots_config, indent=2))
+                        _forget_cached_text(bots_file)
                         log.info(f"Updated and persisted nicknames for {bot_name} to bots.json: {nicknames or '(none)'}")
-                except Exception as e:
-                    log.warn(f"Failed to persist nicknames to bots.json: {e}")
+            except Exception as e:
+                log.warn(f"Failed to persist nicknames to bots.json: {e}")
             
             # For single-bot mode or as fallback, also store in runtime_config
             if not persisted:
                 # Store in runtime_config for single-bot mode persistence
                 bot_nicknames = runtime_config.get('bot_nicknames', {})
-                bot_nicknames[bot_name] = nicknames
-                runtime_config.set('bot_nicknames', bot_nicknames)
-                log.info(f"Updated and persisted nicknames for {bot_name} to runtime_config: {nicknames or '(none)'}")
+                if bot_nicknames.get(bot_name) != nicknames:
+                    bot_nicknames[bot_name] = nicknames
+                    runtime_config.set('bot_nicknames', bot_nicknames)
+                    log.info(f"Updated and persisted nicknames for {bot_name} to runtime_config: {nicknames or '(none)'}")
             
             return jsonify({'status': 'ok', 'nicknames': nicknames, 'bot_name': bot_name})
     
@@ -1754,17 +1900,15 @@ def api_nicknames():
 @app.route('/context')
 def context_page():
     """Context visualization page."""
-    import runtime_config
     
     contexts = runtime_config.get_last_context()
     
-    return render_template('context.html', contexts=contexts, bots=bot_instances)
+    return _conditional_page(render_template('context.html', contexts=contexts, bots=bot_instances))
 
 
 @app.route('/api/context/<bot_name>')
 def api_context(bot_name):
     """Get last context for a specific bot."""
-    import runtime_config
 
     context = runtime_config.get_last_context(bot_name)
     if context:
@@ -1775,14 +1919,12 @@ def api_context(bot_name):
 @app.route('/api/contexts')
 def api_contexts():
     """Get all bot contexts for live updates."""
-    import runtime_config
     return jsonify(runtime_config.get_last_context())
 
 
 @app.route('/api/contexts/delta')
 def api_contexts_delta():
     """Return context payload only when the revision changes."""
-    import runtime_config
 
     try:
         client_revision = int(request.args.get('revision', 0))
@@ -1805,7 +1947,7 @@ def api_contexts_delta():
 @app.route('/stats')
 def stats_page():
     """Message statistics page."""
-    from stats import stats_manager
+    stats_manager = stats_module.stats_manager
     
     stats = stats_manager.get_summary()
     return render_template('stats.html', stats=stats)
@@ -1819,16 +1961,36 @@ def preview_page():
     return redirect(url_for('characters'))
 
 
+def _load_preview_character(name: str):
+    """Load a character for preview, reusing the parse while its file is unchanged."""
+
+    path = Path(character_module.CHARACTERS_DIR) / f"{name}.md"
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    key = str(path)
+    cached = _preview_character_cache.get(key)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    character = character_module.character_manager.load(name)
+    if character is not None:
+        _preview_character_cache[key] = (stat.st_mtime_ns, stat.st_size, character)
+    return character
+
+
 @app.route('/api/preview/<name>')
 def api_preview(name):
     """Generate preview for a character."""
-    from character import character_manager
+    character_manager = character_module.character_manager
     
     try:
-        character = character_manager.load(name)
+        character = _load_preview_character(name)
         if not character:
             return jsonify({'error': f'Character "{name}" not found'})
 
+        # The prompt itself is rebuilt per call: it embeds the current time
+        # and the prompt templates, which reload independently of the file.
         preview_user = request.args.get('user_name', 'ExampleUser').strip() or "ExampleUser"
         
         # Build system prompt (character section only)
@@ -1854,7 +2016,7 @@ def api_preview(name):
         
         token_estimate = len(full_prompt) // 4
         
-        return jsonify({
+        return _conditional_json_response(json_codec.dumps({
             'character': character.name,
             'preview_user': preview_user,
             'schema_format': character.schema_format,
@@ -1864,39 +2026,29 @@ def api_preview(name):
             'unused_sections': preview_data["unused_sections"],
             'prompt': full_prompt,
             'token_estimate': token_estimate
-        })
+        }))
     except Exception as e:
         return jsonify({'error': str(e)})
 
 
 # --- Test Provider ---
 
+_RE_WINDOWS_PATH = re.compile(r'[A-Za-z]:\\[^\s]+')
+_RE_UNIX_PATH = re.compile(r'/[^\s]+/')
+_RE_SECRET_ASSIGNMENT = re.compile(r'(api[_-]?key|token|secret|password)[=:]\s*\S+', re.IGNORECASE)
+
+
 def _sanitize_error_message(error: Exception) -> str:
     """Sanitize error message to avoid leaking sensitive info."""
     msg = log.redact(str(error))
     # Remove file paths
-    import re
-    msg = re.sub(r'[A-Za-z]:\\[^\s]+', '[path]', msg)  # Windows paths
-    msg = re.sub(r'/[^\s]+/', '[path]/', msg)  # Unix paths
+    msg = _RE_WINDOWS_PATH.sub('[path]', msg)
+    msg = _RE_UNIX_PATH.sub('[path]/', msg)
     # Remove API keys that might be in error messages
-    msg = re.sub(r'(api[_-]?key|token|secret|password)[=:]\s*\S+', r'\1=[redacted]', msg, flags=re.IGNORECASE)
+    msg = _RE_SECRET_ASSIGNMENT.sub(r'\1=[redacted]', msg)
     return msg[:200]
 
 
-def _dashboard_bool(value, default: bool = True) -> bool:
-    if value is None:
-        return default
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, str):
-        normalized = value.strip().lower()
-        if normalized in ("true", "1", "yes", "on"):
-            return True
-        if normalized in ("false", "0", "no", "off"):
-            return False
-    return default
-
-
 def _resolve_dashboard_provider_key(provider: dict) -> tuple[str, str]:
     key = ""
     source = ""
@@ -1956,7 +2108,7 @@ def api_test_image_provider(index):
     if not model:
         return jsonify({'success': False, 'error': 'Image provider missing model'}), 400
 
-    requires_key = _dashboard_bool(provider.get("requires_key"), True)
+    requires_key = dashboard_bool(provider.get("requires_key"), True)
     key, key_source = _resolve_dashboard_provider_key(provider)
     if requires_key and not key:
         return jsonify({'success': False, 'error': 'Image provider API key is not configured'}), 400
@@ -2008,20 +2160,16 @@ def api_test_image_provider(index):
 @app.route('/api/test-provider/<int:index>')
 def api_test_provider(index):
     """Test connection to a specific provider."""
-    providers_file = Path("providers.json")
-    if not providers_file.exists():
-        return jsonify({'success': False, 'error': 'providers.json not found'})
-
     try:
-        with open(providers_file, 'r') as f:
-            data = json.load(f)
-        providers = data.get('providers', [])
+        text = _read_text_cached(PROVIDERS_FILE)
+        if text is None:
+            return jsonify({'success': False, 'error': 'providers.json not found'})
+        providers = json_codec.loads(text).get('providers', [])
         if index >= len(providers):
             return jsonify({'success': False, 'error': 'Provider index out of range'})
 
         p = providers[index]
-        from dashboard_provider_health import test_endpoint_provider_config
-        if (endpoint_result := test_endpoint_provider_config(p)).get('handled'):
+        if (endpoint_result := dashboard_provider_health.test_endpoint_provider_config(p)).get('handled'):
             return jsonify({key: value for key, value in endpoint_result.items() if key != 'handled'})
 
         # Support both 'url' and 'base_url' for backwards compatibility
@@ -2038,9 +2186,7 @@ def api_test_provider(index):
 
         if not key:
             key = 'not-needed'  # For local LLMs that don't require auth
-        from openai import OpenAI  # Use sync client to avoid blocking issues
-        client = OpenAI(base_url=url, api_key=key, timeout=10)
-        client.models.list()
+        dashboard_provider_health.check_models_endpoint(url, key)
         return jsonify({'success': True})
     except Exception as e:
         return jsonify({'success': False, 'error': _sanitize_error_message(e)})
@@ -2048,26 +2194,37 @@ def api_test_provider(index):
 
 # --- Export/Import ---
 
+_EXPORT_SPOOL_MAX_BYTES = 1024 * 1024
+# Config JSON is tiny; level 1 deflates it far faster for nearly the same size
+_EXPORT_COMPRESS_LEVEL = 1
+
+
 @app.route('/settings/export')
 def export_config():
     """Export configuration as ZIP."""
-    zip_buffer = io.BytesIO()
+    # Small exports stay in memory; larger ones spill to a temp file that
+    # send_file streams and closes once the response is sent.
+    zip_buffer = tempfile.SpooledTemporaryFile(max_size=_EXPORT_SPOOL_MAX_BYTES)
     
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=_EXPORT_COMPRESS_LEVEL) as zf:
+        # zf.write streams each file's bytes into the compressor without a str copy
         for filename in ['providers.json', 'bots.json']:
             if os.path.exists(filename):
-                with open(filename, 'r') as f:
-                    zf.writestr(filename, f.read())
+                zf.write(filename, arcname=filename)
         
-        autonomous_file = DATA_DIR / 'autonomous.json'
+        autonomous_file = _autonomous_file()
         if autonomous_file.exists():
-            with open(autonomous_file, 'r') as f:
-                zf.writestr('autonomous.json', f.read())
+            zf.write(autonomous_file, arcname=AUTONOMOUS_FILE_NAME)
     
     zip_buffer.seek(0)
     return send_file(zip_buffer, mimetype='application/zip', as_attachment=True, download_name='discord-pals-config.zip')
 
 
+_IMPORT_COPY_CHUNK = 64 * 1024
+# Config files are a few KB; anything past this is refused before decompression
+_IMPORT_MAX_ENTRY_BYTES = 10 * 1024 * 1024
+
+
 @app.route('/settings/import', methods=['POST'])
 @requires_csrf
 def import_config():
@@ -2080,20 +2237,27 @@ def import_config():
         return redirect(url_for('settings'))
 
     try:
-        with zipfile.ZipFile(io.BytesIO(file.read()), 'r') as zf:
-            for entry_name in zf.namelist():
+        # The upload stream is seekable, so ZipFile can read it without a copy
+        with zipfile.ZipFile(file.stream, 'r') as zf:
+            for info in zf.infolist():
+                entry_name = info.filename
                 # Validate entry name against whitelist (prevents path traversal)
                 safe_name = validate_zip_entry(entry_name, ALLOWED_IMPORT_FILES)
                 if not safe_name:
                     continue  # Skip invalid/disallowed entries
+                # zipfile never reads past the declared size, so this bounds the copy
+                if info.file_size > _IMPORT_MAX_ENTRY_BYTES:
+                    log.warn(f"Skipped oversized config import entry {safe_name} ({info.file_size} bytes)")
+                    continue
 
-                if safe_name in ['providers.json', 'bots.json']:
-                    with open(safe_name, 'wb') as f:
-                        f.write(zf.read(entry_name))
-                elif safe_name == 'autonomous.json':
+                if safe_name == AUTONOMOUS_FILE_NAME:
                     DATA_DIR.mkdir(exist_ok=True)
-                    with open(DATA_DIR / 'autonomous.json', 'wb') as f:
-                        f.write(zf.read(entry_name))
+                    target = _autonomous_file()
+                else:
+                    target = safe_name
+                with zf.open(info) as src, open(target, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, _IMPORT_COPY_CHUNK)
+                _forget_cached_text(Path(target))
     except Exception as e:
         log.warn(f"Failed to import config: {e}")
     
@@ -2105,42 +2269,44 @@ def import_config():
 @app.route('/logs')
 def logs_page():
     """Live logs page (merged with Stats and Context)."""
-    from stats import stats_manager
-    import runtime_config
+    stats_manager = stats_module.stats_manager
     
     stats = stats_manager.get_summary()
     contexts = runtime_config.get_last_context()
     
-    return render_template('logs.html', stats=stats, contexts=contexts)
+    return _conditional_page(render_template('logs.html', stats=stats, contexts=contexts))
 
 
 @app.route('/api/logs')
 def api_logs():
-    """Get recent logs."""
-    import logger
-    logs = logger.get_logs(
-        1000,
-        level=request.args.get('level') or None,
-        bot=request.args.get('bot') or None,
-        req_id=request.args.get('req_id') or None,
-        component=request.args.get('component') or None,
-        event=request.args.get('event') or None,
-        search=request.args.get('search') or None,
-    )
-    return jsonify(logs)
+    """Get recent logs, reusing the serialized body until the buffer changes."""
+    filters = {
+        name: request.args.get(name) or None
+        for name in ('level', 'bot', 'req_id', 'component', 'event', 'search')
+    }
+    cache_key = (log.get_log_version(), tuple(filters.values()))
+    with _logs_payload_cache_lock:
+        if _logs_payload_cache["key"] != cache_key:
+            _logs_payload_cache["payload"] = json_codec.dumps(log.get_logs(1000, **filters))
+            _logs_payload_cache["etag"] = _json_etag(_logs_payload_cache["payload"])
+            _logs_payload_cache["key"] = cache_key
+        payload = _logs_payload_cache["payload"]
+        etag = _logs_payload_cache["etag"]
+    # An idle buffer keeps the same body and tag, so polls get a bodiless 304
+    return _conditional_json_response(payload, etag)
 
 
 @app.route('/api/logs/delta')
 def api_logs_delta():
     """Get recent logs after a cursor, with reset detection for clear/rollover."""
-    import logger
 
     try:
-        after = int(request.args.get('after', 0))
+        after = int(request.args.get('after', request.args.get('since', 0)))
     except (TypeError, ValueError):
         after = 0
 
-    return jsonify(logger.get_logs_after(
+    # An idle cursor yields the same small body, so repeat polls get a 304
+    return _conditional_json_response(json_codec.dumps(log.get_logs_after(
         after,
         limit=1000,
         level=request.args.get('level') or None,
@@ -2149,15 +2315,14 @@ def api_logs_delta():
         component=request.args.get('component') or None,
         event=request.args.get('event') or None,
         search=request.args.get('search') or None,
-    ))
+    )))
 
 
 @app.route('/api/logs/clear', methods=['POST'])
 @requires_csrf
 def api_clear_logs():
     """Clear the log buffer."""
-    import logger
-    logger.clear_logs()
+    log.clear_logs()
     log.info("Logs cleared via dashboard")
     return jsonify({'status': 'ok'})
 
@@ -2167,30 +2332,28 @@ def api_clear_logs():
 @app.route('/channels')
 def channels_page():
     """Channel management page."""
-    topology = _get_visible_topology()
-    channels_data = {channel["id"]: channel for channel in _build_managed_channels(topology)}
-    # Sort channels by autonomous (enabled first), then guild name, then channel name
-    sorted_channels = sorted(channels_data.values(), key=lambda c: (not c['autonomous'], c['guild_name'], c['name']))
+    topology, _, sorted_channels = _managed_channels_snapshot()
     
-    return render_template('channels.html',
+    return _conditional_page(render_template('channels.html',
         channels=sorted_channels,
         guilds=list(topology["guilds"])
-    )
+    ))
 
 
 @app.route('/api/channels')
 def api_channels():
     """API endpoint to list all accessible channels."""
-    return jsonify({'channels': _build_managed_channels()})
+    return jsonify({'channels': _managed_channels_snapshot()[1]})
 
 
 @app.route('/api/channels/<int:channel_id>/clear', methods=['POST'])
 @requires_csrf
 def api_clear_channel(channel_id):
     """Clear conversation history for a channel."""
-    from discord_utils import clear_history
+    clear_history = discord_utils_module.clear_history
     
     clear_history(channel_id)
+    _invalidate_managed_channels_cache()
     log.info(f"Channel history cleared via dashboard: {channel_id}")
     
     return jsonify({'status': 'ok', 'channel_id': channel_id})
@@ -2200,7 +2363,7 @@ def api_clear_channel(channel_id):
 @requires_csrf
 def api_channel_autonomous(channel_id):
     """Get or set autonomous mode for a channel."""
-    from discord_utils import autonomous_manager
+    autonomous_manager = discord_utils_module.autonomous_manager
     
     if request.method == 'POST':
         data = request.json or {}
@@ -2209,11 +2372,12 @@ def api_channel_autonomous(channel_id):
         cooldown = data.get('cooldown', 2)  # minutes
         allow_bot_triggers = data.get('allow_bot_triggers', False)
         
-        # Convert percentage to decimal
-        chance_decimal = min(100, max(1, chance)) / 100.0
-        cooldown_mins = min(10, max(1, cooldown))
+        # Clamp to 1-100% and 1-10 minutes, then convert percentage to decimal
+        chance_decimal = (1 if chance < 1 else 100 if chance > 100 else chance) / 100.0
+        cooldown_mins = 1 if cooldown < 1 else 10 if cooldown > 10 else cooldown
         
         autonomous_manager.set_channel(channel_id, enabled, chance_decimal, cooldown_mins, allow_bot_triggers)
+        _invalidate_managed_channels_cache()
         
         if enabled:
             bot_trigger_str = " (bots can trigger)" if allow_bot_triggers else " (humans only)"
@@ -2221,7 +2385,7 @@ def api_channel_autonomous(channel_id):
         else:
             log.info(f"Autonomous mode DISABLED for channel {channel_id} via dashboard")
         
-        return jsonify({
+        return _json_response({
             'status': 'ok',
             'channel_id': channel_id,
             'enabled': enabled,
@@ -2231,16 +2395,15 @@ def api_channel_autonomous(channel_id):
         })
     
     # GET request
-    auto_enabled = channel_id in autonomous_manager.enabled_channels
-    auto_chance = autonomous_manager.enabled_channels.get(channel_id, 0)
-    auto_cooldown = autonomous_manager.channel_cooldowns.get(channel_id)
-    cooldown_mins = int(auto_cooldown.total_seconds() // 60) if auto_cooldown else 2
-    allow_bot_triggers = autonomous_manager.allow_bot_triggers.get(channel_id, False)
+    settings = autonomous_manager.get_channel_settings(channel_id)
+    if settings is None:
+        return _json_response({'channel_id': channel_id, 'enabled': False, 'chance': 5, 'cooldown': 2, 'allow_bot_triggers': False})
+    auto_chance, cooldown_mins, allow_bot_triggers = settings
     
-    return jsonify({
+    return _json_response({
         'channel_id': channel_id,
-        'enabled': auto_enabled,
-        'chance': int(auto_chance * 100) if auto_enabled else 5,
+        'enabled': True,
+        'chance': int(auto_chance * 100),
         'cooldown': cooldown_mins,
         'allow_bot_triggers': allow_bot_triggers
     })
@@ -2250,12 +2413,13 @@ def api_channel_autonomous(channel_id):
 @requires_csrf
 def api_channel_nickname_trigger(channel_id):
     """Get or set nickname trigger mode for a channel."""
-    from discord_utils import autonomous_manager
+    autonomous_manager = discord_utils_module.autonomous_manager
 
     if request.method == 'POST':
         data = request.json or {}
         enabled = data.get('enabled', False)
         autonomous_manager.set_nickname_trigger(channel_id, enabled)
+        _invalidate_managed_channels_cache()
         log.info(f"Nickname triggers {'ENABLED' if enabled else 'DISABLED'} for channel {channel_id} via dashboard")
         return jsonify({'status': 'ok', 'channel_id': channel_id, 'enabled': enabled})
 
@@ -2269,33 +2433,37 @@ def api_channel_nickname_trigger(channel_id):
 @app.route('/api/guilds')
 def api_guilds():
     """Get list of all guilds the bots are in."""
-    guilds = []
-    seen_ids = set()
-    
-    for bot in bot_instances:
-        if not hasattr(bot, 'client') or not bot.client.is_ready():
-            continue
-        
-        for guild in bot.client.guilds:
-            if guild.id not in seen_ids:
-                seen_ids.add(guild.id)
-                guilds.append({
-                    'id': guild.id,
-                    'name': guild.name,
-                    'icon': str(guild.icon.url) if guild.icon else None,
-                    'member_count': guild.member_count
-                })
-    
-    return jsonify({'guilds': guilds})
+    if not bot_instances:
+        return _json_response(_EMPTY_GUILDS_PAYLOAD)
+    # The body only changes when the cached topology snapshot is rebuilt
+    topology = _get_visible_topology()
+    cached_topology, payload, etag = _guilds_payload_cache["entry"]
+    if cached_topology is not topology:
+        payload = json_codec.dumps({'guilds': topology["guilds"]})
+        etag = _json_etag(payload)
+        _guilds_payload_cache["entry"] = (topology, payload, etag)
+    return _conditional_json_response(payload, etag)
+
+
+_SMALL_JSON_BODY_LIMIT = 64 * 1024
+
+
+def _reject_oversized_body(limit: int = _SMALL_JSON_BODY_LIMIT):
+    """Return a 413 response when the declared request body exceeds limit."""
+    if (request.content_length or 0) > limit:
+        return _json_response({'status': 'error', 'message': 'Request body too large'}, 413)
+    return None
 
 
 @app.route('/api/memories/add', methods=['POST'])
 @requires_csrf
 def api_add_memory():
     """Add a new memory."""
-    from memory import memory_manager
-    
-    data = request.json or {}
+    memory_manager = memory_module.memory_manager
+    if oversized := _reject_oversized_body():
+        return oversized
+
+    data = request.get_json(silent=True) or {}
     memory_type = data.get('type', 'server')  # server, lore, user, global
     guild_id = data.get('guild_id')
     user_id = data.get('user_id')
@@ -2303,7 +2471,7 @@ def api_add_memory():
     character_name = data.get('character_name')
     
     if not content:
-        return jsonify({'status': 'error', 'message': 'Content is required'}), 400
+        return _json_response({'status': 'error', 'message': 'Content is required'}, 400)
     
     try:
         if memory_type == 'server' and guild_id:
@@ -2314,12 +2482,12 @@ def api_add_memory():
                 character_name=character_name
             )
             if not added:
-                return jsonify({'status': 'error', 'message': 'Duplicate auto memory'}), 409
+                return _json_response({'status': 'error', 'message': 'Duplicate auto memory'}, 409)
             log.info(f"Server auto memory added via dashboard for guild {guild_id}")
         elif memory_type == 'lore' and guild_id:
             added = memory_manager.add_lore('server', int(guild_id), content, added_by='dashboard')
             if not added:
-                return jsonify({'status': 'error', 'message': 'Duplicate lore entry'}), 409
+                return _json_response({'status': 'error', 'message': 'Duplicate lore entry'}, 409)
             log.info(f"Lore added via dashboard for guild {guild_id}")
         elif memory_type == 'user' and guild_id and user_id:
             added = memory_manager.add_auto_memory(
@@ -2329,50 +2497,52 @@ def api_add_memory():
                 character_name=character_name
             )
             if not added:
-                return jsonify({'status': 'error', 'message': 'Duplicate auto memory'}), 409
+                return _json_response({'status': 'error', 'message': 'Duplicate auto memory'}, 409)
             log.info(f"User memory added via dashboard for user {user_id} in guild {guild_id}")
         elif memory_type == 'global' and user_id:
             added = memory_manager.add_lore('user', int(user_id), content, added_by='dashboard')
             if not added:
-                return jsonify({'status': 'error', 'message': 'Duplicate lore entry'}), 409
+                return _json_response({'status': 'error', 'message': 'Duplicate lore entry'}, 409)
             log.info(f"User lore added via dashboard for user {user_id}")
         else:
-            return jsonify({'status': 'error', 'message': 'Invalid memory type or missing IDs'}), 400
+            return _json_response({'status': 'error', 'message': 'Invalid memory type or missing IDs'}, 400)
         
-        return jsonify({'status': 'ok', 'type': memory_type})
+        return _json_response({'status': 'ok', 'type': memory_type})
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        return _json_response({'status': 'error', 'message': str(e)}, 500)
 
 
 @app.route('/api/lore/<int:guild_id>', methods=['GET', 'POST', 'DELETE'])
 @requires_csrf
 def api_lore(guild_id):
     """Get, set, or delete lore for a guild."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
 
     if request.method == 'GET':
         lore = memory_manager.get_lore(guild_id)
-        return jsonify({'guild_id': guild_id, 'lore': lore})
+        return _conditional_json_response(json_codec.dumps({'guild_id': guild_id, 'lore': lore}))
 
     elif request.method == 'POST':
-        data = request.json or {}
+        if oversized := _reject_oversized_body():
+            return oversized
+        data = request.get_json(silent=True) or {}
         content = data.get('content', '').strip()
         replace = data.get('replace', False)
 
         if replace:
-            # Clear existing lore first
-            memory_manager.clear_lore(guild_id)
-
+            # One store update instead of a clear followed by an add
+            memory_manager.replace_lore('server', guild_id, content, added_by='dashboard')
+        elif content:
+            memory_manager.add_lore('server', guild_id, content, added_by='dashboard')
         if content:
-            memory_manager.add_lore(guild_id, content)
             log.info(f"Lore {'replaced' if replace else 'added'} via dashboard for guild {guild_id}")
 
-        return jsonify({'status': 'ok', 'guild_id': guild_id})
+        return _json_response({'status': 'ok', 'guild_id': guild_id})
 
     elif request.method == 'DELETE':
-        memory_manager.clear_lore(guild_id)
+        memory_manager.replace_lore('server', guild_id, '')
         log.info(f"Lore cleared via dashboard for guild {guild_id}")
-        return jsonify({'status': 'ok', 'guild_id': guild_id})
+        return _json_response({'status': 'ok', 'guild_id': guild_id})
 
 
 @app.route('/api/memories/<file_name>/delete-selected', methods=['POST'])
@@ -2386,17 +2556,17 @@ def api_delete_selected_memories(file_name):
         return jsonify({'status': 'error', 'message': 'No keys provided'}), 400
 
     if _is_unified_memory_file(file_name):
-        from memory import memory_manager
+        memory_manager = memory_module.memory_manager
 
         deleted_count = 0
-        for key in keys:
-            if not isinstance(key, str):
-                continue
-            if file_name == 'auto_memories':
-                deleted_count += memory_manager.clear_auto_memories(key)
-            else:
-                deleted_count += memory_manager.clear_lore(key)
-        memory_manager.flush()
+        with memory_manager.batched_saves():
+            for key in keys:
+                if not isinstance(key, str):
+                    continue
+                if file_name == 'auto_memories':
+                    deleted_count += memory_manager.clear_auto_memories(key)
+                else:
+                    deleted_count += memory_manager.clear_lore(key)
         log.info(f"Deleted {deleted_count} entries from unified store {file_name} via legacy endpoint")
         return jsonify({'status': 'ok', 'deleted': deleted_count})
 
@@ -2407,21 +2577,21 @@ def api_delete_selected_memories(file_name):
 @requires_csrf
 def api_clear_all_memories(file_name):
     """Clear all memories from a specific file."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
 
     if file_name == 'auto_memories':
         removed = sum(len(entries) for entries in memory_manager.auto_memories.values() if isinstance(entries, list))
-        for key in list(memory_manager.auto_memories.keys()):
-            memory_manager.clear_auto_memories(key)
-        memory_manager.flush()
+        with memory_manager.batched_saves():
+            for key in list(memory_manager.auto_memories.keys()):
+                memory_manager.clear_auto_memories(key)
         log.warn("Cleared all auto memory profiles via dashboard")
         return jsonify({'status': 'ok', 'deleted': removed, 'message': 'All auto memory profiles cleared'})
 
     if file_name == 'manual_lore':
         removed = sum(len(entries) for entries in memory_manager.manual_lore.values() if isinstance(entries, list))
-        for key in list(memory_manager.manual_lore.keys()):
-            memory_manager.clear_lore(key)
-        memory_manager.flush()
+        with memory_manager.batched_saves():
+            for key in list(memory_manager.manual_lore.keys()):
+                memory_manager.clear_lore(key)
         log.warn("Cleared all manual lore via dashboard")
         return jsonify({'status': 'ok', 'deleted': removed, 'message': 'All manual lore cleared'})
 
@@ -2430,11 +2600,16 @@ def api_clear_all_memories(file_name):
 
 # --- Memory Deduplication API ---
 
+# Kept entries each memory is fuzzily compared with during deduplication;
+# bounds the scan to O(n * window) instead of O(n^2).
+_DEDUPE_FUZZY_WINDOW = 50
+
+
 @app.route('/api/memories/deduplicate', methods=['POST'])
 @requires_csrf
 def api_deduplicate_memories():
     """Remove duplicate memories across all memory stores."""
-    from memory import memory_manager, _is_duplicate_memory
+    memory_manager = memory_module.memory_manager
 
     removed_count = 0
     auto_profiles_needing_merge = len(memory_manager.get_auto_memory_profile_keys_needing_merge())
@@ -2445,25 +2620,31 @@ def api_deduplicate_memories():
             return memories, 0
 
         seen = []
+        # Exact repeats (after normalization) are rejected by hash against every
+        # kept entry; the fuzzy similarity scan only looks at the most recent
+        # kept entries, since near-duplicates are usually written close together.
+        seen_fingerprints = set()
         removed = 0
         for mem in memories:
             content = mem.get('content', '')
-            if not _is_duplicate_memory(content, seen):
-                seen.append(mem)
-            else:
+            fingerprint = _memory_fingerprint(content)
+            if fingerprint in seen_fingerprints or _is_duplicate_memory(content, seen[-_DEDUPE_FUZZY_WINDOW:]):
                 removed += 1
+                continue
+            seen.append(mem)
+            if fingerprint:
+                seen_fingerprints.add(fingerprint)
         return seen, removed
 
     try:
-        for key in list(memory_manager.manual_lore.keys()):
-            deduped, count = dedupe_list(memory_manager.manual_lore[key])
-            if count > 0:
-                memory_manager.manual_lore[key] = deduped
-                memory_manager._mark_dirty('lore')
-                removed_count += count
-
-        # Force save
-        memory_manager.flush()
+        # One save of the lore store after every key is deduplicated
+        with memory_manager.batched_saves():
+            for key in list(memory_manager.manual_lore.keys()):
+                deduped, count = dedupe_list(memory_manager.manual_lore[key])
+                if count > 0:
+                    memory_manager.manual_lore[key] = deduped
+                    memory_manager._mark_dirty('lore')
+                    removed_count += count
 
         log.info(
             f"Manual lore deduplication complete: removed {removed_count} duplicates; "
@@ -2489,7 +2670,7 @@ def api_get_memory_entries(file_name):
     if not _is_unified_memory_file(file_name):
         return _unsupported_legacy_memory_endpoint(file_name)
 
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
 
     # Get optional filters
     search = request.args.get('search', '').lower()
@@ -2553,8 +2734,7 @@ def api_memory_entry_item(file_name, key, index):
     if not _is_unified_memory_file(file_name):
         return _unsupported_legacy_memory_endpoint(file_name)
 
-    from datetime import datetime
-    from memory import memory_manager, _memory_fingerprint
+    memory_manager = memory_module.memory_manager
 
     if request.args.get('parent_key'):
         return jsonify({'status': 'error', 'message': 'Nested legacy memory paths are retired'}), 410
@@ -2626,12 +2806,12 @@ def api_memory_stats():
 @app.route('/api/v2/memories/auto')
 def api_v2_auto_memories():
     """List auto memories with optional filters."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
     search = request.args.get('search', '').lower()
     server_filter = request.args.get('server_id', '').strip()
     scope_filter = request.args.get('scope', '').strip().lower()
     raw_user_filters = request.args.getlist('user_ids') + request.args.getlist('user_id')
-    user_ids = _parse_int_list_values(
+    user_ids = parse_int_list_values(
         request.args.getlist('user_ids'),
         request.args.get('user_ids'),
         request.args.getlist('user_id'),
@@ -2768,7 +2948,7 @@ def api_v2_auto_memories():
 @app.route('/api/v2/memories/targets')
 def api_v2_memory_targets():
     """Return active target users for auto memories and user lore."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
 
     return jsonify({
         'auto_users': memory_manager.get_active_auto_user_targets(),
@@ -2780,7 +2960,7 @@ def api_v2_memory_targets():
 @requires_csrf
 def api_v2_auto_memory_item():
     """CRUD operations on a single auto-memory entry."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
 
     if request.method == 'GET':
         key = request.args.get('key')
@@ -2822,7 +3002,7 @@ def api_v2_auto_memory_item():
 @requires_csrf
 def api_v2_auto_delete_batch():
     """Delete multiple auto memories by key+index pairs."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
     data = request.json or {}
     items = data.get('items', [])  # [{"key": "...", "index": N}, ...]
 
@@ -2845,10 +3025,10 @@ def api_v2_auto_delete_batch():
 @requires_csrf
 def api_v2_auto_bulk_delete():
     """Delete all auto memories matching targeted users and a scope."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
 
     data = request.json or {}
-    user_ids = _parse_int_list_values(data.get('user_ids'), data.get('user_id'))
+    user_ids = parse_int_list_values(data.get('user_ids'), data.get('user_id'))
     if not user_ids:
         return jsonify({'status': 'error', 'message': 'At least one user ID is required'}), 400
 
@@ -2872,7 +3052,7 @@ def api_v2_auto_bulk_delete():
 
 def _run_auto_memory_consolidation(data: dict, *, action_label: str = 'Manual consolidation'):
     """Run auto-memory consolidation for an already-validated dashboard payload."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
     from provider_gateway import provider_gateway as provider_manager
 
     data = data or {}
@@ -2886,7 +3066,7 @@ def _run_auto_memory_consolidation(data: dict, *, action_label: str = 'Manual co
         if isinstance(key, str) and key in memory_manager.auto_memories
     ]
 
-    user_ids = _parse_int_list_values(data.get('user_ids'), data.get('user_id'))
+    user_ids = parse_int_list_values(data.get('user_ids'), data.get('user_id'))
     if not keys and not user_ids:
         return jsonify({'status': 'error', 'message': 'At least one user ID or memory key is required'}), 400
 
@@ -2945,10 +3125,10 @@ def api_v2_auto_consolidate():
 @requires_csrf
 def api_v2_auto_cleanup_waiting():
     """Clean up auto-memory profiles that are waiting for consolidation."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
 
     data = request.json or {}
-    user_ids = _parse_int_list_values(data.get('user_ids'), data.get('user_id'))
+    user_ids = parse_int_list_values(data.get('user_ids'), data.get('user_id'))
     scope_mode = _normalize_scope_mode(data.get('scope_mode'))
     server_id = data.get('server_id')
 
@@ -3002,7 +3182,7 @@ def api_v2_auto_cleanup_waiting():
 @requires_csrf
 def api_v2_auto_clear():
     """Clear all auto memories for a key."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
     data = request.json or {}
     key = data.get('key')
     removed = 0
@@ -3014,10 +3194,10 @@ def api_v2_auto_clear():
 @app.route('/api/v2/memories/lore')
 def api_v2_lore():
     """List all lore entries."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
     type_filter = request.args.get('type', '')  # 'user', 'bot', 'server'
     raw_target_ids = request.args.getlist('target_ids')
-    target_ids = set(_parse_int_list_values(
+    target_ids = set(parse_int_list_values(
         request.args.getlist('target_ids'),
         request.args.get('target_ids')
     ))
@@ -3071,7 +3251,7 @@ def api_v2_lore():
 @requires_csrf
 def api_v2_lore_add():
     """Add a lore entry."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
     data = request.json or {}
     target_type = data.get('type')  # 'user', 'bot', 'server'
     target_id = data.get('target_id')
@@ -3091,7 +3271,7 @@ def api_v2_lore_add():
 @requires_csrf
 def api_v2_lore_edit():
     """Edit a lore entry."""
-    from memory import memory_manager, _memory_fingerprint
+    memory_manager = memory_module.memory_manager
     data = request.json or {}
     key = data.get('key')
     index = data.get('index')
@@ -3116,7 +3296,7 @@ def api_v2_lore_edit():
 @requires_csrf
 def api_v2_lore_delete_batch():
     """Delete multiple lore entries."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
     data = request.json or {}
     items = data.get('items', [])
 
@@ -3138,10 +3318,10 @@ def api_v2_lore_delete_batch():
 @requires_csrf
 def api_v2_lore_bulk_delete():
     """Delete user lore for one or more target users without touching other lore."""
-    from memory import memory_manager
+    memory_manager = memory_module.memory_manager
 
     data = request.json or {}
-    user_ids = _parse_int_list_values(data.get('user_ids'), data.get('target_ids'))
+    user_ids = parse_int_list_values(data.get('user_ids'), data.get('target_ids'))
     if not user_ids:
         return jsonify({'status': 'error', 'message': 'At least one user ID is required'}), 400
 
@@ -3154,7 +3334,7 @@ def api_v2_lore_bulk_delete():
 @app.route('/api/reminders')
 def api_reminders():
     """List reminders for the dashboard."""
-    from reminders import reminder_manager
+    reminder_manager = reminders_module.reminder_manager
 
     bot_name = request.args.get('bot_name', '').strip() or None
     status = request.args.get('status', '').strip() or None
@@ -3176,7 +3356,7 @@ def api_reminders():
 @requires_csrf
 def api_reminders_cancel():
     """Cancel one or more pending reminders."""
-    from reminders import reminder_manager
+    reminder_manager = reminders_module.reminder_manager
 
     data = request.json or {}
     reminder_ids = data.get('ids') or data.get('reminder_ids') or []
@@ -3189,15 +3369,20 @@ def api_reminders_cancel():
 
 # --- Version API ---
 
+_RE_VERSION_ASSIGNMENT = re.compile(r'__version__\s*=\s*["\']([^"\']+)["\']')
+_RE_GITHUB_REMOTE = re.compile(r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$')
+_VERSION_FILE = Path(os.path.dirname(os.path.abspath(__file__))) / 'version.py'
+# The origin remote does not change while the dashboard runs, so one
+# successful `git remote get-url` lookup is reused for the process lifetime.
+_github_repo_info_cache = {"value": None}
+
+
 def _get_file_version():
     """Read version from version.py file (may differ from running version after update)."""
     try:
-        version_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'version.py')
-        with open(version_file, 'r') as f:
-            content = f.read()
-        # Extract version string
-        import re
-        match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
+        # Re-read only when version.py changes on disk, e.g. after an update
+        content = _read_text_cached(_VERSION_FILE)
+        match = _RE_VERSION_ASSIGNMENT.search(content) if content else None
         if match:
             return match.group(1)
     except Exception:
@@ -3207,7 +3392,8 @@ def _get_file_version():
 
 def _get_github_repo_info():
     """Extract GitHub owner/repo from git remote origin URL."""
-    import subprocess
+    if _github_repo_info_cache["value"] is not None:
+        return _github_repo_info_cache["value"]
     try:
         bot_dir = os.path.dirname(os.path.abspath(__file__))
         result = subprocess.run(
@@ -3222,10 +3408,10 @@ def _get_github_repo_info():
             # Handle both HTTPS and SSH formats
             # https://github.com/owner/repo.git
             # git@github.com:owner/repo.git
-            import re
-            match = re.search(r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$', url)
+            match = _RE_GITHUB_REMOTE.search(url)
             if match:
-                return match.group(1), match.group(2)
+                _github_repo_info_cache["value"] = match.groups()
+                return _github_repo_info_cache["value"]
     except Exception:
         pass
     return None, None
@@ -3233,32 +3419,43 @@ def _get_github_repo_info():
 
 def _compare_versions(v1: str, v2: str) -> int:
     """Compare semantic versions. Returns 1 if v1 > v2, -1 if v1 < v2, 0 if equal."""
-    def parse_version(v):
-        parts = str(v or '').lstrip('v').split('.')
-        if len(parts) < 3 or not all(part.isdigit() for part in parts[:3]):
-            raise ValueError(f"Invalid semantic version: {v}")
-        return [int(part) for part in parts[:3]]
-    try:
-        parts1, parts2 = parse_version(v1), parse_version(v2)
-        max_len = max(len(parts1), len(parts2))
-        parts1.extend([0] * (max_len - len(parts1)))
-        parts2.extend([0] * (max_len - len(parts2)))
-        return (parts1 > parts2) - (parts1 < parts2)
-    except (ValueError, AttributeError):
+    key1, key2 = _version_key(v1), _version_key(v2)
+    if key1 is None or key2 is None:
         return 0
+    return (key1 > key2) - (key1 < key2)
 
 
-def _version_key(version: str) -> list[int] | None:
+@lru_cache(maxsize=128)
+def _version_key(version: str) -> tuple[int, int, int] | None:
+    """Parse major.minor.patch once per distinct version string; None if not semantic."""
     parts = str(version or "").strip().lstrip("v").split(".")
     if len(parts) < 3 or not all(part.isdigit() for part in parts[:3]):
         return None
-    return [int(part) for part in parts[:3]]
+    return int(parts[0]), int(parts[1]), int(parts[2])
+
+
+# One pooled client serves every version check, so the release and tags
+# lookups share a keep-alive connection instead of a TCP/TLS handshake each.
+# It follows redirects for renamed repos and, through trust_env, HTTPS_PROXY.
+# Built on first use; httpx is installed as a dependency of openai.
+_github_http_client = None
+_github_http_client_lock = threading.Lock()
+
+
+def _github_client():
+    """Return the shared httpx client used for GitHub API lookups."""
+    global _github_http_client
+    with _github_http_client_lock:
+        if _github_http_client is None:
+            import httpx
+            _github_http_client = httpx.Client(
+                follow_redirects=True, headers={'User-Agent': 'Discord-Pals'}, timeout=5
+            )
+        return _github_http_client
 
 
 def _fetch_github_latest_version():
     """Check GitHub API for the highest semantic release or tag version."""
-    import urllib.request
-    import json
 
     owner, repo = _get_github_repo_info()
     if not owner or not repo:
@@ -3272,20 +3469,21 @@ def _fetch_github_latest_version():
 
     for url in urls:
         try:
-            req = urllib.request.Request(url, headers={'User-Agent': 'Discord-Pals'})
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode())
-
-                if 'tag_name' in data:
-                    # Latest release response
-                    versions.append(data['tag_name'].lstrip('v'))
-                elif isinstance(data, list) and len(data) > 0:
-                    # Tags list response, usually newest first, but compare defensively.
-                    versions.extend(
-                        tag.get('name', '').lstrip('v')
-                        for tag in data
-                        if isinstance(tag, dict) and tag.get('name')
-                    )
+            response = _github_client().get(url)
+            if response.status_code != 200:
+                continue
+            data = json_codec.loads(response.content)
+
+            if 'tag_name' in data:
+                # Latest release response
+                versions.append(data['tag_name'].lstrip('v'))
+            elif isinstance(data, list) and len(data) > 0:
+                # Tags list response, usually newest first, but compare defensively.
+                versions.extend(
+                    tag.get('name', '').lstrip('v')
+                    for tag in data
+                    if isinstance(tag, dict) and tag.get('name')
+                )
         except Exception:
             continue
 
@@ -3427,7 +3625,6 @@ def _update_payload_base(
 @requires_auth
 def api_version():
     """Get version information including GitHub latest version."""
-    import runtime_config
 
     file_version = _get_file_version()
     github_version = _check_github_latest_version()
@@ -3470,7 +3667,6 @@ def _command_output(result) -> str:
 
 
 def _run_command(args: list[str], cwd: str, timeout: int):
-    import subprocess
 
     return subprocess.run(
         args,
@@ -3773,8 +3969,7 @@ def _safe_json_read(path: Path, default):
     try:
         if not path.exists():
             return default
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_codec.loads(path.read_bytes())
         return data if isinstance(data, type(default)) else default
     except Exception:
         return default
@@ -3793,10 +3988,7 @@ def _write_update_log(event: dict) -> None:
         }
         entries.append(clean_event)
         entries = entries[-50:]
-        tmp_path = path.with_suffix(path.suffix + ".tmp")
-        with tmp_path.open("w", encoding="utf-8") as f:
-            json.dump(entries, f, indent=2)
-        tmp_path.replace(path)
+        _atomic_write_bytes(path, json_codec.dumps(entries, indent=2))
     except Exception as e:
         log.warn(f"Could not write update log: {e}")
 
@@ -3934,7 +4126,6 @@ def _perform_git_update(repo_dir: str, expected_version: str | None = None, upda
 
 
 def _pip_command_candidates(repo_dir: str) -> list[list[str]]:
-    import sys
 
     candidates = []
     if sys.executable:
@@ -4000,8 +4191,6 @@ def _install_update_dependencies(repo_dir: str) -> dict:
 @requires_auth
 def api_update():
     """Pull latest changes from git repository and install dependencies."""
-    import subprocess
-    import runtime_config
 
     log.info("Git update requested via dashboard")
 
@@ -4173,20 +4362,22 @@ def api_update():
 
 # --- Restart API ---
 
+# Upper bound on waiting for bot connections to close before re-exec
+_RESTART_CLOSE_TIMEOUT = 2.0
+
+
 @app.route('/api/restart', methods=['POST'])
 @requires_csrf
 @requires_auth
 def api_restart():
     """Restart the bot application without terminal restart."""
-    import sys
-    import subprocess
 
     log.warn("Application restart requested via dashboard")
 
     # Save current state before restart
     try:
-        from discord_utils import save_history
-        from memory import memory_manager
+        save_history = discord_utils_module.save_history
+        memory_manager = memory_module.memory_manager
         save_history(force=True)
         memory_manager.save_all()
         log.info("State saved before restart")
@@ -4195,8 +4386,6 @@ def api_restart():
 
     def do_restart():
         """Perform the actual restart in a separate thread."""
-        import time
-        import signal
         time.sleep(1)  # Give time for response to be sent
 
         # Check if running under systemd (simplified detection - don't require INVOCATION_ID)
@@ -4206,16 +4395,19 @@ def api_restart():
         if is_systemd:
             log.info("Detected systemd environment, attempting restart")
 
-            # Try multiple approaches in order of preference
+            # Try multiple approaches in order of preference. --no-block only queues the
+            # job, so systemctl never waits on the stop of the process that called it.
             restart_commands = [
-                ['systemctl', '--user', 'restart', service_name],      # User service
-                ['systemctl', 'restart', service_name],                 # System service (if running as root)
-                ['sudo', '-n', 'systemctl', 'restart', service_name],  # With passwordless sudo
+                ['systemctl', '--user', 'restart', '--no-block', service_name],      # User service
+                ['systemctl', 'restart', '--no-block', service_name],                 # System service (if running as root)
+                ['sudo', '-n', 'systemctl', 'restart', '--no-block', service_name],  # With passwordless sudo
             ]
 
             for cmd in restart_commands:
                 try:
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+                    result = subprocess.run(
+                        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=5
+                    )
                     if result.returncode == 0:
                         log.info(f"Restart successful with: {' '.join(cmd)}")
                         return
@@ -4236,15 +4428,20 @@ def api_restart():
         python = sys.executable
         script = os.path.abspath(sys.argv[0])
 
-        # Close all bot connections gracefully
-        import asyncio
+        # Close all bot connections gracefully, waiting only as long as the closes take
+        close_futures = []
         for bot in bot_instances:
             try:
-                asyncio.run_coroutine_threadsafe(bot.close(), bot.client.loop)
+                close_futures.append(asyncio.run_coroutine_threadsafe(bot.close(), bot.client.loop))
             except Exception:
                 pass
 
-        time.sleep(2)  # Wait for connections to close
+        deadline = time.monotonic() + _RESTART_CLOSE_TIMEOUT
+        for future in close_futures:
+            try:
+                future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except Exception:
+                pass
         # Restart the process
         os.execv(python, [python, script] + sys.argv[1:])
 
@@ -4266,11 +4463,6 @@ def start_dashboard(bots=None, host='127.0.0.1', port=5000):
     if bots:
         bot_instances = bots
 
-    # Disable Flask's default logging
-    import logging
-    werkzeug_log = logging.getLogger('werkzeug')
-    werkzeug_log.setLevel(logging.ERROR)
-
     # Import waitress early to catch import errors
     try:
         from waitress import serve
@@ -4293,11 +4485,10 @@ def start_dashboard(bots=None, host='127.0.0.1', port=5000):
         except Exception as e:
             log.error(f"Dashboard server failed: {e}")
 
-    thread = threading.Thread(target=run_server, daemon=True)
+    thread = threading.Thread(target=run_server, name="dashboard", daemon=True)
     thread.start()
 
     # Give server a moment to start and check if thread is still alive
-    import time
     time.sleep(0.5)
     if not thread.is_alive():
         log.error("Dashboard thread died immediately - check for errors above")
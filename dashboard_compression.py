@@ -0,0 +1,42 @@
+"""Gzip for rendered dashboard pages and JSON API responses."""
+
+from __future__ import annotations
+
+import gzip
+
+from flask import Response, request
+
+# Bodies below this size gain little from gzip once headers are counted.
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+GZIP_MIMETYPES = frozenset({"text/html", "application/json"})
+
+
+def gzip_response(response: Response) -> Response:
+    """after_request hook: gzip sizeable HTML/JSON bodies for clients that accept it.
+
+    Static files are left alone; they are small, browser-cached, and images are
+    already compressed.
+    """
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or response.mimetype not in GZIP_MIMETYPES
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    if "gzip" not in request.accept_encodings:
+        return response
+    body = response.get_data()
+    if len(body) < GZIP_MIN_BYTES:
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0))
+    response.headers["Content-Encoding"] = "gzip"
+    # The gzip bytes differ from the identity body, so a strong tag would lie
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
@@ -0,0 +1,63 @@
+"""Dashboard Flask JSON provider backed by orjson when it is installed."""
+
+from __future__ import annotations
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+from json_codec import orjson
+
+# Keyword arguments the orjson path reproduces; anything else goes to stdlib json.
+_ORJSON_DUMP_KWARGS = frozenset({"default", "ensure_ascii", "indent", "separators", "sort_keys"})
+_ORJSON_SEPARATORS = (None, (",", ":"), (",", ": "))
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Encode jsonify/tojson output through orjson, keeping Flask's defaults.
+
+    Datetimes are passed through to Flask's ``default`` hook so they keep the
+    HTTP-date format; values orjson cannot encode fall back to stdlib json.
+    """
+
+    def _orjson_dumps(self, obj, kwargs) -> bytes | None:
+        """Encode with orjson, or return None when stdlib json must handle it."""
+        if (
+            orjson is None
+            or kwargs.keys() - _ORJSON_DUMP_KWARGS
+            or kwargs.get("indent") not in (None, 2)
+            or kwargs.get("separators") not in _ORJSON_SEPARATORS
+        ):
+            return None
+
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option)
+        except TypeError:
+            return None
+
+    def dumps(self, obj, **kwargs) -> str:
+        encoded = self._orjson_dumps(obj, kwargs)
+        if encoded is None:
+            return super().dumps(obj, **kwargs)
+        return encoded.decode("utf-8")
+
+    def response(self, *args, **kwargs) -> Response:
+        """Build jsonify responses from orjson bytes without a str round trip."""
+        obj = self._prepare_response_obj(args, kwargs)
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            dump_args = {"indent": 2}
+        else:
+            dump_args = {"separators": (",", ":")}
+        encoded = self._orjson_dumps(obj, dump_args)
+        if encoded is None:
+            encoded = super().dumps(obj, **dump_args).encode("utf-8")
+        return self._app.response_class(encoded + b"\n", mimetype=self.mimetype)
+
+    def loads(self, s: str | bytes, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
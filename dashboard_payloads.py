@@ -0,0 +1,100 @@
+"""Dashboard request payload parsing helpers."""
+
+from __future__ import annotations
+
+
+SCHEDULE_DAY_ORDER = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
+def normalize_schedule_days(days) -> list[str]:
+    """Normalize dashboard schedule day values while preserving display order."""
+    if isinstance(days, str):
+        days = [part.strip() for part in days.split(",")]
+    if not isinstance(days, list):
+        days = []
+
+    selected = []
+    for day in days:
+        token = str(day).strip().lower()[:3]
+        if token in SCHEDULE_DAY_ORDER and token not in selected:
+            selected.append(token)
+
+    if not selected:
+        return list(SCHEDULE_DAY_ORDER)
+
+    selected_set = set(selected)
+    return [day for day in SCHEDULE_DAY_ORDER if day in selected_set]
+
+
+def normalize_schedule_time(value) -> str | None:
+    """Return browser-time input as HH:MM, or None when invalid."""
+    parts = str(value or "").strip().split(":")
+    if len(parts) < 2:
+        return None
+    try:
+        hour = int(parts[0])
+        minute = int(parts[1])
+    except (TypeError, ValueError):
+        return None
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        return None
+    return f"{hour:02d}:{minute:02d}"
+
+
+def normalize_schedule_windows(payload: dict) -> tuple[list[dict], list[str]]:
+    """Normalize one or more dashboard unavailable windows."""
+    raw_windows = payload.get("windows")
+    if not isinstance(raw_windows, list):
+        raw_windows = payload.get("unavailable")
+    if not isinstance(raw_windows, list):
+        raw_window = payload.get("window")
+        raw_windows = [raw_window] if isinstance(raw_window, dict) else []
+
+    windows = []
+    errors = []
+    for index, raw_window in enumerate(raw_windows, start=1):
+        if not isinstance(raw_window, dict):
+            errors.append(f"Window {index} is invalid")
+            continue
+
+        start = normalize_schedule_time(raw_window.get("start"))
+        end = normalize_schedule_time(raw_window.get("end"))
+        if not start or not end:
+            errors.append(f"Window {index} needs a valid start and end time")
+            continue
+
+        windows.append({
+            "days": normalize_schedule_days(raw_window.get("days")),
+            "start": start,
+            "end": end,
+        })
+
+    return windows, errors
+
+
+def parse_int_list_values(*values):
+    """Parse one or more comma-separated / repeated inputs into unique positive ints."""
+    parsed = []
+    seen = set()
+
+    def add_candidate(candidate):
+        try:
+            number = int(str(candidate).strip())
+        except (TypeError, ValueError):
+            return
+        if number <= 0 or number in seen:
+            return
+        seen.add(number)
+        parsed.append(number)
+
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            for item in value:
+                add_candidate(item)
+            continue
+        for item in str(value).split(","):
+            add_candidate(item)
+
+    return parsed
@@ -4,9 +4,19 @@ from __future__ import annotations
 
 import os
 import re
+import threading
+import time
 
 import logger as log
 
+_MODELS_CLIENT_LIMIT = 16
+_models_clients: dict[tuple[str, str], object] = {}
+_MODELS_CHECK_TTL = 30.0
+_models_check_ok: dict[tuple[str, str], float] = {}
+# key -> [lock, callers currently using it]; only idle entries are ever evicted
+_models_check_locks: dict[tuple[str, str], list] = {}
+_models_check_locks_guard = threading.Lock()
+
 
 def sanitize_error_message(error: Exception) -> str:
     """Sanitize error message to avoid leaking sensitive info."""
@@ -17,6 +27,56 @@ def sanitize_error_message(error: Exception) -> str:
     return msg[:200]
 
 
+def models_client(url: str, api_key: str):
+    """Return a cached sync OpenAI client so repeated tests reuse its connection pool."""
+    cache_key = (url, api_key)
+    client = _models_clients.get(cache_key)
+    if client is None:
+        from openai import OpenAI  # Use sync client to avoid blocking issues
+        if len(_models_clients) >= _MODELS_CLIENT_LIMIT:
+            _models_clients.clear()
+        client = _models_clients[cache_key] = OpenAI(base_url=url, api_key=api_key, timeout=10)
+    return client
+
+
+def check_models_endpoint(url: str, api_key: str) -> None:
+    """List models to prove an endpoint is reachable; raises on failure.
+
+    A success is remembered for _MODELS_CHECK_TTL seconds, and concurrent
+    checks of the same endpoint wait for one request instead of each holding
+    a dashboard worker on its own call. Failures are never cached.
+    """
+    cache_key = (url, api_key)
+    with _models_check_locks_guard:
+        entry = _models_check_locks.get(cache_key)
+        if entry is None:
+            if len(_models_check_locks) >= _MODELS_CLIENT_LIMIT:
+                _evict_idle_models_checks()
+            entry = _models_check_locks[cache_key] = [threading.Lock(), 0]
+        entry[1] += 1
+    try:
+        with entry[0]:
+            checked_at = _models_check_ok.get(cache_key)
+            if checked_at is not None and time.monotonic() - checked_at < _MODELS_CHECK_TTL:
+                return
+            models_client(url, api_key).models.list()
+            _models_check_ok[cache_key] = time.monotonic()
+    finally:
+        with _models_check_locks_guard:
+            entry[1] -= 1
+
+
+def _evict_idle_models_checks() -> None:
+    """Drop lock entries no caller holds or waits on; call with the guard held.
+
+    A lock still in use must stay mapped, or a new caller for the same endpoint
+    would get a fresh lock and stop coalescing with the running check.
+    """
+    for key in [key for key, (_lock, users) in _models_check_locks.items() if not users]:
+        del _models_check_locks[key]
+        _models_check_ok.pop(key, None)
+
+
 def test_endpoint_provider_config(provider: dict) -> dict:
     """Validate an endpoint-adapter provider configuration without sending prompt data."""
     from endpoint_adapters import uses_endpoint_adapter
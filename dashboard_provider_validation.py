@@ -9,7 +9,8 @@ TEXT_PROVIDER_REQUIRED_FIELDS = ("url", "model", "auth")
 IMAGE_PROVIDER_REQUIRED_FIELDS = ("url", "model", "auth")
 
 
-def _dashboard_bool(value, default: bool = True) -> bool:
+def dashboard_bool(value, default: bool = True) -> bool:
+    """Parse a dashboard form/JSON boolean, falling back to default when unrecognized."""
     if value is None:
         return default
     if isinstance(value, bool):
@@ -40,7 +41,7 @@ def _provider_field_status(provider: dict, *, provider_kind: str, index: int) ->
     tier = provider_tier_name(index)
     endpoint = str(provider.get("url") or provider.get("base_url") or "").strip()
     model = str(provider.get("model") or "").strip()
-    requires_key = _dashboard_bool(provider.get("requires_key"), True)
+    requires_key = dashboard_bool(provider.get("requires_key"), True)
     auth_status = _auth_field_status(provider)
     required_fields = list(IMAGE_PROVIDER_REQUIRED_FIELDS if provider_kind == "image" else TEXT_PROVIDER_REQUIRED_FIELDS)
 
@@ -0,0 +1,53 @@
+"""Dashboard static asset registry served from memory."""
+
+from __future__ import annotations
+
+import hashlib
+import mimetypes
+from pathlib import Path
+
+from flask import Response, request, send_from_directory
+
+import logger as log
+
+STATIC_PRELOAD_MAX_BYTES = 1024 * 1024
+# Asset names are not fingerprinted, so a dashboard update can change a file in
+# place. Browsers cache for a day and then revalidate cheaply through the ETag.
+STATIC_CACHE_CONTROL = "public, max-age=86400"
+
+
+class StaticAssetRegistry:
+    """Preload small read-only dashboard assets so requests skip stat/open."""
+
+    def __init__(self, folder: str | Path, max_bytes: int = STATIC_PRELOAD_MAX_BYTES):
+        self.folder = Path(folder)
+        self.max_bytes = max_bytes
+        self.assets: dict[str, tuple[bytes, str, str]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.folder.is_dir():
+            return
+        for path in self.folder.rglob("*"):
+            try:
+                if not path.is_file() or path.stat().st_size > self.max_bytes:
+                    continue
+                data = path.read_bytes()
+            except OSError as e:
+                log.warn(f"Could not preload dashboard asset {path.name}: {e}")
+                continue
+            mimetype = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            etag = hashlib.sha256(data).hexdigest()[:16]
+            self.assets[path.relative_to(self.folder).as_posix()] = (data, etag, mimetype)
+
+    def serve(self, filename: str):
+        """Flask view for /static/<filename>; large or unknown files go to disk."""
+        asset = self.assets.get(filename)
+        if asset is None:
+            response = send_from_directory(self.folder, filename)
+        else:
+            data, etag, mimetype = asset
+            response = Response(data, mimetype=mimetype)
+            response.set_etag(etag)
+        response.headers["Cache-Control"] = STATIC_CACHE_CONTROL
+        return response.make_conditional(request.environ)
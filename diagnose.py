@@ -8,8 +8,25 @@ import os
 import sys
 import json
 import asyncio
+from functools import lru_cache
 from pathlib import Path
 
+# Optional dependencies; each check reports its own missing package via ImportError
+try:
+    import httpx
+except ImportError:
+    httpx = None
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+try:
+    from openai import AsyncOpenAI
+except ImportError:
+    AsyncOpenAI = None
+
+PROVIDERS_FILE = Path(__file__).parent / "providers.json"
+
 # Colors for terminal output
 class Colors:
     OK = '\033[92m'
@@ -19,13 +36,36 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
-def ok(msg): print(f"{Colors.OK}✓ {msg}{Colors.END}")
-def warn(msg): print(f"{Colors.WARN}⚠ {msg}{Colors.END}")
-def fail(msg): print(f"{Colors.FAIL}✗ {msg}{Colors.END}")
-def info(msg): print(f"{Colors.INFO}ℹ {msg}{Colors.END}")
+# Concurrent provider checks pass an `out` list so each provider's lines print together
+def _emit(line, out=None):
+    if out is None:
+        print(line)
+    else:
+        out.append(line)
+
+
+def ok(msg, out=None): _emit(f"{Colors.OK}✓ {msg}{Colors.END}", out)
+def warn(msg, out=None): _emit(f"{Colors.WARN}⚠ {msg}{Colors.END}", out)
+def fail(msg, out=None): _emit(f"{Colors.FAIL}✗ {msg}{Colors.END}", out)
+def info(msg, out=None): _emit(f"{Colors.INFO}ℹ {msg}{Colors.END}", out)
 def header(msg): print(f"\n{Colors.BOLD}{'='*50}\n{msg}\n{'='*50}{Colors.END}")
 
 
+@lru_cache(maxsize=1)
+def _load_providers() -> dict:
+    """Parse providers.json once; every check reads the same configuration."""
+    with open(PROVIDERS_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load .env once; raises ImportError when python-dotenv is missing."""
+    if load_dotenv is None:
+        raise ImportError("No module named 'dotenv'")
+    load_dotenv()
+
+
 def check_files():
     """Check required configuration files."""
     header("1. Checking Configuration Files")
@@ -52,13 +92,11 @@ def check_files():
         issues.append("missing .env")
     
     # Check providers.json
-    providers_file = base_dir / "providers.json"
     providers_example = base_dir / "providers.json.example"
-    if providers_file.exists():
+    if PROVIDERS_FILE.exists():
         ok("providers.json found")
         try:
-            with open(providers_file) as f:
-                data = json.load(f)
+            data = _load_providers()
             providers = data.get("providers", [])
             ok(f"  {len(providers)} provider(s) configured")
             for i, p in enumerate(providers):
@@ -79,17 +117,13 @@ def check_env_vars():
     """Check environment variables."""
     header("2. Checking Environment Variables")
     
-    from dotenv import load_dotenv
-    load_dotenv()
+    _load_env()
     
     # Load providers to see which env vars we need
-    providers_file = Path(__file__).parent / "providers.json"
     required_keys = []
     
-    if providers_file.exists():
-        with open(providers_file) as f:
-            data = json.load(f)
-        for p in data.get("providers", []):
+    if PROVIDERS_FILE.exists():
+        for p in _load_providers().get("providers", []):
             key_env = p.get("key_env")
             if key_env:
                 required_keys.append((key_env, p.get("name", "Unknown")))
@@ -109,139 +143,169 @@ def check_env_vars():
     return issues
 
 
+async def _probe_provider(p: dict, client) -> tuple[list, list]:
+    """Probe one provider's /models endpoint; returns (output lines, issues)."""
+    out = []
+    issues = []
+    name = p.get("name", "Unknown")
+    url = p.get("url", "")
+    model = p.get("model", "unknown")
+    key_env = p.get("key_env", "")
+    api_key = os.getenv(key_env, "")
+    
+    out.append(f"\n{Colors.BOLD}Testing: {name}{Colors.END}")
+    info(f"  URL: {url}", out)
+    info(f"  Model: {model}", out)
+    
+    if not url:
+        fail("  No URL configured", out)
+        issues.append(f"{name}: no URL")
+        return out, issues
+    
+    # Test /models endpoint first (basic connectivity)
+    try:
+        models_url = url.rstrip('/') + '/models'
+        info(f"  Checking {models_url}...", out)
+        
+        headers = {}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        
+        resp = await client.get(models_url, headers=headers)
+        
+        if resp.status_code == 200:
+            ok(f"  /models endpoint responded (HTTP 200)", out)
+            try:
+                models_data = resp.json()
+                if "data" in models_data:
+                    available_models = [m.get("id", "?") for m in models_data["data"]]
+                    info(f"  Available models: {available_models[:5]}{'...' if len(available_models) > 5 else ''}", out)
+                    if model not in available_models and model != "local-model":
+                        warn(f"  Configured model '{model}' not in available models!", out)
+            except:
+                pass
+        else:
+            warn(f"  /models returned HTTP {resp.status_code}", out)
+            info(f"  Response: {resp.text[:200]}", out)
+                
+    except httpx.ConnectError as e:
+        fail(f"  CONNECTION FAILED: Cannot reach {url}", out)
+        fail(f"  Error: {e}", out)
+        issues.append(f"{name}: connection failed")
+        info("  → Check if the server is running", out)
+        info("  → Check firewall settings", out)
+        info("  → Verify the URL is correct", out)
+    except httpx.PoolTimeout:
+        fail("  TIMEOUT: Waited too long for a free connection (not a server timeout)", out)
+        issues.append(f"{name}: connection pool timeout")
+    except httpx.TimeoutException:
+        fail(f"  TIMEOUT: Server didn't respond in 10s", out)
+        issues.append(f"{name}: timeout")
+    except Exception as e:
+        fail(f"  ERROR: {type(e).__name__}: {e}", out)
+        issues.append(f"{name}: {type(e).__name__}")
+    
+    return out, issues
+
+
 async def check_connectivity():
     """Test connectivity to each provider."""
     header("3. Testing Provider Connectivity")
     
-    providers_file = Path(__file__).parent / "providers.json"
-    if not providers_file.exists():
+    if not PROVIDERS_FILE.exists():
         fail("Cannot test - providers.json not found")
         return ["no providers.json"]
     
-    with open(providers_file) as f:
-        data = json.load(f)
+    data = _load_providers()
+    _load_env()
     
-    from dotenv import load_dotenv
-    load_dotenv()
+    if httpx is None:
+        raise ImportError("No module named 'httpx'")
     
+    # Probes are independent, so a dead endpoint costs one timeout, not one per provider.
+    # One client pools connections, so providers behind the same host share a handshake.
+    # The pool is uncapped: every probe starts at once, and a dead host holding
+    # connections must not leave healthy providers queued until they "time out".
+    async with httpx.AsyncClient(timeout=10.0, limits=httpx.Limits(max_connections=None)) as client:
+        results = await asyncio.gather(
+            *(_probe_provider(p, client) for p in data.get("providers", []))
+        )
     issues = []
+    for out, provider_issues in results:
+        for line in out:
+            print(line)
+        issues.extend(provider_issues)
     
-    for p in data.get("providers", []):
-        name = p.get("name", "Unknown")
-        url = p.get("url", "")
-        model = p.get("model", "unknown")
-        key_env = p.get("key_env", "")
-        api_key = os.getenv(key_env, "")
-        
-        print(f"\n{Colors.BOLD}Testing: {name}{Colors.END}")
-        info(f"  URL: {url}")
-        info(f"  Model: {model}")
+    return issues
+
+
+async def _chat_test_provider(p: dict, clients: dict) -> list:
+    """Send one test completion to a provider; returns its output lines."""
+    out = []
+    name = p.get("name", "Unknown")
+    url = p.get("url", "")
+    model = p.get("model", "unknown")
+    key_env = p.get("key_env", "")
+    api_key = os.getenv(key_env, "") or "not-needed"
+    
+    out.append(f"\n{Colors.BOLD}Chat test: {name}{Colors.END}")
+    
+    try:
+        # Providers sharing an endpoint and key reuse one client and its connection pool
+        client = clients.get((url, api_key))
+        if client is None:
+            client = clients[(url, api_key)] = AsyncOpenAI(
+                base_url=url,
+                api_key=api_key,
+                timeout=30.0
+            )
         
-        if not url:
-            fail("  No URL configured")
-            issues.append(f"{name}: no URL")
-            continue
+        info("  Sending test message...", out)
+        response = await asyncio.wait_for(
+            client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": "You are a helpful assistant."},
+                    {"role": "user", "content": "Say 'test successful' and nothing else."}
+                ],
+                max_tokens=20,
+                temperature=0
+            ),
+            timeout=30.0
+        )
         
-        # Test /models endpoint first (basic connectivity)
-        import httpx
+        content = response.choices[0].message.content
+        ok(f"  Response received: {content[:100]}", out)
         
-        try:
-            models_url = url.rstrip('/') + '/models'
-            info(f"  Checking {models_url}...")
-            
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                headers = {}
-                if api_key:
-                    headers["Authorization"] = f"Bearer {api_key}"
-                
-                resp = await client.get(models_url, headers=headers)
-                
-                if resp.status_code == 200:
-                    ok(f"  /models endpoint responded (HTTP 200)")
-                    try:
-                        models_data = resp.json()
-                        if "data" in models_data:
-                            available_models = [m.get("id", "?") for m in models_data["data"]]
-                            info(f"  Available models: {available_models[:5]}{'...' if len(available_models) > 5 else ''}")
-                            if model not in available_models and model != "local-model":
-                                warn(f"  Configured model '{model}' not in available models!")
-                    except:
-                        pass
-                else:
-                    warn(f"  /models returned HTTP {resp.status_code}")
-                    info(f"  Response: {resp.text[:200]}")
-                    
-        except httpx.ConnectError as e:
-            fail(f"  CONNECTION FAILED: Cannot reach {url}")
-            fail(f"  Error: {e}")
-            issues.append(f"{name}: connection failed")
-            info("  → Check if the server is running")
-            info("  → Check firewall settings")
-            info("  → Verify the URL is correct")
-        except httpx.TimeoutException:
-            fail(f"  TIMEOUT: Server didn't respond in 10s")
-            issues.append(f"{name}: timeout")
-        except Exception as e:
-            fail(f"  ERROR: {type(e).__name__}: {e}")
-            issues.append(f"{name}: {type(e).__name__}")
+    except asyncio.TimeoutError:
+        fail(f"  TIMEOUT after 30s", out)
+    except Exception as e:
+        fail(f"  ERROR: {type(e).__name__}: {e}", out)
     
-    return issues
+    return out
 
 
 async def test_chat_completion():
     """Try an actual chat completion."""
     header("4. Testing Chat Completion")
     
-    providers_file = Path(__file__).parent / "providers.json"
-    if not providers_file.exists():
+    if not PROVIDERS_FILE.exists():
         fail("Cannot test - providers.json not found")
         return
     
-    with open(providers_file) as f:
-        data = json.load(f)
+    data = _load_providers()
+    _load_env()
     
-    from dotenv import load_dotenv
-    load_dotenv()
+    if AsyncOpenAI is None:
+        raise ImportError("No module named 'openai'")
     
-    from openai import AsyncOpenAI
-    
-    for p in data.get("providers", []):
-        name = p.get("name", "Unknown")
-        url = p.get("url", "")
-        model = p.get("model", "unknown")
-        key_env = p.get("key_env", "")
-        api_key = os.getenv(key_env, "") or "not-needed"
-        
-        print(f"\n{Colors.BOLD}Chat test: {name}{Colors.END}")
-        
-        try:
-            client = AsyncOpenAI(
-                base_url=url,
-                api_key=api_key,
-                timeout=30.0
-            )
-            
-            info("  Sending test message...")
-            response = await asyncio.wait_for(
-                client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful assistant."},
-                        {"role": "user", "content": "Say 'test successful' and nothing else."}
-                    ],
-                    max_tokens=20,
-                    temperature=0
-                ),
-                timeout=30.0
-            )
-            
-            content = response.choices[0].message.content
-            ok(f"  Response received: {content[:100]}")
-            
-        except asyncio.TimeoutError:
-            fail(f"  TIMEOUT after 30s")
-        except Exception as e:
-            fail(f"  ERROR: {type(e).__name__}: {e}")
+    clients = {}
+    results = await asyncio.gather(
+        *(_chat_test_provider(p, clients) for p in data.get("providers", []))
+    )
+    for out in results:
+        for line in out:
+            print(line)
 
 
 async def main():
@@ -3,20 +3,24 @@ Discord Pals - Discord Utilities
 Helper functions for Discord interactions.
 """
 
+import asyncio
 import discord
 import re
 import base64
-import json
 import os
+import random
 import aiohttp
 import threading
 import time
 from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from datetime import datetime, timedelta, timezone
+from typing import List, Dict, FrozenSet, Optional, Tuple
+from datetime import datetime, timezone
 from config import MAX_HISTORY_MESSAGES, MAX_EMOJIS_IN_PROMPT, DATA_DIR
 import attribution
+import json_codec
 import logger as log
 from scopes import dm_history_id
 
@@ -61,9 +65,9 @@ def safe_json_load(filepath: str, default=None) -> dict | list:
     lock = _get_file_lock(filepath)
     with lock:
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            with open(filepath, 'rb') as f:
+                return json_codec.loads(f.read())
+        except json_codec.JSONDecodeError as e:
             log.warn(f"JSON decode error in {filepath}: {e}")
             return default
         except IOError as e:
@@ -84,7 +88,7 @@ def safe_json_save(filepath: str, data, indent: int = 2) -> bool:
     """
     # Validate JSON is serializable before writing
     try:
-        json_str = json.dumps(data, indent=indent, ensure_ascii=False)
+        payload = json_codec.dumps(data, indent=indent)
     except (TypeError, ValueError) as e:
         log.warn(f"JSON serialization error for {filepath}: {e}")
         return False
@@ -99,8 +103,8 @@ def safe_json_save(filepath: str, data, indent: int = 2) -> bool:
 
             # Write to temp file first, then rename (atomic on most systems)
             temp_path = filepath + '.tmp'
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(json_str)
+            with open(temp_path, 'wb') as f:
+                f.write(payload)
 
             # Atomic rename
             os.replace(temp_path, filepath)
@@ -140,6 +144,8 @@ _RECENT_HASH_LIMIT = 50  # Number of recent hashes to track per channel
 
 # Multi-part response tracking (message_id -> full_content)
 multipart_responses: Dict[int, Dict[int, str]] = {}
+# (channel_id, message_id) in store order, so global eviction pops the oldest in O(1)
+_multipart_order: OrderedDict[Tuple[int, int], None] = OrderedDict()
 
 # History persistence file
 HISTORY_CACHE_FILE = os.path.join(DATA_DIR, "history_cache.json")
@@ -189,6 +195,15 @@ RE_WORD = re.compile(r'\w+')
 # Pre-compiled pattern for sentence splitting
 RE_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
 
+# Pre-compiled patterns for whitespace cleanup and chunk boundaries
+# Greedy .* backtracks from the end, so group 1 is the last whitespace run after text
+RE_LAST_WHITESPACE_RUN = re.compile(r'.*\S(\s)', re.DOTALL)
+RE_MULTI_WHITESPACE = re.compile(r'\s{2,}')
+RE_SPACE_BEFORE_PUNCT = re.compile(r'\s+([,!?;:.])')
+
+# Pre-compiled pattern for process_outgoing_mentions
+RE_NAMED_MENTION = re.compile(r'<@!?([^>\d][^>]*)>')
+
 _TIME_GAP_THRESHOLD_SECONDS = 30 * 60
 _TIME_PASSAGE_CONTEXT_THRESHOLD_SECONDS = 2 * 60 * 60
 
@@ -268,10 +283,11 @@ def _format_time_gap(delta_seconds: float) -> str:
     return ", ".join(parts) + " later"
 
 
-def _get_time_gap_prefix(previous_msg: Optional[dict], current_msg: Optional[dict]) -> str:
-    """Return a formatted time-gap marker to prepend before a message when needed."""
-    previous_dt = _parse_history_timestamp(previous_msg.get("timestamp") if previous_msg else None)
-    current_dt = _parse_history_timestamp(current_msg.get("timestamp") if current_msg else None)
+def _time_gap_prefix(previous_dt: Optional[datetime], current_dt: Optional[datetime]) -> str:
+    """Return a formatted time-gap marker to prepend before a message when needed.
+
+    Takes parsed timestamps so history loops parse each message's timestamp once.
+    """
     if not previous_dt or not current_dt:
         return ""
 
@@ -441,7 +457,8 @@ def save_history(force: bool = False):
     failed_channels = set()
     for channel_id in dirty_channels:
         if channel_id in conversation_history:
-            if not safe_json_save(_history_channel_path(channel_id), _serialize_channel_history(channel_id)):
+            # Machine-only files rewritten on every flush, so skip pretty-printing
+            if not safe_json_save(_history_channel_path(channel_id), _serialize_channel_history(channel_id), indent=None):
                 failed_channels.add(channel_id)
         else:
             _delete_channel_history_file(channel_id)
@@ -724,8 +741,9 @@ def add_to_history(channel_id: int, role: str, content: str, author_name: str =
         if not str(content or "").strip():
             return
 
-    if channel_id not in conversation_history:
-        conversation_history[channel_id] = []
+    history = conversation_history.get(channel_id)
+    if history is None:
+        history = conversation_history[channel_id] = []
 
     # Track activity for this channel
     _channel_last_activity[channel_id] = time.time()
@@ -772,7 +790,7 @@ def add_to_history(channel_id: int, role: str, content: str, author_name: str =
         # Remove oldest entry (first inserted)
         _recent_message_hashes[channel_id].popitem(last=False)
 
-    conversation_history[channel_id].append(msg)
+    history.append(msg)
     log.diagnostic(
         "History entry added",
         component="history",
@@ -787,8 +805,11 @@ def add_to_history(channel_id: int, role: str, content: str, author_name: str =
         content_len=len(content or ""),
     )
 
-    if len(conversation_history[channel_id]) > MAX_HISTORY_MESSAGES:
-        conversation_history[channel_id] = conversation_history[channel_id][-MAX_HISTORY_MESSAGES:]
+    # Trim in place: at the cap this drops one entry instead of copying the whole
+    # tail into a new list, and references held by callers stay current
+    excess = len(history) - MAX_HISTORY_MESSAGES
+    if excess > 0:
+        del history[:excess]
 
     # Trigger debounced save to prevent data loss on crash
     _mark_history_dirty(channel_id)
@@ -836,22 +857,48 @@ def cleanup_stale_conversation_history():
         log.debug(f"Cleaned up {len(channels_to_remove)} stale channels from conversation history")
 
 
-def update_history_on_edit(channel_id: int, old_content: str, new_content: str, user_name: str = None):
-    """Update history when a message is edited."""
+def _edited_history_content(stored, old_content: str, new_content: str) -> Optional[str]:
+    """Splice an edit into stored history text, or None when the raw text no longer lines up.
+
+    Stored user text has already been OOC-stripped and formatted, so only the raw
+    substring is swapped and the edited text gets the same OOC stripping first.
+    """
+    if not isinstance(stored, str) or not old_content or old_content not in stored:
+        return None
+    return stored.replace(old_content, strip_discord_ooc_comments(new_content))
+
+
+def update_history_on_edit(channel_id: int, old_content: str, new_content: str, user_name: str = None,
+                           message_id: int = None):
+    """Update history when a message is edited.
+
+    With a message_id only that entry is touched, like remove_message_from_history;
+    the substring scan is kept for callers that have no ID.
+    """
     if channel_id not in conversation_history:
         return
     
     history = conversation_history[channel_id]
+    updated = False
     for i in range(len(history) - 1, -1, -1):
         msg = history[i]
-        if msg["role"] == "user":
-            stored = msg["content"]
-            if isinstance(stored, str) and old_content in stored:
-                history[i]["content"] = stored.replace(old_content, new_content)
-                _rebuild_recent_message_hashes(channel_id)
-                _mark_history_dirty(channel_id)
-                save_history()
-                return
+        if message_id is not None:
+            if msg.get("message_id") != message_id:
+                continue
+        elif msg["role"] != "user":
+            continue
+        content = _edited_history_content(msg["content"], old_content, new_content)
+        if content is not None:
+            msg["content"] = content
+            updated = True
+            break
+        if message_id is not None:
+            break
+
+    if updated:
+        _rebuild_recent_message_hashes(channel_id)
+        _mark_history_dirty(channel_id)
+        save_history()
 
 
 def remove_assistant_from_history(channel_id: int, count: int = 1):
@@ -924,11 +971,14 @@ def format_history_for_ai(channel_id: int, limit: int = 50) -> List[dict]:
     history = get_history(channel_id)[-limit:]  # Apply limit
     canonical_authors = attribution.canonical_author_map(history)
     formatted = []
+    previous_dt = None
 
-    for idx, msg in enumerate(history):
+    for msg in history:
         role = msg.get("role", "user")
         content = msg.get("content", "")
-        gap_prefix = _get_time_gap_prefix(history[idx - 1] if idx > 0 else None, msg)
+        current_dt = _parse_history_timestamp(msg.get("timestamp"))
+        gap_prefix = _time_gap_prefix(previous_dt, current_dt)
+        previous_dt = current_dt
 
         attributed = False
         if role == "user":
@@ -989,7 +1039,10 @@ def format_history_split(channel_id: int, total_limit: int = 200, immediate_coun
     # Format all messages through the shared attribution renderer so one
     # user_id keeps one canonical name across the whole rendered window.
     canonical_authors = attribution.canonical_author_map(all_history)
+    current_bot_key = current_bot_name.lower() if current_bot_name else None
     formatted = []
+    # Each timestamp is parsed once and carried forward as the next message's previous
+    previous_dt = None
     for msg in all_history:
         role = msg.get("role", "user")
         content = msg.get("content", "")
@@ -1004,15 +1057,16 @@ def format_history_split(channel_id: int, total_limit: int = 200, immediate_coun
                 attributed = True
         elif role == "assistant":
             # Bot messages: check if this is from the CURRENT bot or a DIFFERENT bot
-            if author and current_bot_name and author.lower() != current_bot_name.lower():
+            if author and current_bot_key and author.lower() != current_bot_key:
                 # Different bot - treat as "user" role with name prefix to prevent personality bleed
                 role = "user"
                 content = attribution.render_attributed_content(author, content)
                 attributed = True
             # If same bot or no author field, keep as assistant (no prefix)
 
-        previous_msg = all_history[len(formatted) - 1] if formatted else None
-        gap_prefix = _get_time_gap_prefix(previous_msg, msg)
+        current_dt = _parse_history_timestamp(msg.get("timestamp"))
+        gap_prefix = _time_gap_prefix(previous_dt, current_dt)
+        previous_dt = current_dt
         if gap_prefix:
             content = f"{gap_prefix}{content}"
 
@@ -1037,17 +1091,16 @@ def format_history_split(channel_id: int, total_limit: int = 200, immediate_coun
     return history, immediate
 
 
-def get_active_users(channel_id: int, limit: int = 20) -> List[str]:
-    """Get list of unique users who have participated recently."""
-    history = get_history(channel_id)[-limit:]
-    users = set()
-
-    for msg in history:
-        author = msg.get("author")
-        if author and msg.get("role") == "user":
-            users.add(author)
-
-    return list(users)
+def get_active_users(channel_id: int, limit: int = 20) -> FrozenSet[str]:
+    """Get the set of users who have participated recently."""
+    history = conversation_history.get(channel_id)
+    if not history:
+        return frozenset()
+    return frozenset(
+        msg["author"]
+        for msg in islice(history, max(0, len(history) - limit), None)
+        if msg.get("role") == "user" and msg.get("author")
+    )
 
 
 def get_other_bot_names(channel_id: int, current_bot_name: str) -> List[str]:
@@ -1094,6 +1147,8 @@ def get_sticker_info(message: discord.Message) -> Optional[str]:
 
 # LRU-style emoji cache using OrderedDict for O(1) operations
 _emoji_cache: OrderedDict[int, Dict[str, discord.Emoji]] = OrderedDict()
+# guild_id -> (guild.emojis it was built from, max_count, formatted prompt list)
+_emoji_prompt_cache: Dict[int, Tuple[tuple, int, str]] = {}
 _EMOJI_CACHE_MAX_SIZE = 50  # Max number of guilds to cache
 
 
@@ -1105,7 +1160,8 @@ def _update_emoji_cache_lru(guild_id: int):
 
     # Evict oldest entries if over limit
     while len(_emoji_cache) > _EMOJI_CACHE_MAX_SIZE:
-        _emoji_cache.popitem(last=False)  # Remove oldest (first) item
+        evicted_id, _ = _emoji_cache.popitem(last=False)  # Remove oldest (first) item
+        _emoji_prompt_cache.pop(evicted_id, None)
 
 
 def get_guild_emojis(guild: discord.Guild, max_count: int = MAX_EMOJIS_IN_PROMPT) -> str:
@@ -1113,14 +1169,24 @@ def get_guild_emojis(guild: discord.Guild, max_count: int = MAX_EMOJIS_IN_PROMPT
     if not guild:
         return ""
 
-    emojis = list(guild.emojis)[:max_count]
+    # discord.py swaps in a new guild.emojis tuple on every emoji update, so an
+    # identical tuple means the name map and prompt string are still current
+    all_emojis = guild.emojis
+    cached = _emoji_prompt_cache.get(guild.id)
+    if cached and cached[0] is all_emojis and cached[1] == max_count and guild.id in _emoji_cache:
+        _update_emoji_cache_lru(guild.id)
+        return cached[2]
+
+    emojis = list(all_emojis)[:max_count]
     if not emojis:
+        _emoji_prompt_cache.pop(guild.id, None)
         return ""
 
-    _emoji_cache[guild.id] = {e.name: e for e in guild.emojis}
+    _emoji_cache[guild.id] = {e.name: e for e in all_emojis}
+    emoji_list = ", ".join([f":{e.name}:" for e in emojis])
+    _emoji_prompt_cache[guild.id] = (all_emojis, max_count, emoji_list)
     _update_emoji_cache_lru(guild.id)
-    emoji_list = [f":{e.name}:" for e in emojis]
-    return ", ".join(emoji_list)
+    return emoji_list
 
 
 def convert_emojis_in_text(text: str, guild: discord.Guild) -> str:
@@ -1129,7 +1195,8 @@ def convert_emojis_in_text(text: str, guild: discord.Guild) -> str:
         return text
 
     result = text
-    if guild and guild.id in _emoji_cache:
+    # Shortcodes need a colon; most replies have none and skip the scan
+    if guild and ':' in result and guild.id in _emoji_cache:
         cache = _emoji_cache[guild.id]
 
         def replace_emoji(match):
@@ -1144,25 +1211,27 @@ def convert_emojis_in_text(text: str, guild: discord.Guild) -> str:
 
         result = RE_EMOJI_SHORTCODE.sub(replace_emoji, result)
 
-    # AFTER conversion, clean up malformed emoji-like tags that LLMs sometimes generate
-    # Remove malformed emoji prefixes (e.g., "<:test:123" without closing ">")
-    result = RE_MALFORMED_EMOJI_PREFIX.sub('', result)
+    # AFTER conversion, clean up malformed emoji-like tags that LLMs sometimes generate.
+    # Every pattern below needs an angle bracket, so plain prose skips all five passes.
+    if '<' in result or '>' in result:
+        # Remove malformed emoji prefixes (e.g., "<:test:123" without closing ">")
+        result = RE_MALFORMED_EMOJI_PREFIX.sub('', result)
 
-    # Remove incomplete tags (e.g., "<:name:123456789012345678" without ">")
-    result = RE_INCOMPLETE_TAG.sub('', result)
+        # Remove incomplete tags (e.g., "<:name:123456789012345678" without ">")
+        result = RE_INCOMPLETE_TAG.sub('', result)
 
-    # Remove incomplete emoji tags at end of string (e.g., "<:emoji" or "<a:")
-    result = RE_BROKEN_EMOJI_END.sub('', result)
+        # Remove incomplete emoji tags at end of string (e.g., "<:emoji" or "<a:")
+        result = RE_BROKEN_EMOJI_END.sub('', result)
 
-    # Remove orphaned emoji IDs without proper format (e.g., "12345678901234567890>")
-    result = RE_ORPHAN_SNOWFLAKE.sub('', result)
+        # Remove orphaned emoji IDs without proper format (e.g., "12345678901234567890>")
+        result = RE_ORPHAN_SNOWFLAKE.sub('', result)
 
-    # Remove empty angle bracket pairs
-    result = RE_EMPTY_ANGLE.sub('', result)
+        # Remove empty angle bracket pairs
+        result = RE_EMPTY_ANGLE.sub('', result)
 
     # Clean up extra whitespace
-    result = re.sub(r'\s{2,}', ' ', result)
-    result = re.sub(r'\s+([,!?;:.])', r'\1', result)
+    result = RE_MULTI_WHITESPACE.sub(' ', result)
+    result = RE_SPACE_BEFORE_PUNCT.sub(r'\1', result)
 
     # Disabled: RE_MALFORMED_EMOJI is too aggressive — it can match legitimate
     # text between < and > (up to 50 chars) and truncate messages mid-sentence.
@@ -1182,12 +1251,18 @@ def parse_reactions(content: str) -> Tuple[str, List[str]]:
 
 async def add_reactions(message: discord.Message, reactions: List[str], guild: discord.Guild = None):
     """Add reactions to a message."""
-    for reaction in reactions:
+    # get_guild_emojis already built a name map for this guild during the prompt
+    emoji_names = _emoji_cache.get(guild.id) if guild else None
+    # A repeated reaction is a no-op on Discord, so skip the extra API call;
+    # reactions still go out one at a time so they keep their order
+    for reaction in dict.fromkeys(reactions):
         try:
             if reaction.startswith(':') and reaction.endswith(':'):
                 emoji_name = reaction[1:-1]
                 if guild:
-                    custom_emoji = discord.utils.get(guild.emojis, name=emoji_name)
+                    custom_emoji = emoji_names.get(emoji_name) if emoji_names else None
+                    if custom_emoji is None:
+                        custom_emoji = discord.utils.get(guild.emojis, name=emoji_name)
                     if custom_emoji:
                         await message.add_reaction(custom_emoji)
                         continue
@@ -1201,6 +1276,22 @@ async def add_reactions(message: discord.Message, reactions: List[str], guild: d
 # Global aiohttp session for reuse
 _http_session: Optional[aiohttp.ClientSession] = None
 
+# Larger images are skipped rather than buffered; vision APIs reject them anyway
+_IMAGE_DOWNLOAD_MAX_BYTES = 20 * 1024 * 1024
+_IMAGE_DOWNLOAD_CHUNK = 64 * 1024
+
+# Image attachment extension -> data URL prefix, built once at import
+_IMAGE_DATA_URL_PREFIXES = {
+    ext: f"data:image/{subtype};base64,"
+    for ext, subtype in (
+        ("png", "png"),
+        ("jpg", "jpeg"),
+        ("jpeg", "jpeg"),
+        ("gif", "gif"),
+        ("webp", "webp"),
+    )
+}
+
 
 async def get_http_session() -> aiohttp.ClientSession:
     """Get or create a reusable HTTP session."""
@@ -1224,9 +1315,19 @@ async def download_image_as_base64(url: str) -> Optional[str]:
     try:
         session = await get_http_session()
         async with session.get(url) as response:
-            if response.status == 200:
-                data = await response.read()
-                return base64.b64encode(data).decode('utf-8')
+            if response.status != 200:
+                return None
+            if (response.content_length or 0) > _IMAGE_DOWNLOAD_MAX_BYTES:
+                log.warn(f"Skipped image larger than {_IMAGE_DOWNLOAD_MAX_BYTES} bytes")
+                return None
+            data = bytearray()
+            async for chunk in response.content.iter_chunked(_IMAGE_DOWNLOAD_CHUNK):
+                data += chunk
+                # content_length can be missing or wrong, so cap the bytes actually read
+                if len(data) > _IMAGE_DOWNLOAD_MAX_BYTES:
+                    log.warn(f"Skipped image larger than {_IMAGE_DOWNLOAD_MAX_BYTES} bytes")
+                    return None
+            return base64.b64encode(data).decode('ascii')
     except Exception as e:
         log.warn(f"Failed to download image: {e}")
     return None
@@ -1241,14 +1342,23 @@ async def process_attachments(message: discord.Message) -> List[dict]:
     if visible_content and visible_content.strip():
         content_parts.append({"type": "text", "text": visible_content.strip()})
 
+    images = []
     for attachment in message.attachments:
-        if any(attachment.filename.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.webp']):
-            base64_data = await download_image_as_base64(attachment.url)
-            if base64_data:
-                content_parts.append({
-                    "type": "image_url",
-                    "image_url": {"url": f"data:image/{attachment.filename.split('.')[-1]};base64,{base64_data}"}
-                })
+        _, dot, ext = attachment.filename.rpartition('.')
+        url_prefix = _IMAGE_DATA_URL_PREFIXES.get(ext.lower()) if dot else None
+        if url_prefix:
+            images.append((attachment, url_prefix))
+
+    # Downloads are independent, so fetch them together; gather keeps attachment order
+    downloads = await asyncio.gather(
+        *(download_image_as_base64(attachment.url) for attachment, _ in images)
+    )
+    for (_, url_prefix), base64_data in zip(images, downloads):
+        if base64_data:
+            content_parts.append({
+                "type": "image_url",
+                "image_url": {"url": url_prefix + base64_data}
+            })
 
     # Return multimodal content if we have any images
     has_images = any(p.get("type") == "image_url" for p in content_parts)
@@ -1280,7 +1390,7 @@ def split_message(content: str, max_length: int = 2000) -> List[str]:
             if current_chunk:
                 chunks.append(current_chunk)
             if len(para) > max_length:
-                sentences = re.split(r'(?<=[.!?])\s+', para)
+                sentences = RE_SENTENCE_SPLIT.split(para)
                 current_chunk = ""
                 for sentence in sentences:
                     if len(current_chunk) + len(sentence) + 1 <= max_length:
@@ -1321,12 +1431,9 @@ def _split_long_message_sentence(sentence: str, max_length: int) -> List[str]:
 
 def _find_message_chunk_boundary(text: str, max_length: int) -> int:
     """Find a readable split boundary within Discord's hard message limit."""
-    window = text[:max_length + 1]
-    whitespace_matches = list(re.finditer(r"\s+", window))
-    for match in reversed(whitespace_matches):
-        if 0 < match.start() <= max_length:
-            return match.start()
-    return max_length
+    # One match against the window replaces collecting every whitespace run in it
+    match = RE_LAST_WHITESPACE_RUN.match(text, 0, max_length + 1)
+    return match.start(1) if match else max_length
 
 
 # --- Multi-part Response Tracking ---
@@ -1336,40 +1443,33 @@ _MULTIPART_MAX_GLOBAL = 5000  # Total entries across all channels
 
 
 def store_multipart_response(channel_id: int, message_ids: List[int], full_content: str):
-    """Store a multi-part response for tracking."""
-    if channel_id not in multipart_responses:
-        multipart_responses[channel_id] = {}
+    """Store a multi-part response for tracking.
+
+    Entries are evicted oldest-first, per channel and globally. Responses are
+    stored as they are sent, so store order matches message-ID order.
+    """
+    channel_msgs = multipart_responses.get(channel_id)
+    if channel_msgs is None:
+        channel_msgs = multipart_responses[channel_id] = {}
 
     for msg_id in message_ids:
-        multipart_responses[channel_id][msg_id] = full_content
+        channel_msgs[msg_id] = full_content
+        _multipart_order[(channel_id, msg_id)] = None
 
-    # Per-channel cleanup: limit to 500 entries per channel
-    if len(multipart_responses[channel_id]) > _MULTIPART_MAX_PER_CHANNEL:
-        # Remove oldest entries (lowest message IDs)
-        sorted_ids = sorted(multipart_responses[channel_id].keys())
-        for old_id in sorted_ids[:-_MULTIPART_MAX_PER_CHANNEL]:
-            del multipart_responses[channel_id][old_id]
+    # Per-channel cleanup: dicts keep insertion order, so the first keys are the oldest
+    while len(channel_msgs) > _MULTIPART_MAX_PER_CHANNEL:
+        old_id = next(iter(channel_msgs))
+        del channel_msgs[old_id]
+        _multipart_order.pop((channel_id, old_id), None)
 
     # Global cleanup: limit total entries across all channels
-    total_entries = sum(len(ch) for ch in multipart_responses.values())
-    if total_entries > _MULTIPART_MAX_GLOBAL:
-        # Collect all entries with channel info, sort by message ID (oldest first)
-        all_entries = []
-        for ch_id, msgs in multipart_responses.items():
-            for msg_id in msgs:
-                all_entries.append((msg_id, ch_id))
-        all_entries.sort()
-
-        # Remove oldest entries until under limit
-        entries_to_remove = total_entries - _MULTIPART_MAX_GLOBAL
-        for msg_id, ch_id in all_entries[:entries_to_remove]:
-            if ch_id in multipart_responses and msg_id in multipart_responses[ch_id]:
-                del multipart_responses[ch_id][msg_id]
-
-        # Clean up empty channel dicts
-        empty_channels = [ch_id for ch_id, msgs in multipart_responses.items() if not msgs]
-        for ch_id in empty_channels:
-            del multipart_responses[ch_id]
+    while len(_multipart_order) > _MULTIPART_MAX_GLOBAL:
+        (old_channel, old_id), _ = _multipart_order.popitem(last=False)
+        msgs = multipart_responses.get(old_channel)
+        if msgs is not None:
+            msgs.pop(old_id, None)
+            if not msgs:
+                del multipart_responses[old_channel]
 
 
 # --- Autonomous Response ---
@@ -1382,11 +1482,12 @@ class AutonomousManager:
 
     def __init__(self):
         self.enabled_channels: Dict[int, float] = {}
-        self.channel_cooldowns: Dict[int, timedelta] = {}
+        self.channel_cooldowns: Dict[int, float] = {}  # Seconds, compared against time.monotonic()
+        self.cooldown_minutes: Dict[int, int] = {}  # Whole minutes, as shown and saved
         self.allow_bot_triggers: Dict[int, bool] = {}  # Per-channel bot trigger control
         self.nickname_trigger_channels: Dict[int, bool] = {}  # Per-channel nickname trigger toggle
-        self.last_autonomous: Dict[int, datetime] = {}
-        self.default_cooldown = timedelta(minutes=2)
+        self.last_autonomous: Dict[int, float] = {}  # time.monotonic() of the last response
+        self.default_cooldown = 120.0
         self._load()
     
     def _load(self):
@@ -1404,17 +1505,16 @@ class AutonomousManager:
             except (ValueError, TypeError):
                 continue
             self.enabled_channels[ch_id] = settings.get('chance', 0.05)
-            self.channel_cooldowns[ch_id] = timedelta(minutes=settings.get('cooldown', 2))
+            self._set_cooldown(ch_id, settings.get('cooldown', 2))
             self.allow_bot_triggers[ch_id] = settings.get('allow_bot_triggers', False)
 
     def _save(self):
         """Save settings to disk."""
         data = {}
         for ch_id, chance in self.enabled_channels.items():
-            cooldown = self.channel_cooldowns.get(ch_id, self.default_cooldown)
             data[str(ch_id)] = {
                 'chance': chance,
-                'cooldown': int(cooldown.total_seconds() // 60),
+                'cooldown': self.cooldown_minutes.get(ch_id, 2),
                 'allow_bot_triggers': self.allow_bot_triggers.get(ch_id, False)
             }
         # Store nickname trigger settings under a reserved key
@@ -1436,16 +1536,28 @@ class AutonomousManager:
         """
         if enabled:
             self.enabled_channels[channel_id] = min(max(chance, 0.0), 1.0)
-            self.channel_cooldowns[channel_id] = timedelta(minutes=min(max(cooldown_mins, 0), 10))
+            self._set_cooldown(channel_id, min(max(cooldown_mins, 0), 10))
             self.allow_bot_triggers[channel_id] = allow_bot_triggers
         elif channel_id in self.enabled_channels:
             del self.enabled_channels[channel_id]
-            if channel_id in self.channel_cooldowns:
-                del self.channel_cooldowns[channel_id]
+            self.channel_cooldowns.pop(channel_id, None)
+            self.cooldown_minutes.pop(channel_id, None)
             if channel_id in self.allow_bot_triggers:
                 del self.allow_bot_triggers[channel_id]
         self._save()
     
+    def _set_cooldown(self, channel_id: int, minutes) -> None:
+        """Store a channel cooldown in seconds plus its whole-minute value."""
+        self.channel_cooldowns[channel_id] = minutes * 60.0
+        self.cooldown_minutes[channel_id] = int(minutes)
+
+    def get_channel_settings(self, channel_id: int) -> Optional[Tuple[float, int, bool]]:
+        """Return (chance, cooldown minutes, allow bot triggers), or None when disabled."""
+        chance = self.enabled_channels.get(channel_id)
+        if chance is None:
+            return None
+        return chance, self.cooldown_minutes.get(channel_id, 2), self.allow_bot_triggers.get(channel_id, False)
+
     def is_nickname_trigger_enabled(self, channel_id: int) -> bool:
         """Check if nickname triggers are enabled for a channel. Default: OFF."""
         return self.nickname_trigger_channels.get(channel_id, False)
@@ -1463,23 +1575,24 @@ class AutonomousManager:
         return self.allow_bot_triggers.get(channel_id, False)
     
     def should_respond(self, channel_id: int) -> bool:
-        import random
-        if channel_id not in self.enabled_channels:
+        chance = self.enabled_channels.get(channel_id)
+        if chance is None:
             return False
-        cooldown = self.channel_cooldowns.get(channel_id, self.default_cooldown)
+        # The roll is independent of the cooldown, so taking it first rejects most
+        # messages before any clock read
+        if random.random() >= chance:
+            return False
+        now = time.monotonic()
         last = self.last_autonomous.get(channel_id)
-        if last and datetime.now() - last < cooldown:
+        if last is not None and now - last < self.channel_cooldowns.get(channel_id, self.default_cooldown):
             return False
-        if random.random() < self.enabled_channels[channel_id]:
-            self.last_autonomous[channel_id] = datetime.now()
-            return True
-        return False
+        self.last_autonomous[channel_id] = now
+        return True
     
     def get_status(self, channel_id: int) -> str:
         if channel_id in self.enabled_channels:
-            cooldown = self.channel_cooldowns.get(channel_id, self.default_cooldown)
             bot_status = "bots: ✓" if self.allow_bot_triggers.get(channel_id, False) else "bots: ✗"
-            return f"✅ Enabled ({self.enabled_channels[channel_id]*100:.0f}% chance, {int(cooldown.total_seconds()//60)}min cooldown, {bot_status})"
+            return f"✅ Enabled ({self.enabled_channels[channel_id]*100:.0f}% chance, {self.cooldown_minutes.get(channel_id, 2)}min cooldown, {bot_status})"
         return "❌ Disabled"
 
 
@@ -1671,6 +1784,13 @@ def get_mentionable_users(
     return users[:max(0, int(limit))]
 
 
+@lru_cache(maxsize=256)
+def _mention_name_pattern(name: str) -> re.Pattern:
+    """Compile the case-insensitive @Name matcher once per alias."""
+    pattern_body = re.escape(name).replace(r'\ ', r'\s+')
+    return re.compile(r'@' + pattern_body + r'(?=\W|$)', re.IGNORECASE)
+
+
 def process_outgoing_mentions(content: str, mentionable_users: list = None,
                                mentionable_bots: list = None) -> str:
     """Process AI response to convert name-based mentions to Discord format.
@@ -1744,7 +1864,7 @@ def process_outgoing_mentions(content: str, mentionable_users: list = None,
     log.debug(f"[MENTIONS] Processing content: {content[:100]}...")
 
     # Normalize AI-generated <@Name> to @Name (keep <@12345> for safety net)
-    content = re.sub(r'<@!?([^>\d][^>]*)>', r'@\1', content)
+    content = RE_NAMED_MENTION.sub(r'@\1', content)
 
     # Track which mention IDs we intentionally insert (so the safety net doesn't strip them)
     inserted_mention_ids = set()
@@ -1757,13 +1877,12 @@ def process_outgoing_mentions(content: str, mentionable_users: list = None,
         mention_syntax = mention_lookup[name]
         # Match @Name with word boundary awareness (case-insensitive)
         # Handles both single-word and multi-word names
-        pattern_body = re.escape(name).replace(r'\ ', r'\s+')
-        pattern = re.compile(r'@' + pattern_body + r'(?=\W|$)', re.IGNORECASE)
+        pattern = _mention_name_pattern(name)
         if pattern.search(content):
             log.debug(f"[MENTIONS] Matched @{name} -> {mention_syntax}")
             content = pattern.sub(mention_syntax, content)
             # Extract the user ID from the mention syntax to protect it from the safety net
-            id_match = re.search(r'<@!?(\d+)>', mention_syntax)
+            id_match = RE_USER_MENTION.search(mention_syntax)
             if id_match:
                 inserted_mention_ids.add(id_match.group(1))
         else:
@@ -1774,15 +1893,13 @@ def process_outgoing_mentions(content: str, mentionable_users: list = None,
     # Safety net: Strip any raw Discord syntax the AI hallucinated,
     # but preserve mentions we just intentionally inserted
     def strip_if_not_inserted(match):
-        # Extract the numeric ID from the match
-        id_match = re.search(r'\d+', match.group(0))
-        if id_match and id_match.group(0) in inserted_mention_ids:
+        if match.group(1) in inserted_mention_ids:
             return match.group(0)  # Keep - we inserted this
         return ''  # Strip - AI hallucinated this
 
-    content = re.sub(r'<@!?\d+>', strip_if_not_inserted, content)
-    content = re.sub(r'<#\d+>', '', content)      # Raw channel mentions (always strip)
-    content = re.sub(r'<@&\d+>', '', content)     # Raw role mentions (always strip)
+    content = RE_USER_MENTION.sub(strip_if_not_inserted, content)
+    content = RE_CHANNEL_MENTION.sub('', content)  # Raw channel mentions (always strip)
+    content = RE_ROLE_MENTION.sub('', content)     # Raw role mentions (always strip)
 
     return content
 
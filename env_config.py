@@ -1,11 +1,12 @@
 """Safe dotenv helpers for dashboard-managed process secrets."""
 
-import json
 import os
 import re
 import stat
 from pathlib import Path
 
+import json_codec
+
 
 ENV_FILE = Path(".env")
 BOTS_FILE = Path("bots.json")
@@ -96,8 +97,8 @@ def load_bot_token_targets(bots_file: Path | None = None) -> list[dict]:
     """Return dashboard-safe token targets declared by bots.json."""
     bots_file = bots_file or BOTS_FILE
     try:
-        data = json.loads(bots_file.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+        data = json_codec.loads(bots_file.read_bytes())
+    except (OSError, json_codec.JSONDecodeError):
         return []
 
     if not isinstance(data, dict) or not isinstance(data.get("bots"), list):
@@ -132,10 +133,10 @@ def load_bots_json_data(bots_file: Path | None = None) -> tuple[dict, str | None
     """Load bots.json for dashboard-managed bot-mode controls."""
     bots_file = bots_file or BOTS_FILE
     try:
-        data = json.loads(bots_file.read_text(encoding="utf-8"))
+        data = json_codec.loads(bots_file.read_bytes())
     except FileNotFoundError:
         return {"bots": []}, None
-    except json.JSONDecodeError as e:
+    except json_codec.JSONDecodeError as e:
         return {"bots": []}, f"Invalid bots.json: {e}"
     except OSError as e:
         return {"bots": []}, f"Could not read bots.json: {e}"
@@ -256,10 +257,7 @@ def write_bots_json_payload(payload: dict, bots_file: Path | None = None) -> Non
     """Persist validated multi-bot config with stable formatting."""
     bots_file = bots_file or BOTS_FILE
     bots_file.parent.mkdir(parents=True, exist_ok=True)
-    bots_file.write_text(
-        json.dumps({"bots": payload["bots"]}, indent=2) + "\n",
-        encoding="utf-8",
-    )
+    bots_file.write_bytes(json_codec.dumps({"bots": payload["bots"]}, indent=2) + b"\n")
 
 
 def save_bot_mode(
@@ -0,0 +1,46 @@
+"""
+Discord Pals - JSON Codec
+Fast JSON parsing through orjson when it is installed, stdlib json otherwise.
+"""
+
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+# this one name regardless of which backend parsed the text.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: str | bytes):
+    """Parse JSON text or UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data, *, indent: int | None = None) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, pretty-printed when indent is set.
+
+    orjson only emits two-space indentation, so other widths use stdlib json.
+    Non-string keys are stringified the way stdlib json does.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # orjson rejects integers wider than 64 bits; stdlib json does not.
+            pass
+    separators = None if indent else (",", ":")
+    return json.dumps(data, indent=indent, ensure_ascii=False, separators=separators).encode("utf-8")
+
+
+def validate(content: str | bytes) -> None:
+    """Raise JSONDecodeError if content is not JSON; the parsed value is discarded."""
+    loads(content)
@@ -51,14 +51,10 @@ class Colors:
     END = '\033[0m'
 
 
-def _timestamp():
-    """Get current time as HH:MM:SS."""
-    return datetime.now().strftime("%H:%M:%S")
-
-
-def _timestamp_iso():
-    """Get current timestamp for file logs."""
-    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+def _timestamps() -> tuple[str, str]:
+    """Get (HH:MM:SS local time, ISO UTC timestamp) from one clock reading."""
+    now = datetime.now().astimezone()
+    return now.strftime("%H:%M:%S"), now.astimezone(timezone.utc).isoformat(timespec="milliseconds")
 
 
 # In-memory log buffer for dashboard
@@ -172,6 +168,12 @@ def get_logs(limit: int = 100, **filters) -> list:
     return entries[-limit:]
 
 
+def get_log_version() -> tuple[int, int]:
+    """Return (sequence, reset marker); it changes whenever the buffer does."""
+    with _log_lock:
+        return _log_sequence, _log_reset_marker
+
+
 def get_logs_after(after_seq: int = 0, limit: int = 100, **filters) -> dict:
     """Get log entries after a cursor, with reset detection for clear/rollover."""
     try:
@@ -191,8 +193,12 @@ def get_logs_after(after_seq: int = 0, limit: int = 100, **filters) -> dict:
 
         if reset:
             entries = list(_log_buffer)
+        elif oldest_seq is None:
+            entries = []
         else:
-            entries = [entry for entry in _log_buffer if entry["seq"] > after_seq]
+            # Sequence numbers are contiguous within the buffer, so the cursor maps
+            # straight to a slice offset and an idle poll copies nothing
+            entries = _log_buffer[max(0, after_seq - oldest_seq + 1):]
 
     entries = _apply_filters([dict(entry) for entry in entries], filters)[-limit:]
     return {
@@ -319,7 +325,7 @@ def _log(
 ):
     """Internal logging function."""
     global _log_sequence
-    ts_str = _timestamp()
+    ts_str, ts_iso = _timestamps()
     redacted_msg = redact(str(msg))
     req_id = req_id or request_id
     redacted_bot = redact(bot_name) if bot_name else None
@@ -333,7 +339,7 @@ def _log(
         log_entry = {
             "seq": _log_sequence,
             "time": ts_str,
-            "ts": _timestamp_iso(),
+            "ts": ts_iso,
             "icon": icon,
             "level": _level_for_icon(icon, level),
             "bot": redacted_bot,
@@ -349,9 +355,11 @@ def _log(
         _log_buffer.append(log_entry)
         if len(_log_buffer) > MAX_LOG_BUFFER:
             del _log_buffer[: len(_log_buffer) - MAX_LOG_BUFFER]
-        file_entry = dict(log_entry)
+        # Only snapshot the entry when it will actually be serialized to disk
+        file_entry = dict(log_entry) if FILE_LOGGING_ENABLED else None
 
-    _write_file_log(file_entry)
+    if file_entry is not None:
+        _write_file_log(file_entry)
 
     # Only print to terminal if level allows
     if level <= LOG_LEVEL:
@@ -69,14 +69,15 @@ def _install_shutdown_handlers() -> None:
 
 def load_bot_configs() -> List[dict]:
     """Load bot configurations from bots.json or fall back to single-bot mode."""
-    import json
     import os
+    import json_codec
     
     if os.path.exists('bots.json'):
         try:
-            with open('bots.json', 'r') as f:
-                config = json.load(f)
-        except (json.JSONDecodeError, IOError):
+            # bots.json is written as UTF-8 bytes; never decode it with the locale encoding
+            with open('bots.json', 'rb') as f:
+                config = json_codec.loads(f.read())
+        except (json_codec.JSONDecodeError, UnicodeDecodeError, IOError):
             log.warn("Failed to parse bots.json, using single-bot mode")
             config = {}
         
@@ -10,6 +10,7 @@ import time
 import glob
 import difflib
 import hashlib
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from config import (
@@ -442,6 +443,7 @@ class MemoryManager:
         # Debounce tracking
         self._dirty_files: set = set()
         self._last_save = time.time()
+        self._save_batch_depth = 0
 
         # Per-key dedup coordination
         self._dedup_in_flight: set = set()
@@ -467,9 +469,22 @@ class MemoryManager:
 
     def _maybe_save(self):
         """Save dirty files if enough time has passed (debounced)."""
+        if self._save_batch_depth:
+            return
         if self._dirty_files and (time.time() - self._last_save) >= MEMORY_SAVE_INTERVAL:
             self._save_dirty_files()
 
+    @contextmanager
+    def batched_saves(self):
+        """Defer debounced saves inside the block, then write each dirty store once."""
+        self._save_batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._save_batch_depth -= 1
+            if not self._save_batch_depth:
+                self.flush()
+
     def _save_dirty_files(self):
         """Save all files marked as dirty."""
         if 'auto' in self._dirty_files:
@@ -649,6 +664,15 @@ class MemoryManager:
     def _bot_lore_key(bot_name: str) -> str:
         return f"bot:{bot_name}"
 
+    def _lore_target_key(self, target_type: str, target_id) -> Optional[str]:
+        if target_type == "user":
+            return self._user_lore_key(int(target_id))
+        if target_type == "bot":
+            return self._bot_lore_key(str(target_id))
+        if target_type == "server":
+            return self._server_lore_key(int(target_id))
+        return None
+
     def resolve_auto_memory_keys(
         self,
         user_ids: Optional[List[int]] = None,
@@ -1401,16 +1425,8 @@ class MemoryManager:
     def add_lore(self, target_type: str, target_id, content: str, added_by: str = None) -> bool:
         """Add manual lore. target_type: 'user', 'bot', or 'server'."""
         content = _sanitize_memory_content(content)
-        if not content:
-            return False
-
-        if target_type == "user":
-            key = self._user_lore_key(int(target_id))
-        elif target_type == "bot":
-            key = self._bot_lore_key(str(target_id))
-        elif target_type == "server":
-            key = self._server_lore_key(int(target_id))
-        else:
+        key = self._lore_target_key(target_type, target_id)
+        if not content or key is None:
             return False
 
         if key not in self.manual_lore:
@@ -1425,29 +1441,40 @@ class MemoryManager:
         self._mark_dirty('lore')
         return True
 
-    def get_server_lore(self, guild_id: int) -> str:
-        """Get server lore."""
-        key = self._server_lore_key(guild_id)
-        entries = self.manual_lore.get(key, [])
+    def replace_lore(self, target_type: str, target_id, content: str, added_by: str = None) -> bool:
+        """Replace all lore for a target with one entry; empty content clears it.
+
+        The store is marked dirty once, so a replace costs at most one save.
+        """
+        key = self._lore_target_key(target_type, target_id)
+        if key is None:
+            return False
+        content = _sanitize_memory_content(content)
+        if content:
+            self.manual_lore[key] = [self._build_lore_entry(content, added_by=added_by)]
+        elif self.manual_lore.pop(key, None) is None:
+            return False
+        self._mark_dirty('lore')
+        return True
+
+    def _format_lore(self, key: str) -> str:
+        # Most targets have no lore; skip building an empty default list for them
+        entries = self.manual_lore.get(key)
         if not entries:
             return ""
         return "\n".join([f"- {e['content']}" for e in entries])
 
+    def get_server_lore(self, guild_id: int) -> str:
+        """Get server lore."""
+        return self._format_lore(self._server_lore_key(guild_id))
+
     def get_user_lore(self, user_id: int) -> str:
         """Get user lore."""
-        key = self._user_lore_key(user_id)
-        entries = self.manual_lore.get(key, [])
-        if not entries:
-            return ""
-        return "\n".join([f"- {e['content']}" for e in entries])
+        return self._format_lore(self._user_lore_key(user_id))
 
     def get_bot_lore(self, bot_name: str) -> str:
         """Get bot lore."""
-        key = self._bot_lore_key(bot_name)
-        entries = self.manual_lore.get(key, [])
-        if not entries:
-            return ""
-        return "\n".join([f"- {e['content']}" for e in entries])
+        return self._format_lore(self._bot_lore_key(bot_name))
 
     def delete_lore(self, key: str, indices: List[int]):
         """Delete specific lore entries by index."""
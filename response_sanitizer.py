@@ -6,6 +6,8 @@ Cleans AI-generated responses by removing thinking tags, name prefixes, and arti
 import re
 import functools
 
+import logger as log
+
 # =============================================================================
 # PRE-COMPILED REGEX PATTERNS
 # =============================================================================
@@ -31,7 +33,6 @@ RE_RE_PREFIX = re.compile(r'^\s*\(RE:?\s+[^)]+\)\s*', re.IGNORECASE | re.MULTILI
 
 # Em-dash patterns
 RE_EM_DASH_BETWEEN_WORDS = re.compile(r'(\w)\s*—\s*(\w)')
-RE_EM_DASH_END = re.compile(r'—\s*$')
 
 # Additional reasoning formats (local LLMs)
 RE_REASONING_TAG = re.compile(r'<reasoning>.*?</reasoning>', re.DOTALL | re.IGNORECASE)
@@ -49,6 +50,10 @@ RE_XML_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
 RE_XML_DOCTYPE = re.compile(r'<!DOCTYPE.*?>', re.DOTALL | re.IGNORECASE)
 RE_GENERIC_MARKUP_TAG = re.compile(r'</?[A-Za-z][\w:-]*(?:\s+[^<>]*?)?\s*/?>')
 RE_MULTIPLE_NEWLINES = re.compile(r'\n{3,}')
+RE_TRAILING_LINE_SPACE = re.compile(r'[ \t]+\n')
+RE_LEADING_LINE_SPACE = re.compile(r'\n[ \t]+')
+RE_INLINE_SPACE_RUN = re.compile(r'[ \t]{2,}')
+RE_SPACE_BEFORE_PUNCT = re.compile(r'\s+([,.;!?])')
 RE_DISCORD_OOC_COMMENT = re.compile(r'(^|[ \t\r\n])//')
 RE_VISIBLE_USER_MENTION = re.compile(r'<@!?(\d+)>')
 RE_LEADING_EMOTE_STATE_MARKER = re.compile(
@@ -151,7 +156,6 @@ def remove_thinking_tags(text: str, character_name: str = None) -> str:
     # GLM SYSTEM: prefix reasoning format - AGGRESSIVE EXTRACTION
     # This handles cases where GLM ignores thinking:disabled and leaks reasoning
     if 'SYSTEM:' in text or 'Thinking Process' in text or 'Analyze the' in text:
-        import logger as log
         # Strategy: Extract the last substantial paragraph that doesn't look like reasoning
         paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
 
@@ -284,11 +288,9 @@ def remove_thinking_tags(text: str, character_name: str = None) -> str:
     # GLM draft spam detection - if response has many lines starting with "Name: "
     # this is GLM leaking its internal drafting process, extract just the last one
     if character_name:
-        draft_pattern = re.compile(rf'^{re.escape(character_name)}:\s*', re.MULTILINE | re.IGNORECASE)
-        draft_matches = list(draft_pattern.finditer(text))
+        draft_matches = list(_get_draft_prefix_pattern(character_name).finditer(text))
         if len(draft_matches) > 2:
             # Multiple drafts detected - extract content after the last "Name: " prefix
-            import logger as log
             log.warn(f"GLM draft spam detected ({len(draft_matches)} drafts), extracting final response")
             last_match = draft_matches[-1]
             # Get everything after the last "Name: " prefix
@@ -301,7 +303,6 @@ def remove_thinking_tags(text: str, character_name: str = None) -> str:
 
     # Log if we stripped significant content
     if len(text) < original_length * 0.5:
-        import logger as log
         log.debug(f"Stripped {original_length - len(text)} chars of thinking content (GLM leak)")
 
     return text.strip()
@@ -342,6 +343,12 @@ def remove_extended_thinking_artifacts(text: str) -> str:
     return text.strip()
 
 
+@functools.lru_cache(maxsize=32)
+def _get_draft_prefix_pattern(character_name: str) -> re.Pattern:
+    """Cache the compiled per-line "Name: " pattern used to spot GLM draft spam."""
+    return re.compile(rf'^{re.escape(character_name)}:\s*', re.MULTILINE | re.IGNORECASE)
+
+
 @functools.lru_cache(maxsize=32)
 def _get_character_name_patterns(character_name: str) -> tuple:
     """Cache compiled regex patterns for character name prefixes."""
@@ -414,10 +421,14 @@ def clean_emote_state_markers(text: str) -> str:
 
 def clean_em_dashes(text: str) -> str:
     """Replace em-dashes with appropriate punctuation."""
+    if '—' not in text:
+        return text
     # Mid-sentence em-dashes become ", "
     text = RE_EM_DASH_BETWEEN_WORDS.sub(r'\1, \2', text)
-    # End-sentence em-dashes become "-"
-    text = RE_EM_DASH_END.sub('-', text)
+    # End-sentence em-dashes become "-" (trailing whitespace after the dash is dropped)
+    stripped = text.rstrip()
+    if stripped.endswith('—'):
+        text = stripped[:-1] + '-'
     return text
 
 
@@ -432,10 +443,10 @@ def clean_markup_leakage(text: str) -> str:
     text = RE_XML_COMMENT.sub('', text)
     text = RE_XML_DOCTYPE.sub('', text)
     text = RE_GENERIC_MARKUP_TAG.sub('', text)
-    text = re.sub(r'[ \t]+\n', '\n', text)
-    text = re.sub(r'\n[ \t]+', '\n', text)
-    text = re.sub(r'[ \t]{2,}', ' ', text)
-    text = re.sub(r'\s+([,.;!?])', r'\1', text)
+    text = RE_TRAILING_LINE_SPACE.sub('\n', text)
+    text = RE_LEADING_LINE_SPACE.sub('\n', text)
+    text = RE_INLINE_SPACE_RUN.sub(' ', text)
+    text = RE_SPACE_BEFORE_PUNCT.sub(r'\1', text)
     text = RE_MULTIPLE_NEWLINES.sub('\n\n', text)
     return text.strip()
 
@@ -3,7 +3,6 @@ Discord Pals - Runtime Configuration
 Live-adjustable settings via the web dashboard.
 """
 
-import json
 import math
 import os
 import re
@@ -13,6 +12,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from config import RUNTIME_CONFIG_FILE, DATA_DIR
+import json_codec
 
 
 @dataclass(frozen=True)
@@ -312,9 +312,9 @@ def _load_config_from_disk() -> dict:
     ensure_data_dir()
     if os.path.exists(RUNTIME_CONFIG_FILE):
         try:
-            with open(RUNTIME_CONFIG_FILE, 'r', encoding='utf-8') as f:
-                return _normalize_config(json.load(f))
-        except (json.JSONDecodeError, IOError):
+            with open(RUNTIME_CONFIG_FILE, 'rb') as f:
+                return _normalize_config(json_codec.loads(f.read()))
+        except (json_codec.JSONDecodeError, IOError):
             pass
     return _normalize_config({})
 
@@ -352,8 +352,8 @@ def save_config(config: dict):
     config = _normalize_config(config)
     tmp_path = f"{RUNTIME_CONFIG_FILE}.tmp"
     try:
-        with open(tmp_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
+        with open(tmp_path, 'wb') as f:
+            f.write(json_codec.dumps(config, indent=2))
         os.replace(tmp_path, RUNTIME_CONFIG_FILE)
     except OSError:
         try:
@@ -57,6 +57,11 @@ def safe_filename(name: str, allowed_ext: Optional[str] = None) -> str:
     return safe
 
 
+# Names made only of these characters survive safe_filename() unchanged,
+# so safe_path() can skip sanitizing them (the containment check still runs).
+_is_plain_name = re.compile(r'[A-Za-z0-9_-]{1,64}\Z').match
+
+
 def safe_path(base_dir: Path, filename: str, allowed_ext: Optional[str] = None) -> Path:
     """
     Create a safe path that's guaranteed to be within the base directory.
@@ -72,7 +77,12 @@ def safe_path(base_dir: Path, filename: str, allowed_ext: Optional[str] = None)
     Raises:
         ValueError: If path traversal is detected or filename is invalid
     """
-    safe_name = safe_filename(filename, allowed_ext)
+    if filename and _is_plain_name(filename):
+        if allowed_ext and not allowed_ext.startswith('.'):
+            allowed_ext = f'.{allowed_ext}'
+        safe_name = f"{filename}{allowed_ext or ''}"
+    else:
+        safe_name = safe_filename(filename, allowed_ext)
 
     # Resolve both paths to absolute
     base_resolved = base_dir.resolve()
@@ -313,7 +313,7 @@ def check_providers_config(interactive: bool = True) -> Tuple[bool, List[str]]:
         
         # Validate JSON
         try:
-            with open(providers_file) as f:
+            with open(providers_file, encoding="utf-8") as f:
                 data = json.load(f)
             
             providers = data.get("providers", [])
@@ -6,13 +6,13 @@ With debounced saving to reduce disk I/O.
 
 import copy
 import heapq
-import json
 import os
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from config import DATA_DIR
 from constants import STATS_SAVE_INTERVAL
+import json_codec
 
 STATS_FILE = os.path.join(DATA_DIR, "stats.json")
 
@@ -40,15 +40,15 @@ class StatsManager:
         """Load stats from file."""
         if os.path.exists(STATS_FILE):
             try:
-                with open(STATS_FILE, 'r', encoding='utf-8') as f:
-                    stats = json.load(f)
+                with open(STATS_FILE, 'rb') as f:
+                    stats = json_codec.loads(f.read())
                     # Merge with defaults for any missing keys. Deep-copy so the
                     # nested containers are never shared with DEFAULT_STATS.
                     for key, value in DEFAULT_STATS.items():
                         if key not in stats:
                             stats[key] = copy.deepcopy(value)
                     return stats
-            except (json.JSONDecodeError, IOError):
+            except (json_codec.JSONDecodeError, IOError):
                 pass
 
         stats = copy.deepcopy(DEFAULT_STATS)
@@ -64,8 +64,9 @@ class StatsManager:
         os.makedirs(DATA_DIR, exist_ok=True)
         tmp_path = f"{STATS_FILE}.tmp"
         try:
-            with open(tmp_path, 'w', encoding='utf-8') as f:
-                json.dump(self.stats, f, indent=2)
+            # Only the bot reads stats.json back, so it is written compact
+            with open(tmp_path, 'wb') as f:
+                f.write(json_codec.dumps(self.stats))
             os.replace(tmp_path, STATS_FILE)
             self._dirty = False
             self._last_save = time.time()
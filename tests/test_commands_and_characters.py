@@ -1,3 +1,4 @@
+import os
 import tempfile
 import types
 import unittest
@@ -230,6 +231,37 @@ class CharacterDashboardTests(unittest.TestCase):
         self.assertEqual(data["conditional_user_contexts"][0]["included"], True)
         self.assertEqual(data["unused_sections"][0]["label"], "Notes")
 
+    def test_character_file_listing_rescans_only_after_directory_changes(self):
+        (self.characters_dir / "firefly.md").write_text("# Firefly\n", encoding="utf-8")
+        (self.characters_dir / "template.md").write_text("# Template\n", encoding="utf-8")
+
+        with patch.object(Path, "glob", autospec=True, side_effect=Path.glob) as glob:
+            first = dashboard_module.get_character_files()
+            first.append("mutated")
+            second = dashboard_module.get_character_files()
+            (self.characters_dir / "kafka.md").write_text("# Kafka\n", encoding="utf-8")
+            os.utime(self.characters_dir, ns=(0, self.characters_dir.stat().st_mtime_ns + 1))
+            third = dashboard_module.get_character_files()
+
+        self.assertEqual(second, ["firefly"])
+        self.assertEqual(sorted(third), ["firefly", "kafka"])
+        self.assertEqual(glob.call_count, 2)
+
+    def test_preview_api_reparses_character_only_after_file_changes(self):
+        path = self.characters_dir / "firefly.md"
+        path.write_text("## System Persona\n\nWarm.\n", encoding="utf-8")
+        manager = character_module.character_manager
+
+        with patch.object(manager, "load", wraps=manager.load) as load:
+            first = self.client.get("/api/preview/firefly").get_json()
+            self.client.get("/api/preview/firefly")
+            path.write_text("## System Persona\n\nWarm and observant.\n", encoding="utf-8")
+            changed = self.client.get("/api/preview/firefly").get_json()
+
+        self.assertEqual(load.call_count, 2)
+        self.assertIn("Warm.", first["prompt"])
+        self.assertIn("Warm and observant.", changed["prompt"])
+
     def test_new_character_scaffold_uses_explicit_schema(self):
         response = self.client.post(
             "/characters/new",
@@ -291,3 +323,30 @@ class CharacterDashboardTests(unittest.TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertEqual(saved, b"## Chatroom Context\nOne\n\nTwo")
         reload_prompts.assert_called_once()
+
+    def test_characters_page_reads_previews_per_file_and_keeps_listing_order(self):
+        for name in ("alpha", "beta", "gamma"):
+            (self.characters_dir / f"{name}.md").write_text(f"# {name}\n", encoding="utf-8")
+        (self.characters_dir / "broken.md").mkdir()
+
+        with patch.object(dashboard_module, "render_template", return_value="") as render:
+            self.client.get("/characters")
+
+        kwargs = render.call_args.kwargs
+        self.assertEqual(list(kwargs["characters"]), kwargs["character_list"])
+        self.assertEqual(kwargs["characters"]["beta"]["preview"], "# beta\n")
+        self.assertIn("error", kwargs["characters"]["broken"])
+
+    def test_characters_page_previews_head_and_reports_file_size(self):
+        body = "# Long\n\n" + ("x" * 2000)
+        (self.characters_dir / "long.md").write_text(body, encoding="utf-8")
+
+        page = self.client.get("/characters").get_data(as_text=True)
+
+        self.assertIn(body[:500] + "...", page)
+        self.assertNotIn(body[:501], page)
+        self.assertIn(f"{len(body.encode('utf-8'))} bytes", page)
+
+        with patch.object(Path, "stat", side_effect=AssertionError("path re-stat")):
+            card = dashboard_module._read_character_preview("long")
+        self.assertEqual(card["size"], len(body.encode("utf-8")))
@@ -1,8 +1,11 @@
+import gzip
 import json
 import unittest
+from unittest.mock import patch
 
 import module_stubs  # noqa: F401
 import dashboard as dashboard_module
+from dashboard_compression import gzip_response
 
 
 class DashboardAssetTests(unittest.TestCase):
@@ -35,3 +38,79 @@ class DashboardAssetTests(unittest.TestCase):
                 "/static/web-app-manifest-512x512.png",
             ],
         )
+
+    def test_small_assets_are_served_from_memory_with_revalidation(self):
+        self.assertIn("favicon.ico", dashboard_module._static_assets.assets)
+        self.assertNotIn("banner.jpg", dashboard_module._static_assets.assets)
+
+        first = self.client.get("/static/favicon.ico")
+        etag = first.headers["ETag"]
+        repeat = self.client.get("/static/favicon.ico", headers={"If-None-Match": etag})
+        first.close()
+
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("max-age=", first.headers["Cache-Control"])
+        self.assertEqual(repeat.status_code, 304)
+
+    def test_large_and_missing_assets_fall_back_to_disk(self):
+        large = self.client.get("/static/banner.jpg")
+        missing = self.client.get("/static/nope.png")
+        large.close()
+
+        self.assertEqual(large.status_code, 200)
+        self.assertEqual(missing.status_code, 404)
+
+    def test_json_responses_are_compact_and_keep_insertion_order(self):
+        with dashboard_module.app.test_request_context("/"):
+            body = dashboard_module.jsonify({"zeta": 1, "alpha": [1, 2]}).get_data(as_text=True)
+
+        self.assertEqual(body, '{"zeta":1,"alpha":[1,2]}\n')
+
+    def test_direct_json_response_encodes_payload_and_status(self):
+        with dashboard_module.app.test_request_context("/"):
+            created = dashboard_module._json_response({"status": "ok", "n": 1}, 201)
+            cached = dashboard_module._json_response(b'{"cached":true}')
+
+        self.assertEqual((created.status_code, created.mimetype), (201, "application/json"))
+        self.assertEqual(created.get_json(), {"status": "ok", "n": 1})
+        self.assertEqual(cached.get_data(), b'{"cached":true}')
+
+    def test_templates_are_only_restatted_per_render_in_debug_mode(self):
+        self.assertFalse(dashboard_module.app.debug)
+        self.assertEqual(dashboard_module.app.config["TEMPLATES_AUTO_RELOAD"], dashboard_module.app.debug)
+        self.assertFalse(dashboard_module.app.jinja_env.auto_reload)
+
+    def test_template_csrf_token_is_generated_once_per_request(self):
+        csrf_token = dashboard_module.app.jinja_env.globals["csrf_token"]
+        with patch.object(dashboard_module, "generate_csrf_token", return_value="token") as generate:
+            with dashboard_module.app.test_request_context("/"):
+                first = csrf_token()
+                second = csrf_token()
+            with dashboard_module.app.test_request_context("/"):
+                csrf_token()
+
+        self.assertEqual((first, second), ("token", "token"))
+        self.assertEqual(generate.call_count, 2)
+
+    def test_pages_are_gzipped_only_for_clients_that_accept_it(self):
+        plain = self.client.get("/")
+        zipped = self.client.get("/", headers={"Accept-Encoding": "gzip, deflate"})
+        icon = self.client.get("/static/favicon.ico", headers={"Accept-Encoding": "gzip"})
+
+        self.assertNotIn("Content-Encoding", plain.headers)
+        self.assertEqual(zipped.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", zipped.headers["Vary"])
+        self.assertEqual(gzip.decompress(zipped.get_data()), plain.get_data())
+        self.assertNotIn("Content-Encoding", icon.headers)
+
+    def test_gzip_weakens_etag_and_skips_small_bodies(self):
+        with dashboard_module.app.test_request_context("/", headers={"Accept-Encoding": "gzip"}):
+            large = dashboard_module._json_response({"items": ["x" * 40] * 100})
+            large.set_etag("abc")
+            small = dashboard_module._json_response({"ok": True})
+            large = gzip_response(large)
+            small = gzip_response(small)
+
+        self.assertEqual(large.headers["ETag"], 'W/"abc"')
+        self.assertEqual(json.loads(gzip.decompress(large.get_data()))["items"][0], "x" * 40)
+        self.assertNotIn("Content-Encoding", small.headers)
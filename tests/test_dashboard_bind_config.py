@@ -1,8 +1,12 @@
+import sys
+import threading
+import types
 import unittest
 from unittest.mock import patch
 
 import module_stubs  # noqa: F401
 import config as config_module
+import dashboard as dashboard_module
 
 
 class DashboardPortConfigTests(unittest.TestCase):
@@ -48,5 +52,27 @@ class DashboardPortConfigTests(unittest.TestCase):
         self.assertEqual(config_module.METRICS_HOST, "127.0.0.1")
 
 
+class DashboardServerStartTests(unittest.TestCase):
+    def test_dashboard_runs_on_waitress_in_a_named_daemon_thread(self):
+        release = threading.Event()
+        calls = []
+
+        def serve(app, **kwargs):
+            calls.append((app, kwargs))
+            release.wait(5)
+
+        with patch.dict(sys.modules, {"waitress": types.SimpleNamespace(serve=serve)}), \
+                patch.object(dashboard_module.time, "sleep"), \
+                patch.object(dashboard_module, "bot_instances", []):
+            thread = dashboard_module.start_dashboard(host="127.0.0.1", port=5999)
+            release.set()
+        thread.join(5)
+
+        self.assertEqual(thread.name, "dashboard")
+        self.assertTrue(thread.daemon)
+        self.assertIs(calls[0][0], dashboard_module.app)
+        self.assertEqual(calls[0][1], {"host": "127.0.0.1", "port": 5999, "threads": 8})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,9 @@
+import io
 import json
+import os
 import tempfile
 import unittest
+import zipfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -318,6 +321,113 @@ class DashboardDiscordTokenTests(unittest.TestCase):
         self.assertIn("FIREFLY_DISCORD_TOKEN", html)
         self.assertIn("fly", html)
 
+    def test_bots_json_save_validates_before_writing_lf_utf8(self):
+        self.write_bots([{"name": "Old"}])
+        original = self.bots_file.read_bytes()
+
+        rejected = self.client.post(
+            "/settings/bots/save",
+            data={"content": "{not json", "csrf_token": "test-csrf"},
+        )
+        self.assertEqual(rejected.status_code, 302)
+        self.assertIn("error=", rejected.headers["Location"])
+        self.assertEqual(self.bots_file.read_bytes(), original)
+
+        saved = self.client.post(
+            "/settings/bots/save",
+            data={"content": '{\r\n  "bots": [{"name": "Fírefly"}]\r\n}', "csrf_token": "test-csrf"},
+        )
+        self.assertEqual(saved.status_code, 302)
+        self.assertEqual(self.bots_file.read_bytes(), '{\n  "bots": [{"name": "Fírefly"}]\n}'.encode("utf-8"))
+
+    def test_config_import_streams_whitelisted_entries_only(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("bots.json", '{"bots": []}')
+            zf.writestr("autonomous.json", '{"1": 0.5}')
+            zf.writestr("../providers.json", "{}")
+            zf.writestr("notes.txt", "skip")
+        archive.seek(0)
+        data_dir = Path(self.temp_dir.name) / "bot_data"
+
+        original_cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        try:
+            with patch.object(dashboard_module, "DATA_DIR", data_dir):
+                response = self.client.post(
+                    "/settings/import",
+                    data={"config_zip": (archive, "config.zip"), "csrf_token": "test-csrf"},
+                    content_type="multipart/form-data",
+                )
+        finally:
+            os.chdir(original_cwd)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.bots_file.read_text(encoding="utf-8"), '{"bots": []}')
+        self.assertEqual((data_dir / "autonomous.json").read_text(encoding="utf-8"), '{"1": 0.5}')
+        self.assertFalse((Path(self.temp_dir.name) / "providers.json").exists())
+        self.assertFalse((Path(self.temp_dir.name) / "notes.txt").exists())
+
+    def test_config_text_cache_reuses_body_until_saved(self):
+        self.write_bots([{"name": "Old"}])
+        first = dashboard_module._read_text_cached(self.bots_file)
+
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            self.assertEqual(dashboard_module._read_text_cached(self.bots_file), first)
+
+        self.client.post(
+            "/settings/bots/save",
+            data={"content": '{"bots": [{"name": "New"}]}', "csrf_token": "test-csrf"},
+        )
+
+        self.assertEqual(dashboard_module._read_text_cached(self.bots_file), '{"bots": [{"name": "New"}]}')
+        self.assertIsNone(dashboard_module._read_text_cached(self.bots_file.with_name("missing.json")))
+
+    def test_config_page_reuses_parsed_providers_until_file_is_saved(self):
+        providers_file = Path(self.temp_dir.name) / "providers.json"
+        providers_file.write_text('{"providers": [{"name": "Main"}]}', encoding="utf-8")
+
+        with patch.object(dashboard_module, "PROVIDERS_FILE", providers_file), \
+                patch.object(dashboard_module.app_config, "reload_providers"):
+            first = dashboard_module._providers_json_snapshot()
+            self.assertIs(dashboard_module._providers_json_snapshot(), first)
+            dashboard_module._save_providers_json({"providers": [{"name": "Backup"}]})
+            saved = dashboard_module._providers_json_snapshot()
+
+        self.assertEqual(first["providers"][0]["name"], "Main")
+        self.assertEqual(saved["providers"][0]["name"], "Backup")
+
+    def test_failed_config_save_leaves_previous_file_and_no_temp_file(self):
+        self.bots_file.write_text('{"bots": []}', encoding="utf-8")
+
+        with patch.object(dashboard_module.os, "replace", side_effect=OSError("disk full")):
+            self.client.post(
+                "/settings/bots/save",
+                data={"content": '{"bots": [{"name": "New"}]}', "csrf_token": "test-csrf"},
+            )
+
+        self.assertEqual(self.bots_file.read_text(encoding="utf-8"), '{"bots": []}')
+        self.assertEqual([path.name for path in Path(self.temp_dir.name).glob("*bots.json*")], ["bots.json"])
+
+    def test_concurrent_saves_of_one_file_use_separate_temp_files(self):
+        self.bots_file.write_text('{"bots": []}', encoding="utf-8")
+        os.chmod(self.bots_file, 0o644)
+        temp_paths = []
+        real_replace = os.replace
+
+        def record_replace(src, dst):
+            temp_paths.append(src)
+            real_replace(src, dst)
+
+        with patch.object(dashboard_module.os, "replace", side_effect=record_replace):
+            dashboard_module._atomic_write_bytes(self.bots_file, b'{"bots": [1]}')
+            dashboard_module._atomic_write_bytes(self.bots_file, b'{"bots": [2]}')
+
+        self.assertEqual(len(set(temp_paths)), 2)
+        self.assertNotIn(f"{self.bots_file}.tmp", temp_paths)
+        self.assertEqual(self.bots_file.read_bytes(), b'{"bots": [2]}')
+        self.assertEqual(self.bots_file.stat().st_mode & 0o777, 0o644)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -41,6 +41,14 @@ class DashboardHealthProbeTests(unittest.TestCase):
             self.assertEqual(response.status_code, 302)
             self.assertIn("/login", response.headers["Location"])
 
+    def test_static_paths_stay_open_when_auth_is_enabled(self):
+        with patch.dict("os.environ", {"DASHBOARD_PASS": "secret"}, clear=False):
+            asset = self.client.get("/static/favicon.ico")
+            missing = self.client.get("/static/nested/missing.png")
+
+        self.assertEqual(asset.status_code, 200)
+        self.assertEqual(missing.status_code, 404)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -283,6 +283,13 @@ class DashboardMemoryApiTests(MemorySandboxMixin, unittest.TestCase):
         self.assertEqual(len(self.manager.auto_memories[key]), 1)
         self.assertEqual(self.manager.auto_memories[key][0]["entry_type"], "profile")
 
+    def test_raw_memory_editor_shows_empty_object_for_missing_store(self):
+        with patch.object(dashboard_module, "render_template", return_value="") as render:
+            response = self.client.get("/memories/missing_store/edit")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(render.call_args.kwargs["content"], "{}")
+
     def test_raw_unified_memory_editor_is_read_only_and_save_is_blocked(self):
         key = "server:123:user:456"
         self.manager.add_auto_memory(123, 456, "Alice likes tea", user_name="Alice")
@@ -291,6 +298,15 @@ class DashboardMemoryApiTests(MemorySandboxMixin, unittest.TestCase):
         page = self.client.get("/memories/auto_memories/edit").get_data(as_text=True)
         self.assertIn("readonly", page)
         self.assertIn("This unified memory store is read-only here.", page)
+        self.assertIn('data-raw-url="/api/memories/auto_memories/raw"', page)
+        self.assertNotIn("Alice likes tea", page)
+
+        raw = self.client.get("/api/memories/auto_memories/raw")
+        self.assertEqual(raw.mimetype, "application/json")
+        self.assertEqual(raw.get_json()[key][0]["content"], "Alice likes tea")
+        revalidated = self.client.get("/api/memories/auto_memories/raw", headers={"If-None-Match": raw.headers["ETag"]})
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(self.client.get("/api/memories/legacy/raw").status_code, 410)
         self.assertNotIn("Save Changes", page)
 
         response = self.client.post(
@@ -374,6 +390,44 @@ class DashboardMemoryApiTests(MemorySandboxMixin, unittest.TestCase):
         self.assertEqual([entry["entry_type"] for entry in self.manager.auto_memories[key]], ["profile", "pending"])
         self.assertEqual(len(self.manager.manual_lore["user:456"]), 1)
 
+    def test_deduplicate_rejects_exact_repeats_without_similarity_scan(self):
+        self.manager.manual_lore["user:456"] = [
+            self.manager._build_lore_entry("Alice is trusted", added_by="test"),
+            self.manager._build_lore_entry("alice IS trusted!", added_by="test"),
+            self.manager._build_lore_entry("Alice keeps a garden", added_by="test"),
+            self.manager._build_lore_entry("Alice is trusted", added_by="test"),
+        ]
+
+        with patch.object(dashboard_module, "_is_duplicate_memory", wraps=dashboard_module._is_duplicate_memory) as is_duplicate:
+            data = self.client.post("/api/memories/deduplicate", json={}, headers=self.csrf_headers()).get_json()
+
+        self.assertEqual(data["removed"], 2)
+        self.assertEqual(is_duplicate.call_count, 2)
+        self.assertEqual(
+            [entry["content"] for entry in self.manager.manual_lore["user:456"]],
+            ["Alice is trusted", "Alice keeps a garden"],
+        )
+
+    def test_deduplicate_fuzzy_scan_only_checks_recent_kept_entries(self):
+        contents = [
+            "Alice keeps a garden",
+            "Bob repairs old radios",
+            "Carol teaches violin lessons",
+            "Dave climbs mountains every summer",
+            "Alice keeps a garden",
+        ]
+        self.manager.manual_lore["user:456"] = [
+            self.manager._build_lore_entry(content, added_by="test") for content in contents
+        ]
+
+        with patch.object(dashboard_module, "_DEDUPE_FUZZY_WINDOW", 2), \
+                patch.object(dashboard_module, "_is_duplicate_memory", wraps=dashboard_module._is_duplicate_memory) as is_duplicate:
+            data = self.client.post("/api/memories/deduplicate", json={}, headers=self.csrf_headers()).get_json()
+
+        self.assertEqual(data["removed"], 1)
+        self.assertLessEqual(max(len(call.args[1]) for call in is_duplicate.call_args_list), 2)
+        self.assertEqual([entry["content"] for entry in self.manager.manual_lore["user:456"]], contents[:4])
+
     def test_retired_legacy_memory_file_mutation_endpoints_return_410(self):
         self.write_json("user_profiles.json", {"456": [{"content": "legacy"}]})
 
@@ -420,6 +474,42 @@ class DashboardMemoryApiTests(MemorySandboxMixin, unittest.TestCase):
         self.assertIn("user:999", self.manager.manual_lore)
         self.assertIn("server:123", self.manager.manual_lore)
 
+    def test_memory_write_apis_reject_oversized_and_non_json_bodies(self):
+        oversized = "x" * (dashboard_module._SMALL_JSON_BODY_LIMIT + 1)
+
+        too_large = self.client.post(
+            "/api/memories/add", json={"type": "lore", "guild_id": 123, "content": oversized}, headers=self.csrf_headers()
+        )
+        lore_too_large = self.client.post("/api/lore/123", json={"content": oversized}, headers=self.csrf_headers())
+        not_json = self.client.post(
+            "/api/memories/add", data="content=hi", content_type="text/plain", headers=self.csrf_headers()
+        )
+        added = self.client.post(
+            "/api/memories/add", json={"type": "lore", "guild_id": 123, "content": "Tea House"}, headers=self.csrf_headers()
+        )
+
+        self.assertEqual((too_large.status_code, lore_too_large.status_code), (413, 413))
+        self.assertEqual(not_json.status_code, 400)
+        self.assertEqual(added.status_code, 200)
+        self.assertEqual([entry["content"] for entry in self.manager.manual_lore["server:123"]], ["Tea House"])
+
+    def test_legacy_lore_api_adds_replaces_and_clears_server_lore(self):
+        headers = self.csrf_headers()
+        self.client.post("/api/lore/123", json={"content": "Tea is served at noon"}, headers=headers)
+        self.client.post("/api/lore/123", json={"content": "Cats allowed"}, headers=headers)
+        self.client.post("/api/lore/123", json={"content": "Only tea", "replace": True}, headers=headers)
+        replaced_response = self.client.get("/api/lore/123")
+        replaced = replaced_response.get_json()
+        unchanged = self.client.get("/api/lore/123", headers={"If-None-Match": replaced_response.headers["ETag"]})
+        cleared = self.client.delete("/api/lore/123", headers=headers)
+        after_clear = self.client.get("/api/lore/123", headers={"If-None-Match": replaced_response.headers["ETag"]})
+
+        self.assertEqual(replaced["lore"], "- Only tea")
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(after_clear.status_code, 200)
+        self.assertEqual(cleared.status_code, 200)
+        self.assertNotIn("server:123", self.manager.manual_lore)
+
     def test_memory_target_lists_only_include_active_users(self):
         self.manager.add_auto_memory(123, 456, "Alice likes tea", user_name="Alice", server_name="Tea House")
         self.manager.add_auto_memory(123, 999, "Bob likes coffee", user_name="Bob", server_name="Tea House")
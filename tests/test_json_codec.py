@@ -0,0 +1,107 @@
+import json
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import patch
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+import module_stubs  # noqa: F401
+import dashboard_json
+import discord_utils as discord_utils_module
+import env_config
+import json_codec
+from dashboard_json import OrjsonProvider
+
+
+class JsonCodecTests(unittest.TestCase):
+    def test_indented_dump_matches_stdlib_layout_with_int_keys(self):
+        data = {"123": [{"content": "Fírefly", "n": 1}], 456: {}, "empty": []}
+
+        expected = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+        self.assertEqual(json_codec.dumps(data, indent=2), expected)
+
+    def test_stdlib_fallback_matches_orjson_output(self):
+        data = {"a": [1, 2], "b": {"c": None}}
+
+        fast = json_codec.dumps(data, indent=2)
+        with patch.object(json_codec, "orjson", None):
+            fallback = json_codec.dumps(data, indent=2)
+            compact = json_codec.dumps(data)
+
+        self.assertEqual(fast, fallback)
+        self.assertEqual(compact, b'{"a":[1,2],"b":{"c":null}}')
+
+    def test_oversized_integers_fall_back_to_stdlib(self):
+        self.assertEqual(json_codec.dumps({"id": 2 ** 70}), b'{"id":1180591620717411303424}')
+
+    def test_invalid_json_raises_stdlib_decode_error(self):
+        with self.assertRaises(json.JSONDecodeError):
+            json_codec.validate("{not json")
+        with self.assertRaises(json.JSONDecodeError):
+            json_codec.validate(b'{"bots": [}')
+        json_codec.validate('{"name": "Fírefly"}'.encode("utf-8"))
+
+    def test_safe_json_save_round_trips_through_codec(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = str(Path(temp_dir) / "store.json")
+            self.assertTrue(discord_utils_module.safe_json_save(path, {"k": ["é"]}))
+
+            self.assertEqual(discord_utils_module.safe_json_load(path), {"k": ["é"]})
+            self.assertEqual(Path(path).read_text(encoding="utf-8"), '{\n  "k": [\n    "é"\n  ]\n}')
+
+    def test_safe_json_load_returns_default_for_corrupt_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "broken.json"
+            path.write_bytes(b'{"k": [')
+
+            self.assertEqual(discord_utils_module.safe_json_load(str(path), {"fallback": True}), {"fallback": True})
+
+    def test_bots_json_round_trips_through_codec_and_reports_corruption(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "bots.json"
+            env_config.write_bots_json_payload({"bots": [{"name": "Fírefly", "token_env": "FIREFLY_TOKEN"}]}, path)
+
+            data, error = env_config.load_bots_json_data(path)
+            self.assertIsNone(error)
+            self.assertEqual(data["bots"][0]["name"], "Fírefly")
+            self.assertTrue(path.read_bytes().endswith(b"}\n"))
+
+            path.write_bytes(b'{"bots": [')
+            data, error = env_config.load_bots_json_data(path)
+            self.assertEqual(data, {"bots": []})
+            self.assertTrue(error.startswith("Invalid bots.json"))
+            self.assertEqual(env_config.load_bot_token_targets(path), [])
+
+    def test_orjson_provider_matches_flask_default_encoding(self):
+        app = Flask(__name__)
+        provider = OrjsonProvider(app)
+        default = DefaultJSONProvider(app)
+        data = {"b": [1, 2.5, None], "a": {"when": datetime(2026, 1, 2, tzinfo=timezone.utc)}, "c": Decimal("1.5")}
+
+        self.assertEqual(json.loads(provider.dumps(data)), json.loads(default.dumps(data)))
+        self.assertEqual(provider.dumps(data, indent=2), default.dumps(data, indent=2, ensure_ascii=False))
+        self.assertEqual(provider.loads(b'{"k": [1]}'), {"k": [1]})
+        with patch.object(dashboard_json, "orjson", None):
+            self.assertEqual(provider.dumps({"é": 1}), default.dumps({"é": 1}))
+
+    def test_orjson_provider_response_matches_flask_default_body(self):
+        app = Flask(__name__)
+        provider = OrjsonProvider(app)
+        default = DefaultJSONProvider(app)
+        data = {"channels": [{"id": 10, "name": "shared"}], "by_id": {10: "shared"}}
+
+        with app.app_context():
+            response = provider.response(data)
+            expected = default.response({"channels": data["channels"], "by_id": {"10": "shared"}})
+
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.get_data(), expected.get_data())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
 import json
 import tempfile
 import unittest
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import logger as logger_module
 import dashboard_provider_health
@@ -86,6 +88,18 @@ class LoggingDiagnosticsTests(unittest.TestCase):
         self.assertNotIn("super-secret-token", persisted)
         self.assertNotIn("abcdefghijklmnopqrstuvwxyz", persisted)
 
+    def test_buffer_timestamps_share_one_clock_and_disabled_file_log_is_skipped(self):
+        logger_module.configure_file_logging(enabled=False)
+        with patch.object(logger_module, "_write_file_log") as write_file_log:
+            logger_module.info("Quiet entry")
+
+        entry = logger_module.get_logs_after(0)["entries"][0]
+        local = datetime.strptime(entry["time"], "%H:%M:%S")
+        utc = datetime.fromisoformat(entry["ts"]).astimezone()
+
+        write_file_log.assert_not_called()
+        self.assertEqual((utc.hour, utc.minute, utc.second), (local.hour, local.minute, local.second))
+
     def test_log_filters_match_top_level_and_field_values(self):
         logger_module.info("Routing", component="routing", event="message_received", req_id="req1")
         logger_module.info("Provider", component="provider", event="provider_response", req_id="req2", tier="primary")
@@ -1,5 +1,6 @@
 import asyncio
 import unittest
+from unittest.mock import patch
 
 import module_stubs  # noqa: F401
 import memory as memory_module
@@ -93,6 +94,46 @@ class MemoryManagerPersistenceTests(MemorySandboxMixin, unittest.TestCase):
         self.assertEqual(entry["added_by"], "dashboard")
         self.assertTrue(entry["fingerprint"])
 
+    def test_replace_lore_swaps_entries_with_one_dirty_mark(self):
+        self.manager.add_lore("server", 123, "Old rule one")
+        self.manager.add_lore("server", 123, "Old rule two")
+
+        with patch.object(self.manager, "_mark_dirty") as mark_dirty:
+            replaced = self.manager.replace_lore("server", 123, "New rule", added_by="dashboard")
+
+        self.assertTrue(replaced)
+        mark_dirty.assert_called_once_with("lore")
+        self.assertEqual([entry["content"] for entry in self.manager.manual_lore["server:123"]], ["New rule"])
+        self.assertTrue(self.manager.replace_lore("server", 123, ""))
+        self.assertNotIn("server:123", self.manager.manual_lore)
+        self.assertFalse(self.manager.replace_lore("server", 123, ""))
+        self.assertFalse(self.manager.replace_lore("planet", 1, "Nope"))
+
+    def test_batched_saves_write_each_dirty_store_once_at_block_end(self):
+        self.manager.add_lore("user", 1, "Likes tea")
+        self.manager.add_lore("user", 2, "Likes maps")
+        self.manager.add_lore("user", 3, "Likes rain")
+        self.manager.flush()
+        self.manager._last_save = 0.0
+
+        with patch.object(memory_module, "safe_json_save", return_value=True) as save:
+            with self.manager.batched_saves():
+                for key in ("user:1", "user:2", "user:3"):
+                    self.manager.clear_lore(key)
+                save.assert_not_called()
+
+        self.assertEqual([call.args[0] for call in save.call_args_list], [memory_module.MANUAL_LORE_FILE])
+        self.assertEqual(self.manager.manual_lore, {})
+
+    def test_lore_getters_format_entries_and_return_empty_for_missing_targets(self):
+        self.manager.add_lore("server", 123, "Tea at noon")
+        self.manager.add_lore("server", 123, "Cats welcome")
+        self.manager.add_lore("bot", "Firefly", "Likes stargazing")
+
+        self.assertEqual(self.manager.get_server_lore(123), "- Tea at noon\n- Cats welcome")
+        self.assertEqual(self.manager.get_bot_lore("Firefly"), "- Likes stargazing")
+        self.assertEqual(self.manager.get_user_lore(456), "")
+
     def test_load_normalization_backfills_flags_and_ids_without_losing_metadata(self):
         self.write_json("auto_memories.json", {
             "server:1:user:2": [{
@@ -1,3 +1,4 @@
+import asyncio
 import types
 import unittest
 from contextlib import ExitStack
@@ -5,6 +6,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import module_stubs  # noqa: F401
 import bot_instance as bot_instance_module
+import discord_utils as discord_utils_module
 
 
 class MessageVisualContextTests(unittest.IsolatedAsyncioTestCase):
@@ -104,3 +106,89 @@ class MessageVisualContextTests(unittest.IsolatedAsyncioTestCase):
         final_message = context["messages_for_api"][-1]
         self.assertIsInstance(final_message["content"], list)
         self.assertTrue(any(part.get("type") == "image_url" for part in final_message["content"]))
+
+    async def test_process_attachments_maps_image_extensions_to_mime_types(self):
+        message = types.SimpleNamespace(
+            content="look",
+            attachments=[
+                types.SimpleNamespace(filename="Photo.JPG", url="https://cdn/photo"),
+                types.SimpleNamespace(filename="notes.txt", url="https://cdn/notes"),
+                types.SimpleNamespace(filename="webp", url="https://cdn/bare"),
+            ],
+        )
+        download = AsyncMock(return_value="DATA")
+
+        with patch.object(discord_utils_module, "download_image_as_base64", download):
+            parts = await discord_utils_module.process_attachments(message)
+
+        download.assert_awaited_once_with("https://cdn/photo")
+        self.assertEqual(parts[1]["image_url"]["url"], "data:image/jpeg;base64,DATA")
+
+    async def test_process_attachments_downloads_images_concurrently_in_order(self):
+        message = types.SimpleNamespace(
+            content="",
+            attachments=[
+                types.SimpleNamespace(filename="a.png", url="slow"),
+                types.SimpleNamespace(filename="b.gif", url="fast"),
+            ],
+        )
+        started = []
+        both_started = asyncio.Event()
+
+        async def download(url):
+            started.append(url)
+            if len(started) == 2:
+                both_started.set()
+            # Neither download can finish until the other has started
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return url.upper()
+
+        with patch.object(discord_utils_module, "download_image_as_base64", download):
+            parts = await discord_utils_module.process_attachments(message)
+
+        self.assertEqual(
+            [part["image_url"]["url"] for part in parts[1:]],
+            ["data:image/png;base64,SLOW", "data:image/gif;base64,FAST"],
+        )
+
+    async def test_download_image_streams_chunks_and_skips_oversized_bodies(self):
+        class FakeResponse:
+            status = 200
+
+            def __init__(self, chunks, content_length=None):
+                self.content_length = content_length
+                self.content = types.SimpleNamespace(iter_chunked=lambda size: self._iter(chunks))
+
+            async def _iter(self, chunks):
+                for chunk in chunks:
+                    yield chunk
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        responses = {
+            "ok": FakeResponse([b"ab", b"c"]),
+            "declared": FakeResponse([b"x"], content_length=9),
+            "streamed": FakeResponse([b"xxxx", b"xxxx", b"xxxx"]),
+        }
+        session = types.SimpleNamespace(get=lambda url: responses[url])
+
+        with patch.object(discord_utils_module, "get_http_session", AsyncMock(return_value=session)), \
+                patch.object(discord_utils_module, "_IMAGE_DOWNLOAD_MAX_BYTES", 8), \
+                patch.object(discord_utils_module.log, "warn"):
+            results = [await discord_utils_module.download_image_as_base64(url) for url in responses]
+
+        self.assertEqual(results, ["YWJj", None, None])
+
+    async def test_add_reactions_resolves_cached_custom_emojis_once_each(self):
+        wave = types.SimpleNamespace(name="wave")
+        guild = types.SimpleNamespace(id=6060, emojis=())
+        message = types.SimpleNamespace(add_reaction=AsyncMock())
+
+        with patch.dict(discord_utils_module._emoji_cache, {guild.id: {"wave": wave}}):
+            await discord_utils_module.add_reactions(message, [":wave:", "👍", ":wave:"], guild)
+
+        self.assertEqual([call.args[0] for call in message.add_reaction.await_args_list], [wave, "👍"])
@@ -3,6 +3,8 @@ import json
 import tempfile
 import types
 import unittest
+import zipfile
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -10,8 +12,10 @@ import module_stubs  # noqa: F401
 import dashboard as dashboard_module
 import discord_utils as discord_utils_module
 import logger as logger_module
+import memory as memory_module
 import request_queue as request_queue_module
 import runtime_config as runtime_config_module
+import security as security_module
 from scopes import ScopeKey
 
 from test_support import MemorySandboxMixin
@@ -606,6 +610,339 @@ class DashboardPerformanceApiTests(MemorySandboxMixin, unittest.TestCase):
         self.assertEqual({channel["id"] for channel in data["channels"]}, {10, 20})
         self.assertEqual(len(data["channels"]), 2)
 
+    def test_api_guilds_reuses_payload_for_the_same_topology_snapshot(self):
+        with patch.object(dashboard_module.json_codec, "dumps", wraps=dashboard_module.json_codec.dumps) as dumps:
+            first = self.client.get("/api/guilds").get_json()
+            self.client.get("/api/guilds")
+            dashboard_module._get_visible_topology(force_refresh=True)
+            self.client.get("/api/guilds")
+
+        self.assertEqual(dumps.call_count, 2)
+        self.assertEqual(len(first["guilds"]), len({guild["id"] for guild in first["guilds"]}))
+        self.assertIn("member_count", first["guilds"][0])
+
+    def test_status_payload_reads_runtime_flags_from_one_config_snapshot(self):
+        with patch.object(runtime_config_module, "get", wraps=runtime_config_module.get) as get, \
+                patch.object(runtime_config_module, "load_config", wraps=runtime_config_module.load_config) as load:
+            payload = dashboard_module._build_status_payload()
+
+        self.assertEqual(get.call_count, 0)
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(payload["use_single_user"], runtime_config_module.get("use_single_user", True))
+
+    def test_api_status_reuses_body_within_ttl_and_answers_etag_with_not_modified(self):
+        dashboard_module._status_body_cache["entry"] = (0.0, None, b"", "")
+        with patch.object(dashboard_module, "_build_status_payload",
+                          wraps=dashboard_module._build_status_payload) as build:
+            first = self.client.get("/api/status")
+            cached = self.client.get("/api/status", headers={"If-None-Match": first.headers["ETag"]})
+            runtime_config_module.invalidate_cache()
+            rebuilt = self.client.get("/api/status")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers["Cache-Control"], "private, max-age=1")
+        self.assertIn("bots", first.get_json())
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(rebuilt.status_code, 200)
+        self.assertEqual(build.call_count, 2)
+
+    def test_config_page_lists_autonomous_channels_each_bot_can_see(self):
+        manager = discord_utils_module.autonomous_manager
+        with patch.dict(manager.enabled_channels, {10: 0.1, 20: 0.1, 999: 0.1}, clear=True), \
+                patch.object(dashboard_module, "render_template", return_value="") as render:
+            self.client.get("/config")
+
+        bots = {bot["name"]: bot["auto_channels"] for bot in render.call_args.kwargs["bots"]}
+        self.assertEqual([channel["id"] for channel in bots["Nahida"]], [10, 20])
+        self.assertEqual(bots["Nilou"], [{"id": 10, "name": "shared", "guild": "Guild One"}])
+
+    def test_memories_page_lists_each_guild_once_without_lore_lookups(self):
+        with patch.object(self.manager, "get_lore", side_effect=AssertionError("lore lookup")):
+            response = self.client.get("/memories")
+
+        page = response.get_data(as_text=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(page.count('<option value="1">Guild One</option>'), 4)
+
+    def test_unchanged_permanent_session_is_not_resent_on_each_request(self):
+        with self.client.session_transaction() as session:
+            session.permanent = True
+            session["logged_in"] = True
+
+        polled = self.client.get("/healthz")
+        logged_out = self.client.get("/logout")
+
+        self.assertNotIn("Set-Cookie", polled.headers)
+        self.assertIn("Set-Cookie", logged_out.headers)
+
+    def test_api_guilds_answers_matching_etag_with_not_modified(self):
+        first = self.client.get("/api/guilds")
+        etag = first.headers["ETag"]
+        cached = self.client.get("/api/guilds", headers={"If-None-Match": etag})
+        stale = self.client.get("/api/guilds", headers={"If-None-Match": '"stale"'})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.data, b"")
+        self.assertEqual(stale.status_code, 200)
+        self.assertEqual(stale.headers["ETag"], etag)
+
+    def test_autonomous_should_respond_rolls_before_reading_the_clock(self):
+        with patch.object(discord_utils_module, "safe_json_load", return_value={}):
+            manager = discord_utils_module.AutonomousManager()
+        with patch.object(manager, "_save"):
+            manager.set_channel(7, True, 0.5, 1)
+
+        with patch.object(discord_utils_module.random, "random", return_value=0.9), \
+                patch.object(discord_utils_module.time, "monotonic") as monotonic:
+            self.assertFalse(manager.should_respond(7))
+            monotonic.assert_not_called()
+
+        with patch.object(discord_utils_module.random, "random", return_value=0.1), \
+                patch.object(discord_utils_module.time, "monotonic", side_effect=[100.0, 159.0, 160.0]):
+            self.assertTrue(manager.should_respond(7))
+            self.assertFalse(manager.should_respond(7))
+            self.assertTrue(manager.should_respond(7))
+        self.assertFalse(manager.should_respond(8))
+
+    def test_restart_queues_systemd_job_without_waiting_for_it(self):
+        class InlineThread:
+            def __init__(self, target, daemon=None):
+                self.target = target
+
+            def start(self):
+                self.target()
+
+        completed = Mock(returncode=0, stderr="")
+        with patch.object(dashboard_module.threading, "Thread", InlineThread), \
+                patch.object(dashboard_module.time, "sleep"), \
+                patch.object(dashboard_module.os.path, "exists", return_value=True), \
+                patch.object(dashboard_module.subprocess, "run", return_value=completed) as run, \
+                patch.object(discord_utils_module, "save_history"), \
+                patch.object(memory_module.memory_manager, "save_all"):
+            response = self.client.post("/api/restart", headers=self.csrf_headers())
+
+        self.assertEqual(response.status_code, 200)
+        run.assert_called_once()
+        self.assertEqual(run.call_args.args[0], ["systemctl", "--user", "restart", "--no-block", "discord-pals"])
+        self.assertEqual(run.call_args.kwargs["timeout"], 5)
+
+    def test_restart_without_systemd_waits_for_bot_closes_instead_of_sleeping(self):
+        class InlineThread:
+            def __init__(self, target, daemon=None):
+                self.target = target
+
+            def start(self):
+                self.target()
+
+        closed = Mock()
+        closed.result.return_value = None
+        bots = [types.SimpleNamespace(close=Mock(), client=types.SimpleNamespace(loop=None))]
+        with patch.object(dashboard_module.threading, "Thread", InlineThread), \
+                patch.object(dashboard_module, "bot_instances", bots), \
+                patch.object(dashboard_module.time, "sleep") as sleep, \
+                patch.object(dashboard_module.os.path, "exists", return_value=False), \
+                patch.object(dashboard_module.asyncio, "run_coroutine_threadsafe", return_value=closed), \
+                patch.object(dashboard_module.os, "execv") as execv, \
+                patch.object(discord_utils_module, "save_history"), \
+                patch.object(memory_module.memory_manager, "save_all"):
+            self.client.post("/api/restart", headers=self.csrf_headers())
+
+        closed.result.assert_called_once()
+        self.assertLessEqual(closed.result.call_args.kwargs["timeout"], dashboard_module._RESTART_CLOSE_TIMEOUT)
+        self.assertEqual([call.args for call in sleep.call_args_list], [(1,)])
+        execv.assert_called_once()
+
+    def test_channel_autonomous_get_reads_stored_whole_minute_cooldown(self):
+        saved = {"5": {"chance": 0.2, "cooldown": 3.5, "allow_bot_triggers": True}}
+        with patch.object(discord_utils_module, "safe_json_load", return_value=saved):
+            manager = discord_utils_module.AutonomousManager()
+
+        with patch.object(manager, "_save"), patch.object(discord_utils_module, "autonomous_manager", manager):
+            enabled = self.client.get("/api/channels/5/autonomous").get_json()
+            manager.set_channel(6, True, 0.5, 12)
+            clamped = manager.get_channel_settings(6)
+            manager.set_channel(6, False)
+            disabled = self.client.get("/api/channels/6/autonomous").get_json()
+
+        self.assertEqual((enabled["chance"], enabled["cooldown"], enabled["allow_bot_triggers"]), (20, 3, True))
+        self.assertIn("3min cooldown", manager.get_status(5))
+        self.assertIs(type(manager.cooldown_minutes[5]), int)
+        self.assertEqual(clamped, (0.5, 10, False))
+        self.assertEqual((disabled["enabled"], disabled["chance"], disabled["cooldown"]), (False, 5, 2))
+        self.assertNotIn(6, manager.cooldown_minutes)
+
+    def test_api_guilds_short_circuits_without_bots(self):
+        with patch.object(dashboard_module, "bot_instances", []), \
+                patch.object(dashboard_module, "_get_visible_topology") as topology:
+            response = self.client.get("/api/guilds")
+
+        topology.assert_not_called()
+        self.assertEqual(response.get_json(), {"guilds": []})
+
+    def test_guild_icon_url_is_rebuilt_only_when_icon_hash_changes(self):
+        built = []
+
+        class FakeAsset:
+            def __init__(self, key):
+                self.key = key
+
+            @property
+            def url(self):
+                built.append(self.key)
+                return f"https://cdn.example/icons/{self.key}.png"
+
+        guild = FakeGuild(991, "Icons", [])
+        guild.icon = FakeAsset("abc")
+        first = dashboard_module._guild_icon_url(guild)
+        self.assertEqual(dashboard_module._guild_icon_url(guild), first)
+        guild.icon = FakeAsset("def")
+        changed = dashboard_module._guild_icon_url(guild)
+        guild.icon = None
+
+        self.assertEqual(built, ["abc", "def"])
+        self.assertEqual(changed, "https://cdn.example/icons/def.png")
+        self.assertIsNone(dashboard_module._guild_icon_url(guild))
+
+    def test_topology_dedupes_shared_guilds_and_unions_their_channels(self):
+        shared_a = FakeGuild(1, "Shared", [FakeChannel(11, "general")])
+        shared_b = FakeGuild(1, "Shared", [FakeChannel(11, "general"), FakeChannel(12, "bots-only")])
+        solo = FakeGuild(2, "Solo", [FakeChannel(21, "lobby")])
+        bots = [
+            FakeBot("A", "Firefly", [shared_a]),
+            FakeBot("B", "Nahida", [solo, shared_b]),
+            FakeBot("C", "Nilou", [FakeGuild(3, "Offline", [])], ready=False),
+        ]
+
+        with patch.object(dashboard_module, "bot_instances", bots):
+            topology = dashboard_module._build_visible_topology()
+
+        self.assertEqual([guild["id"] for guild in topology["guilds"]], [1, 2])
+        self.assertEqual([channel["id"] for channel in topology["channels"]], [11, 21, 12])
+        self.assertEqual(topology["accessible_channel_ids"], {11, 12, 21})
+        self.assertEqual(topology["guild_names"], {1: "Shared", 2: "Solo"})
+
+    def test_channel_autonomous_post_clamps_chance_and_cooldown(self):
+        manager = discord_utils_module.autonomous_manager
+        with patch.object(manager, "set_channel") as set_channel:
+            for chance, cooldown, expected in ((0, 0, (0.01, 1)), (250, 30, (1.0, 10)), (40, 3, (0.4, 3))):
+                response = self.client.post(
+                    "/api/channels/10/autonomous",
+                    json={"enabled": True, "chance": chance, "cooldown": cooldown},
+                    headers=self.csrf_headers(),
+                )
+                self.assertEqual(response.get_json()["cooldown"], expected[1])
+                self.assertEqual(set_channel.call_args.args[2:4], expected)
+
+    def test_api_channels_reuses_managed_list_until_dashboard_write(self):
+        manager = discord_utils_module.autonomous_manager
+        with patch.object(dashboard_module, "_build_managed_channels", wraps=dashboard_module._build_managed_channels) as build, \
+                patch.object(manager, "set_nickname_trigger"):
+            self.client.get("/api/channels")
+            self.client.get("/api/channels")
+            self.assertEqual(build.call_count, 1)
+
+            self.client.post(
+                "/api/channels/10/nickname-trigger",
+                json={"enabled": True},
+                headers=self.csrf_headers(),
+            )
+            self.client.get("/api/channels")
+
+        self.assertEqual(build.call_count, 2)
+
+    def test_sanitize_error_message_strips_paths_and_secrets(self):
+        error = Exception(r"failed C:\Users\me\x.py and /home/me/app/x.py password: hunter2 Api-Key=abc")
+
+        self.assertEqual(
+            dashboard_module._sanitize_error_message(error),
+            "failed [path] and [path]/x.py password=[redacted] Api-Key=[redacted]",
+        )
+        self.assertEqual(len(dashboard_module._sanitize_error_message(Exception("x" * 500))), 200)
+
+    def test_managed_channels_merge_live_autonomous_and_history_state(self):
+        manager = discord_utils_module.autonomous_manager
+        with patch.object(manager, "enabled_channels", {10: 0.25}), \
+                patch.object(manager, "cooldown_minutes", {10: 4}), \
+                patch.object(manager, "allow_bot_triggers", {10: True}), \
+                patch.object(manager, "nickname_trigger_channels", {20: True}), \
+                patch.object(discord_utils_module, "conversation_history", {20: [{}, {}, {}]}):
+            channels = {channel["id"]: channel for channel in dashboard_module._build_managed_channels()}
+
+        self.assertEqual(
+            {key: channels[10][key] for key in ("autonomous", "auto_chance", "auto_cooldown", "allow_bot_triggers", "nickname_trigger", "history_count")},
+            {"autonomous": True, "auto_chance": 25, "auto_cooldown": 4, "allow_bot_triggers": True, "nickname_trigger": False, "history_count": 0},
+        )
+        self.assertEqual(
+            {key: channels[20][key] for key in ("autonomous", "auto_chance", "auto_cooldown", "allow_bot_triggers", "nickname_trigger", "history_count")},
+            {"autonomous": False, "auto_chance": 5, "auto_cooldown": 2, "allow_bot_triggers": False, "nickname_trigger": True, "history_count": 3},
+        )
+
+    def test_channels_page_and_api_share_one_channel_build(self):
+        with patch.object(dashboard_module, "_build_managed_channels", wraps=dashboard_module._build_managed_channels) as build, \
+                patch.object(dashboard_module, "render_template", return_value="") as render:
+            api_ids = [channel["id"] for channel in self.client.get("/api/channels").get_json()["channels"]]
+            self.client.get("/channels")
+
+        self.assertEqual(build.call_count, 1)
+        self.assertEqual(sorted(channel["id"] for channel in render.call_args.kwargs["channels"]), sorted(api_ids))
+
+    def test_export_spills_large_archives_to_disk_and_streams_them(self):
+        autonomous = json.dumps({str(i): {"chance": i} for i in range(200)})
+        (self.data_dir / "autonomous.json").write_text(autonomous, encoding="utf-8")
+
+        with patch.object(dashboard_module, "_EXPORT_SPOOL_MAX_BYTES", 16), \
+                patch.object(zipfile.zlib, "compressobj", wraps=zipfile.zlib.compressobj) as compressobj, \
+                patch.object(zipfile.ZipFile, "writestr", wraps=zipfile.ZipFile.writestr) as writestr:
+            response = self.client.get("/settings/export")
+            body = response.get_data()
+            response.close()
+
+        self.assertEqual(compressobj.call_args.args[0], dashboard_module._EXPORT_COMPRESS_LEVEL)
+        # Files are streamed from disk rather than read into a str first
+        writestr.assert_not_called()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/zip")
+        with zipfile.ZipFile(BytesIO(body)) as zf:
+            self.assertEqual(zf.read("autonomous.json").decode("utf-8"), autonomous)
+
+    def test_import_skips_entries_declared_larger_than_the_cap(self):
+        def upload(payload):
+            archive = BytesIO()
+            with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+                zf.writestr("autonomous.json", payload)
+            archive.seek(0)
+            return self.client.post(
+                "/settings/import",
+                data={"config_zip": (archive, "config.zip")},
+                content_type="multipart/form-data",
+                headers=self.csrf_headers(),
+            )
+
+        target = self.data_dir / "autonomous.json"
+        with patch.object(dashboard_module, "_IMPORT_MAX_ENTRY_BYTES", 32):
+            upload(json.dumps({"10": {"chance": 0.5}}))
+            self.assertEqual(json.loads(target.read_text(encoding="utf-8")), {"10": {"chance": 0.5}})
+            upload(json.dumps({str(i): {"chance": 0.5} for i in range(20)}))
+
+        self.assertEqual(json.loads(target.read_text(encoding="utf-8")), {"10": {"chance": 0.5}})
+
+    def test_channels_page_lists_autonomous_first_then_guild_and_channel_name(self):
+        managed = [
+            {"id": 1, "guild_name": "B", "name": "general", "autonomous": False},
+            {"id": 2, "guild_name": "A", "name": "zeta", "autonomous": True},
+            {"id": 3, "guild_name": "A", "name": "alpha", "autonomous": False},
+            {"id": 4, "guild_name": "A", "name": "beta", "autonomous": True},
+        ]
+
+        with patch.object(dashboard_module, "_build_managed_channels", return_value=managed), \
+                patch.object(dashboard_module, "render_template", return_value="") as render:
+            self.client.get("/channels")
+
+        ordered = render.call_args.kwargs["channels"]
+        self.assertEqual([channel["id"] for channel in ordered], [4, 2, 3, 1])
+
     def test_shared_navigation_exposes_update_indicator_on_non_dashboard_tabs(self):
         page = self.client.get("/characters").get_data(as_text=True)
 
@@ -627,6 +964,44 @@ class DashboardPerformanceApiTests(MemorySandboxMixin, unittest.TestCase):
         self.assertFalse(second_data["changed"])
         self.assertEqual(second_data["etag"], first_data["etag"])
 
+    def test_status_delta_etag_changes_with_status(self):
+        first = self.client.get("/api/status/delta").get_json()
+        runtime_config_module.set("global_paused", not first["global_paused"])
+        second = self.client.get(f"/api/status/delta?etag={first['etag']}").get_json()
+
+        self.assertTrue(second["changed"])
+        self.assertNotEqual(second["etag"], first["etag"])
+
+    def test_status_etag_hashes_the_compact_encoding_in_insertion_order(self):
+        payload = {"paused": False, "bots": [1, 2]}
+
+        # sha256(b'{"paused":false,"bots":[1,2]}')[:16]
+        self.assertEqual(dashboard_module._build_status_etag(payload), "a4a08fa7fd338114")
+        self.assertNotEqual(
+            dashboard_module._build_status_etag({"bots": [1, 2], "paused": False}),
+            dashboard_module._build_status_etag(payload),
+        )
+
+    def test_logs_api_and_pages_answer_unchanged_polls_with_304(self):
+        logger_module.info("First entry", component="routing", event="first")
+        first = self.client.get("/api/logs")
+        repeat = self.client.get("/api/logs", headers={"If-None-Match": first.headers["ETag"]})
+        logger_module.info("Second entry", component="routing", event="second")
+        changed = self.client.get("/api/logs", headers={"If-None-Match": first.headers["ETag"]})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual(repeat.get_data(), b"")
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["ETag"], first.headers["ETag"])
+
+        for path in ("/logs", "/channels"):
+            with self.subTest(path=path):
+                page = self.client.get(path)
+                again = self.client.get(path, headers={"If-None-Match": page.headers["ETag"]})
+                self.assertEqual(page.status_code, 200)
+                self.assertEqual(again.status_code, 304)
+
     def test_logs_delta_returns_appended_entries_and_reset_after_clear(self):
         logger_module.info("First entry", component="routing", event="first", req_id="abc123")
         first = self.client.get("/api/logs/delta?after=0").get_json()
@@ -647,6 +1022,19 @@ class DashboardPerformanceApiTests(MemorySandboxMixin, unittest.TestCase):
         self.assertTrue(reset["reset"])
         self.assertEqual(reset["entries"], [])
 
+    def test_logs_delta_idle_cursor_revalidates_to_304(self):
+        for message in ("One", "Two", "Three"):
+            logger_module.info(message)
+        cursor = logger_module.get_logs_after(0)["cursor"]
+
+        tail = self.client.get(f"/api/logs/delta?after={cursor - 1}").get_json()
+        idle = self.client.get(f"/api/logs/delta?after={cursor}")
+        again = self.client.get(f"/api/logs/delta?after={cursor}", headers={"If-None-Match": idle.headers["ETag"]})
+
+        self.assertEqual([entry["message"] for entry in tail["entries"]], ["Three"])
+        self.assertEqual(idle.get_json()["entries"], [])
+        self.assertEqual(again.status_code, 304)
+
     def test_logs_delta_filters_structured_fields(self):
         logger_module.info("Routing entry", component="routing", event="message_received", req_id="route1")
         logger_module.info("Provider entry", component="provider", event="provider_response", req_id="prov1")
@@ -657,6 +1045,23 @@ class DashboardPerformanceApiTests(MemorySandboxMixin, unittest.TestCase):
         self.assertEqual([entry["message"] for entry in by_component["entries"]], ["Provider entry"])
         self.assertEqual([entry["message"] for entry in by_req["entries"]], ["Routing entry"])
 
+    def test_logs_api_reuses_payload_until_buffer_changes(self):
+        logger_module.info("Cached entry", component="routing")
+
+        with patch.object(logger_module, "get_logs", wraps=logger_module.get_logs) as get_logs:
+            first = self.client.get("/api/logs?component=routing")
+            repeat = self.client.get("/api/logs?component=routing")
+            self.assertEqual(get_logs.call_count, 1)
+
+            logger_module.info("Fresh entry", component="routing")
+            changed = self.client.get("/api/logs?component=routing")
+            since = self.client.get("/api/logs/delta?since=0&component=routing").get_json()
+
+        self.assertEqual(get_logs.call_count, 2)
+        self.assertEqual(first.get_data(), repeat.get_data())
+        self.assertEqual([entry["message"] for entry in changed.get_json()][-2:], ["Cached entry", "Fresh entry"])
+        self.assertEqual(len(since["entries"]), len(changed.get_json()))
+
     def test_contexts_delta_uses_revision_counter(self):
         unchanged = self.client.get("/api/contexts/delta?revision=0").get_json()
         runtime_config_module.store_last_context("Nahida", "System prompt", [{"role": "user", "content": "Hello"}], 42)
@@ -854,27 +1259,94 @@ class DashboardPerformanceApiTests(MemorySandboxMixin, unittest.TestCase):
             [{"name": "v2.2.4"}, {"name": "not-a-release"}, {"name": "v2.1.0"}],
         ]
 
-        class FakeResponse:
-            def __init__(self, payload):
-                self.payload = payload
+        client = Mock()
+        client.get.side_effect = [
+            types.SimpleNamespace(status_code=200, content=json.dumps(payload).encode())
+            for payload in responses
+        ]
 
-            def __enter__(self):
-                return self
+        with patch.object(dashboard_module, "_get_github_repo_info", return_value=("owner", "repo")), \
+                patch.object(dashboard_module.json_codec, "loads", wraps=dashboard_module.json_codec.loads) as loads, \
+                patch.object(dashboard_module, "_github_http_client", client):
+            latest = dashboard_module._fetch_github_latest_version()
 
-            def __exit__(self, exc_type, exc, tb):
-                return False
+        self.assertEqual(latest, "2.2.4")
+        self.assertTrue(all(isinstance(call.args[0], bytes) for call in loads.call_args_list))
+        self.assertEqual(
+            [call.args[0] for call in client.get.call_args_list],
+            [
+                "https://api.github.com/repos/owner/repo/releases/latest",
+                "https://api.github.com/repos/owner/repo/tags",
+            ],
+        )
 
-            def read(self):
-                return json.dumps(self.payload).encode()
+    def test_github_latest_version_skips_failed_lookups(self):
+        client = Mock()
+        client.get.side_effect = [
+            types.SimpleNamespace(status_code=404, content=b'{"message": "Not Found"}'),
+            OSError("reset"),
+        ]
 
-        urlopen = Mock(side_effect=[FakeResponse(payload) for payload in responses])
+        with patch.object(dashboard_module, "_get_github_repo_info", return_value=("owner", "repo")), \
+                patch.object(dashboard_module, "_github_http_client", client):
+            self.assertIsNone(dashboard_module._fetch_github_latest_version())
+
+        self.assertEqual(client.get.call_count, 2)
+
+    def test_github_lookups_share_one_redirect_following_client(self):
+        fake_httpx = types.ModuleType("httpx")
+        fake_httpx.Client = Mock()
+        fake_httpx.Client.return_value.get.return_value = types.SimpleNamespace(
+            status_code=200, content=b'{"tag_name": "v2.2.3"}'
+        )
 
         with patch.object(dashboard_module, "_get_github_repo_info", return_value=("owner", "repo")), \
-                patch("urllib.request.urlopen", urlopen):
-            latest = dashboard_module._fetch_github_latest_version()
+                patch.dict("sys.modules", {"httpx": fake_httpx}), \
+                patch.object(dashboard_module, "_github_http_client", None):
+            dashboard_module._fetch_github_latest_version()
+            dashboard_module._fetch_github_latest_version()
 
-        self.assertEqual(latest, "2.2.4")
-        self.assertEqual(urlopen.call_count, 2)
+        fake_httpx.Client.assert_called_once_with(
+            follow_redirects=True, headers={"User-Agent": "Discord-Pals"}, timeout=5
+        )
+        self.assertEqual(fake_httpx.Client.return_value.get.call_count, 4)
+
+    def test_compare_versions_uses_cached_semantic_keys(self):
+        dashboard_module._version_key.cache_clear()
+        cases = [("v2.10.0", "2.9.9", 1), ("2.2.3", "v2.2.3", 0), ("1.0.0", "1.0.1", -1), ("2.2", "1.0.0", 0), (None, "1.0.0", 0)]
+
+        for v1, v2, expected in cases:
+            with self.subTest(v1=v1, v2=v2):
+                self.assertEqual(dashboard_module._compare_versions(v1, v2), expected)
+        dashboard_module._compare_versions("v2.10.0", "2.9.9")
+
+        self.assertGreater(dashboard_module._version_key.cache_info().hits, 0)
+        self.assertEqual(max(["2.9.9", "2.10.0", "2.2.30"], key=dashboard_module._version_key), "2.10.0")
+
+    def test_repo_info_runs_git_once_after_a_successful_lookup(self):
+        failed = types.SimpleNamespace(returncode=1, stdout="")
+        found = types.SimpleNamespace(returncode=0, stdout="git@github.com:owner/repo.git\n")
+
+        with patch.dict(dashboard_module._github_repo_info_cache, {"value": None}), \
+                patch.object(dashboard_module.subprocess, "run", side_effect=[failed, found]) as run:
+            results = [dashboard_module._get_github_repo_info() for _ in range(3)]
+
+        self.assertEqual(results, [(None, None), ("owner", "repo"), ("owner", "repo")])
+        self.assertEqual(run.call_count, 2)
+
+    def test_file_version_rereads_version_file_only_after_it_changes(self):
+        version_file = self.data_dir / "version.py"
+        version_file.write_text('__version__ = "1.2.3"\n', encoding="utf-8")
+
+        with patch.object(dashboard_module, "_VERSION_FILE", version_file), \
+                patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read_text:
+            first = dashboard_module._get_file_version()
+            second = dashboard_module._get_file_version()
+            version_file.write_text('__version__ = "1.2.40"\n', encoding="utf-8")
+            third = dashboard_module._get_file_version()
+
+        self.assertEqual((first, second, third), ("1.2.3", "1.2.3", "1.2.40"))
+        self.assertEqual(read_text.call_count, 2)
 
     def test_latest_available_version_uses_remote_tags_when_github_tags_lag(self):
         with patch.object(dashboard_module, "_fetch_github_latest_version", return_value="2.2.4"), \
@@ -1176,6 +1648,71 @@ class DashboardPerformanceApiTests(MemorySandboxMixin, unittest.TestCase):
         self.assertEqual(entries[0]["status"], "ok")
         self.assertEqual(entries[0]["from_version"], "2.2.9")
 
+    def test_format_elapsed_picks_first_matching_unit_bucket(self):
+        self.assertEqual(dashboard_module._format_elapsed(None), "Never")
+        self.assertEqual(dashboard_module._format_elapsed(59.9), "59s ago")
+        self.assertEqual(dashboard_module._format_elapsed(60), "1m ago")
+        self.assertEqual(dashboard_module._format_elapsed(3599), "59m ago")
+        self.assertEqual(dashboard_module._format_elapsed(7200), "2h ago")
+        self.assertEqual(dashboard_module._format_activity_time(None), "Never")
+        self.assertEqual(dashboard_module._format_activity_time(1000.0, now=1125.0), "2m ago")
+
+    def test_autonomous_channel_snapshot_is_reused_within_one_request(self):
+        manager = discord_utils_module.autonomous_manager
+        with patch.object(manager, "enabled_channels", {10: 0.2}):
+            with dashboard_module.app.test_request_context("/"):
+                first = dashboard_module._autonomous_channels_snapshot()
+                manager.enabled_channels[20] = 0.5
+                second = dashboard_module._autonomous_channels_snapshot()
+
+            with dashboard_module.app.test_request_context("/"):
+                fresh = dashboard_module._autonomous_channels_snapshot()
+
+        self.assertIs(first, second)
+        self.assertEqual(first, {10: 0.2})
+        self.assertEqual(fresh, {10: 0.2, 20: 0.5})
+
+    def test_config_page_checks_bot_readiness_once_per_bot(self):
+        dashboard_module._get_visible_topology()
+        with patch.object(dashboard_module, "_is_bot_ready", wraps=dashboard_module._is_bot_ready) as ready:
+            response = self.client.get("/config")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(ready.call_count, len(dashboard_module.bot_instances))
+        self.assertEqual(dashboard_module._bot_summary(dashboard_module.bot_instances[0])["online"], True)
+
+
+class SafePathTests(unittest.TestCase):
+    def test_plain_names_take_fast_path_with_same_result(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            with patch.object(security_module, "safe_filename", wraps=security_module.safe_filename) as sanitize:
+                fast = security_module.safe_path(base, "user_123-abc", "json")
+                sanitize.assert_not_called()
+                slow = security_module.safe_path(base, "user 123.txt", ".json")
+                sanitize.assert_called_once()
+
+        self.assertEqual(fast, base.resolve() / "user_123-abc.json")
+        self.assertEqual(slow, base.resolve() / "user 123.json")
+
+    def test_unsafe_names_still_use_full_validation(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            self.assertEqual(security_module.safe_path(base, "../escape", ".md"), base.resolve() / "escape.md")
+            self.assertEqual(security_module.safe_path(base, "a" * 65, ".md"), base.resolve() / f"{'a' * 65}.md")
+            with self.assertRaises(ValueError):
+                security_module.safe_path(base, "", ".md")
+
+    def test_plain_names_still_reject_symlinks_out_of_base(self):
+        with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as outside:
+            base = Path(tmpdir)
+            try:
+                (base / "leak.md").symlink_to(Path(outside) / "secret.md")
+            except (OSError, NotImplementedError):
+                self.skipTest("symlinks unavailable")
+            with self.assertRaisesRegex(ValueError, "Path traversal detected"):
+                security_module.safe_path(base, "leak", ".md")
+
 
 class HistoryPersistenceTests(unittest.TestCase):
     def setUp(self):
@@ -1251,7 +1788,9 @@ class HistoryPersistenceTests(unittest.TestCase):
 
         self.assertTrue(self._channel_file(123).exists())
         self.assertTrue(self._channel_file(456).exists())
-        migrated = json.loads(self._channel_file(123).read_text(encoding="utf-8"))
+        migrated_text = self._channel_file(123).read_text(encoding="utf-8")
+        migrated = json.loads(migrated_text)
+        self.assertNotIn("\n", migrated_text)
         self.assertEqual(migrated["name"], "tea-room")
         self.assertIn("last_activity", migrated)
         self.assertTrue(Path(discord_utils_module.HISTORY_CACHE_FILE).exists())
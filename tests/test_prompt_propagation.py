@@ -1,16 +1,19 @@
 import json
 import os
+import sys
 import tempfile
+import time
 import types
 import unittest
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from unittest.mock import AsyncMock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import module_stubs  # noqa: F401
 import bot_instance as bot_instance_module
 import character as character_module
 import dashboard as dashboard_module
+import dashboard_provider_health
 import discord_utils as discord_utils_module
 import providers as providers_module
 import response_access as response_access_module
@@ -132,6 +135,28 @@ class PromptPropagationTests(unittest.TestCase):
         self.assertIn("[Time gap: 1 day, 30 minutes later]", immediate[1]["content"])
         self.assertIn("Alice: Back again", immediate[1]["content"])
 
+    def test_format_history_split_parses_each_timestamp_once(self):
+        channel_id = 790
+        discord_utils_module.conversation_history[channel_id] = [
+            {"role": "user", "content": "Hi", "author": "Alice", "timestamp": "2026-03-31T09:00:00+00:00"},
+            {"role": "user", "content": "Hey", "author": "Bob", "timestamp": "2026-03-31T09:05:00+00:00"},
+            {"role": "user", "content": "Back", "author": "Alice", "timestamp": "2026-04-01T09:30:00+00:00"},
+        ]
+
+        with patch.object(
+            discord_utils_module,
+            "_parse_history_timestamp",
+            wraps=discord_utils_module._parse_history_timestamp,
+        ) as parse_timestamp:
+            discord_utils_module.format_history_split(
+                channel_id,
+                total_limit=10,
+                immediate_count=10,
+                current_bot_name="Nahida"
+            )
+
+        self.assertEqual(parse_timestamp.call_count, 3)
+
     def test_time_passage_signal_uses_recent_large_gap(self):
         history = [
             {
@@ -401,6 +426,111 @@ class TimePlaceholderTests(unittest.TestCase):
 
         self.assertEqual(rendered, "@Febs WaWa hey")
 
+    def test_process_outgoing_mentions_reuses_alias_patterns_and_strips_stray_ids(self):
+        users = [{
+            "name": "Febs WaWa",
+            "user_id": 10,
+            "mention_syntax": "<@10>",
+            "aliases": ["Febs WaWa"],
+            "priority": 0,
+        }]
+        discord_utils_module._mention_name_pattern.cache_clear()
+
+        for _ in range(2):
+            rendered = discord_utils_module.process_outgoing_mentions(
+                "@febs  wawa hi <@99> <#5>", mentionable_users=users
+            )
+
+        self.assertEqual(rendered, "<@10> hi  ")
+        self.assertEqual(discord_utils_module._mention_name_pattern.cache_info().misses, 1)
+
+    def test_convert_emojis_in_text_converts_cached_names_and_drops_broken_tags(self):
+        guild = types.SimpleNamespace(id=4242)
+        emoji = types.SimpleNamespace(name="wave", id=123456789012345678, animated=False)
+        with patch.dict(discord_utils_module._emoji_cache, {4242: {"wave": emoji}}):
+            converted = discord_utils_module.convert_emojis_in_text("hi :wave: :nope: <:x:12 ok <>", guild)
+            plain = discord_utils_module.convert_emojis_in_text("plain  reply , done", guild)
+
+        self.assertEqual(converted, "hi <:wave:123456789012345678>:nope: ok")
+        self.assertEqual(plain, "plain reply, done")
+
+    def test_get_guild_emojis_reuses_list_until_guild_emojis_are_replaced(self):
+        wave = types.SimpleNamespace(name="wave", id=1, animated=False)
+        guild = types.SimpleNamespace(id=4343, emojis=(wave,))
+        self.addCleanup(discord_utils_module._emoji_cache.pop, guild.id, None)
+        self.addCleanup(discord_utils_module._emoji_prompt_cache.pop, guild.id, None)
+
+        first = discord_utils_module.get_guild_emojis(guild)
+        name_map = discord_utils_module._emoji_cache[guild.id]
+        self.assertIs(discord_utils_module.get_guild_emojis(guild), first)
+        self.assertIs(discord_utils_module._emoji_cache[guild.id], name_map)
+
+        guild.emojis = (wave, types.SimpleNamespace(name="nod", id=2, animated=False))
+        self.assertEqual(discord_utils_module.get_guild_emojis(guild), ":wave:, :nod:")
+        self.assertIn("nod", discord_utils_module._emoji_cache[guild.id])
+
+    def test_update_history_on_edit_targets_the_edited_message_id(self):
+        channel_id = 997
+        discord_utils_module.conversation_history[channel_id] = [
+            {"role": "user", "content": "hi", "message_id": 1},
+            {"role": "user", "content": "hi", "message_id": 2},
+            {"role": "user", "content": "legacy hi"},
+        ]
+        self.addCleanup(discord_utils_module.conversation_history.pop, channel_id, None)
+        self.addCleanup(discord_utils_module._recent_message_hashes.pop, channel_id, None)
+
+        with patch.object(discord_utils_module, "save_history"):
+            discord_utils_module.update_history_on_edit(channel_id, "hi", "hello", message_id=1)
+            discord_utils_module.update_history_on_edit(channel_id, "hi", "hey", message_id=99)
+            discord_utils_module.update_history_on_edit(channel_id, "legacy hi", "legacy yo")
+
+        self.assertEqual(
+            [msg["content"] for msg in discord_utils_module.conversation_history[channel_id]],
+            ["hello", "hi", "legacy yo"],
+        )
+
+    def test_update_history_on_edit_keeps_ooc_comments_out_of_history(self):
+        channel_id = 996
+        self.addCleanup(discord_utils_module.conversation_history.pop, channel_id, None)
+        self.addCleanup(discord_utils_module._recent_message_hashes.pop, channel_id, None)
+
+        with patch.object(discord_utils_module, "save_history"):
+            discord_utils_module.add_to_history(
+                channel_id, "user", "hi there // secret note", author_name="Alice", message_id=5
+            )
+            discord_utils_module.update_history_on_edit(
+                channel_id, "hi there // secret note", "hi there! // secret note", message_id=5
+            )
+            discord_utils_module.add_to_history(channel_id, "user", "plain", author_name="Alice", message_id=6)
+            discord_utils_module.update_history_on_edit(channel_id, "plain", "plain // aside", message_id=6)
+
+        self.assertEqual(
+            [msg["content"] for msg in discord_utils_module.conversation_history[channel_id]],
+            ["hi there", "plain"],
+        )
+
+    def test_split_message_packs_paragraphs_and_breaks_long_runs_at_whitespace(self):
+        split = discord_utils_module.split_message
+
+        self.assertEqual(split("short", 10), ["short"])
+        self.assertEqual(split("aaaa\n\nbbbb\n\ncccc", 10), ["aaaa\n\nbbbb", "cccc"])
+        self.assertEqual(split("one two three four", 9), ["one two", "three", "four"])
+        self.assertEqual(split("x" * 12, 5), ["xxxxx", "xxxxx", "xx"])
+
+    def test_store_multipart_response_evicts_oldest_per_channel_and_globally(self):
+        with patch.dict(discord_utils_module.multipart_responses, clear=True), \
+                patch.object(discord_utils_module, "_multipart_order", discord_utils_module.OrderedDict()), \
+                patch.object(discord_utils_module, "_MULTIPART_MAX_PER_CHANNEL", 3), \
+                patch.object(discord_utils_module, "_MULTIPART_MAX_GLOBAL", 4):
+            discord_utils_module.store_multipart_response(1, [10, 11], "first")
+            discord_utils_module.store_multipart_response(1, [12, 13], "second")
+            discord_utils_module.store_multipart_response(2, [20, 21], "third")
+            stored = {channel: dict(msgs) for channel, msgs in discord_utils_module.multipart_responses.items()}
+            order = list(discord_utils_module._multipart_order)
+
+        self.assertEqual(stored, {1: {12: "second", 13: "second"}, 2: {20: "third", 21: "third"}})
+        self.assertEqual(order, [(1, 12), (1, 13), (2, 20), (2, 21)])
+
     def test_add_to_history_persists_timestamp_metadata(self):
         channel_id = 999
         with patch.object(discord_utils_module, "save_history"):
@@ -415,6 +545,34 @@ class TimePlaceholderTests(unittest.TestCase):
         stored = discord_utils_module.conversation_history[channel_id][0]
         self.assertEqual(stored["timestamp"], "2026-04-01T10:15:30+00:00")
 
+    def test_add_to_history_trims_at_cap_without_replacing_the_list(self):
+        channel_id = 998
+        self.addCleanup(discord_utils_module.conversation_history.pop, channel_id, None)
+        self.addCleanup(discord_utils_module._recent_message_hashes.pop, channel_id, None)
+        with patch.object(discord_utils_module, "save_history"), \
+                patch.object(discord_utils_module, "MAX_HISTORY_MESSAGES", 3):
+            discord_utils_module.add_to_history(channel_id, "user", "m0", author_name="Alice")
+            history = discord_utils_module.get_history(channel_id)
+            for index in range(1, 5):
+                discord_utils_module.add_to_history(channel_id, "user", f"m{index}", author_name="Alice")
+
+        self.assertIs(discord_utils_module.get_history(channel_id), history)
+        self.assertEqual([msg["content"] for msg in history], ["m2", "m3", "m4"])
+
+    def test_get_active_users_returns_recent_unique_human_authors(self):
+        channel_id = 997
+        self.addCleanup(discord_utils_module.conversation_history.pop, channel_id, None)
+        discord_utils_module.conversation_history[channel_id] = [
+            {"role": "user", "author": "Old", "content": "hi"},
+            {"role": "user", "author": "Alice", "content": "hello"},
+            {"role": "assistant", "author": "Bot", "content": "hey"},
+            {"role": "user", "author": "Alice", "content": "again"},
+            {"role": "user", "author": "Bob", "content": "yo"},
+        ]
+
+        self.assertEqual(discord_utils_module.get_active_users(channel_id, limit=4), frozenset({"Alice", "Bob"}))
+        self.assertEqual(discord_utils_module.get_active_users(12345), frozenset())
+
 
 class ConfigPropagationTests(MemorySandboxMixin, unittest.TestCase):
     def setUp(self):
@@ -649,6 +807,36 @@ class ConfigPropagationTests(MemorySandboxMixin, unittest.TestCase):
         self.assertEqual(provider["output_config"], {"effort": "medium"})
         self.assertEqual(provider["thinking"], {"type": "adaptive", "effort": "low"})
 
+    def test_character_provider_api_skips_save_when_preference_is_unchanged(self):
+        current = {"providers": [], "character_providers": {"nahida": "primary"}}
+
+        with patch.object(dashboard_module.app_config, "PROVIDERS", {"primary": {}, "backup": {}}), \
+             patch.object(dashboard_module, "_load_providers_json", side_effect=lambda: json.loads(json.dumps(current))), \
+             patch.object(dashboard_module, "_save_providers_json") as save:
+            unchanged = self.client.post(
+                "/api/character-provider",
+                json={"character": "nahida", "tier": "primary"},
+                headers=self.csrf_headers(),
+            )
+            cleared_missing = self.client.post(
+                "/api/character-provider",
+                json={"character": "nilou", "tier": ""},
+                headers=self.csrf_headers(),
+            )
+            save.assert_not_called()
+
+            changed = self.client.post(
+                "/api/character-provider",
+                json={"character": "nahida", "tier": "backup"},
+                headers=self.csrf_headers(),
+            )
+
+        self.assertEqual(unchanged.status_code, 200)
+        self.assertEqual(cleared_missing.status_code, 200)
+        self.assertEqual(changed.status_code, 200)
+        save.assert_called_once()
+        self.assertEqual(save.call_args.args[0]["character_providers"], {"nahida": "backup"})
+
     def test_provider_save_api_rejects_malformed_provider_payloads(self):
         malformed_payloads = [
             {"providers": "primary"},
@@ -827,10 +1015,12 @@ class ConfigPropagationTests(MemorySandboxMixin, unittest.TestCase):
                 "supports_vision": True,
             }]
         }
-        fake_path = types.SimpleNamespace(exists=lambda: True)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        providers_file = Path(temp_dir.name) / "providers.json"
+        providers_file.write_text(json.dumps(providers_payload), encoding="utf-8")
 
-        with patch.object(dashboard_module, "Path", return_value=fake_path), \
-                patch("builtins.open", mock_open(read_data=json.dumps(providers_payload))), \
+        with patch.object(dashboard_module, "PROVIDERS_FILE", providers_file), \
                 patch.dict(dashboard_module.os.environ, {"ENDPOINT_API_KEY": "sk-test"}):
             response = self.client.get("/api/test-provider/0")
 
@@ -851,10 +1041,12 @@ class ConfigPropagationTests(MemorySandboxMixin, unittest.TestCase):
                 "model": "gpt-5.5",
             }]
         }
-        fake_path = types.SimpleNamespace(exists=lambda: True)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        providers_file = Path(temp_dir.name) / "providers.json"
+        providers_file.write_text(json.dumps(providers_payload), encoding="utf-8")
 
-        with patch.object(dashboard_module, "Path", return_value=fake_path), \
-                patch("builtins.open", mock_open(read_data=json.dumps(providers_payload))), \
+        with patch.object(dashboard_module, "PROVIDERS_FILE", providers_file), \
                 patch.dict(dashboard_module.os.environ, {}, clear=True):
             response = self.client.get("/api/test-provider/0")
 
@@ -863,6 +1055,62 @@ class ConfigPropagationTests(MemorySandboxMixin, unittest.TestCase):
         self.assertFalse(body["success"])
         self.assertIn("API key", body["error"])
 
+    def test_openai_provider_health_check_reuses_client_per_url_and_key(self):
+        providers_payload = {"providers": [{"name": "Local", "url": "http://localhost:5000/v1", "model": "m"}]}
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        providers_file = Path(temp_dir.name) / "providers.json"
+        providers_file.write_text(json.dumps(providers_payload), encoding="utf-8")
+        fake_openai = types.SimpleNamespace(OpenAI=MagicMock())
+
+        with patch.object(dashboard_module, "PROVIDERS_FILE", providers_file), \
+                patch.dict(sys.modules, {"openai": fake_openai}), \
+                patch.dict(dashboard_provider_health._models_clients, {}, clear=True), \
+                patch.dict(dashboard_provider_health._models_check_ok, {}, clear=True):
+            first = self.client.get("/api/test-provider/0").get_json()
+            dashboard_provider_health._models_check_ok.clear()
+            second = self.client.get("/api/test-provider/0").get_json()
+
+        self.assertTrue(first["success"])
+        self.assertTrue(second["success"])
+        fake_openai.OpenAI.assert_called_once_with(
+            base_url="http://localhost:5000/v1", api_key="not-needed", timeout=10
+        )
+        self.assertEqual(fake_openai.OpenAI.return_value.models.list.call_count, 2)
+
+    def test_openai_provider_health_check_reuses_recent_success_but_not_failures(self):
+        client = MagicMock()
+        client.models.list.side_effect = [OSError("refused"), None, None]
+
+        with patch.object(dashboard_provider_health, "models_client", return_value=client), \
+                patch.dict(dashboard_provider_health._models_check_ok, {}, clear=True):
+            with self.assertRaises(OSError):
+                dashboard_provider_health.check_models_endpoint("http://localhost:5000/v1", "k")
+            dashboard_provider_health.check_models_endpoint("http://localhost:5000/v1", "k")
+            dashboard_provider_health.check_models_endpoint("http://localhost:5000/v1", "k")
+            self.assertEqual(client.models.list.call_count, 2)
+
+            with patch.object(dashboard_provider_health.time, "monotonic", return_value=time.monotonic() + 31):
+                dashboard_provider_health.check_models_endpoint("http://localhost:5000/v1", "k")
+
+        self.assertEqual(client.models.list.call_count, 3)
+
+    def test_models_check_lock_eviction_keeps_locks_that_are_in_use(self):
+        busy_key = ("http://busy/v1", "k")
+        busy = [dashboard_provider_health.threading.Lock(), 1]
+        idle = {(f"http://idle-{index}/v1", "k"): [dashboard_provider_health.threading.Lock(), 0] for index in range(20)}
+        client = MagicMock()
+
+        with patch.object(dashboard_provider_health, "models_client", return_value=client), \
+                patch.dict(dashboard_provider_health._models_check_ok, {}, clear=True), \
+                patch.dict(dashboard_provider_health._models_check_locks, {busy_key: busy, **idle}, clear=True):
+            dashboard_provider_health.check_models_endpoint("http://new/v1", "k")
+            locks = dict(dashboard_provider_health._models_check_locks)
+
+        self.assertIs(locks[busy_key], busy)
+        self.assertEqual(set(locks), {busy_key, ("http://new/v1", "k")})
+        self.assertEqual(locks[("http://new/v1", "k")][1], 0)
+
     def test_known_access_targets_include_channels_and_human_aliases(self):
         original_history = discord_utils_module.conversation_history
         original_channel_names = discord_utils_module.channel_names
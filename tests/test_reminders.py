@@ -285,6 +285,7 @@ class ReminderTimezoneAndDashboardTests(MemorySandboxMixin, unittest.TestCase):
             "_get_visible_topology",
             return_value={
                 "guilds": [{"id": 123, "name": "Febs' Bruary"}],
+                "guild_names": {123: "Febs' Bruary"},
                 "channels": [],
                 "channels_by_id": {},
                 "accessible_channel_ids": set(),
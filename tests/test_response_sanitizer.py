@@ -70,6 +70,11 @@ class ResponseSanitizerTests(unittest.TestCase):
 
         self.assertEqual(cleaned, "You're incorrigible, you know that?")
 
+    def test_clean_em_dashes_handles_mid_sentence_and_trailing_dashes(self):
+        self.assertEqual(sanitizer.clean_em_dashes("wait — what"), "wait, what")
+        self.assertEqual(sanitizer.clean_em_dashes("and then— \n"), "and then-")
+        self.assertEqual(sanitizer.clean_em_dashes("no dashes here "), "no dashes here ")
+
     def test_strip_discord_ooc_comments_hides_inline_note(self):
         cleaned = sanitizer.strip_discord_ooc_comments(
             "Yeah Kaveh, it sure is //Intentional, how do I check attribution"
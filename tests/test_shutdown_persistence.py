@@ -1,8 +1,12 @@
+import os
 import signal
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 import module_stubs  # noqa: F401
+import env_config
 import main as main_module
 
 
@@ -52,5 +56,25 @@ class ShutdownSignalTests(unittest.TestCase):
             signal.signal(signal.SIGTERM, original)
 
 
+class BotConfigLoadingTests(unittest.TestCase):
+    def test_non_ascii_nicknames_written_by_the_dashboard_load_intact(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_config.write_bots_json_payload(
+                {"bots": [{"name": "Zoë", "token_env": "ZOE_TOKEN", "character": "zoë", "nicknames": "zoë, ズィー"}]},
+                Path(tmpdir) / "bots.json",
+            )
+            os.chdir(tmpdir)
+            try:
+                with patch.dict(os.environ, {"ZOE_TOKEN": "token-value"}), \
+                     patch.object(main_module.log, "register_secret"):
+                    bots = main_module.load_bot_configs()
+            finally:
+                os.chdir(cwd)
+
+        self.assertEqual(bots[0]["name"], "Zoë")
+        self.assertEqual(bots[0]["nicknames"], "zoë, ズィー")
+
+
 if __name__ == "__main__":
     unittest.main()